@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
 import time
 from typing import Any
 
@@ -12,6 +14,47 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_JIRA_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# JiraClient is instantiated per operation all over the codebase; sharing one
+# pooled, thread-safe httpx.Client lets every call reuse kept-alive TLS
+# connections instead of handshaking each time. The holder is keyed by a digest
+# of the credentials so a rotated token replaces (and closes) the old client.
+_shared_client: httpx.Client | None = None
+_shared_client_key: tuple[str, float] | None = None
+_shared_client_lock = threading.Lock()
+
+
+def _credentials_digest(email: str, api_token: str) -> str:
+    return hashlib.sha256(f"{email}\0{api_token}".encode("utf-8")).hexdigest()
+
+
+def _shared_http_client(email: str, api_token: str, timeout: float) -> httpx.Client:
+    global _shared_client, _shared_client_key
+    key = (_credentials_digest(email, api_token), timeout)
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client_key != key:
+            previous = _shared_client
+            _shared_client = httpx.Client(
+                timeout=timeout,
+                auth=(email, api_token),
+                headers={"Accept": "application/json"},
+                limits=_JIRA_POOL_LIMITS,
+            )
+            _shared_client_key = key
+            if previous is not None:
+                previous.close()
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the pooled Jira HTTP client; the next request opens a new one."""
+    global _shared_client, _shared_client_key
+    with _shared_client_lock:
+        client, _shared_client, _shared_client_key = _shared_client, None, None
+    if client is not None:
+        client.close()
+
 
 class JiraClient:
     def __init__(self) -> None:
@@ -24,80 +67,71 @@ class JiraClient:
         self.timeout = 25.0
         self.max_retries = 3
 
+    def _http_client(self) -> httpx.Client:
+        return _shared_http_client(self.email, self.api_token, self.timeout)
+
     def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
         url = f"{self.base_url}{path}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.request(method, url, **kwargs)
-                    if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                        time.sleep(backoff)
-                        backoff *= 2
-                        continue
-                    response.raise_for_status()
-                    data = response.json()
-                    return data if isinstance(data, dict) else {}
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.request(method, url, **kwargs)
+                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
                     time.sleep(backoff)
                     backoff *= 2
+                    continue
+                response.raise_for_status()
+                data = response.json()
+                return data if isinstance(data, dict) else {}
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
         return {}
 
     def _request_list(self, method: str, path: str, **kwargs: Any) -> list[dict[str, Any]]:
         url = f"{self.base_url}{path}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.request(method, url, **kwargs)
-                    if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                        time.sleep(backoff)
-                        backoff *= 2
-                        continue
-                    response.raise_for_status()
-                    data = response.json()
-                    if isinstance(data, list):
-                        return [item for item in data if isinstance(item, dict)]
-                    return []
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.request(method, url, **kwargs)
+                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
                     time.sleep(backoff)
                     backoff *= 2
+                    continue
+                response.raise_for_status()
+                data = response.json()
+                if isinstance(data, list):
+                    return [item for item in data if isinstance(item, dict)]
+                return []
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
         return []
 
     def _request_empty(self, method: str, path: str, **kwargs: Any) -> bool:
         url = f"{self.base_url}{path}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.request(method, url, **kwargs)
-                    if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                        time.sleep(backoff)
-                        backoff *= 2
-                        continue
-                    response.raise_for_status()
-                    return True
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.request(method, url, **kwargs)
+                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
                     time.sleep(backoff)
                     backoff *= 2
+                    continue
+                response.raise_for_status()
+                return True
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
         return False
 
     def get_issue(self, issue_key: str, *, fields: str) -> dict[str, Any]:
@@ -163,37 +197,33 @@ class JiraClient:
 
         url = f"{self.base_url}{self._build_issue_sla_path(key)}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=30.0,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.get(url)
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {401, 403, 404}:
-                    logger.warning(
-                        "Jira SLA endpoint unavailable for %s (status=%s). Returning empty payload.",
-                        key,
-                        response.status_code,
-                    )
-                    return {}
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                data = response.json()
-                return data if isinstance(data, dict) else {}
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.get(url, timeout=30.0)
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {401, 403, 404}:
+                logger.warning(
+                    "Jira SLA endpoint unavailable for %s (status=%s). Returning empty payload.",
+                    key,
+                    response.status_code,
+                )
+                return {}
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            data = response.json()
+            return data if isinstance(data, dict) else {}
 
         return {}
 
@@ -204,31 +234,27 @@ class JiraClient:
 
         url = f"{self.base_url}/rest/api/3/user/search"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.get(url, params={"query": value, "maxResults": max(1, min(max_results, 100))})
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                data = response.json()
-                if isinstance(data, list):
-                    return [item for item in data if isinstance(item, dict)]
-                return []
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.get(url, params={"query": value, "maxResults": max(1, min(max_results, 100))})
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            data = response.json()
+            if isinstance(data, list):
+                return [item for item in data if isinstance(item, dict)]
+            return []
 
         return []
 
@@ -251,31 +277,27 @@ class JiraClient:
         if issue_key:
             params["issueKey"] = str(issue_key).strip()
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.get(url, params=params)
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                data = response.json()
-                if isinstance(data, list):
-                    return [item for item in data if isinstance(item, dict)]
-                return []
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.get(url, params=params)
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            data = response.json()
+            if isinstance(data, list):
+                return [item for item in data if isinstance(item, dict)]
+            return []
 
         return []
 
@@ -384,28 +406,24 @@ class JiraClient:
             return False
         url = f"{self.base_url}/rest/api/3/issue/{key}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.put(url, json={"fields": fields})
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                return True
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.put(url, json={"fields": fields})
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            return True
         return False
 
     def get_issue_transitions(self, issue_key: str) -> list[dict[str, Any]]:
@@ -425,28 +443,24 @@ class JiraClient:
             return False
         url = f"{self.base_url}/rest/api/3/issue/{key}/transitions"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.post(url, json={"transition": {"id": value}})
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                return True
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.post(url, json={"transition": {"id": value}})
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            return True
         return False
 
     def add_issue_comment(self, issue_key: str, body: dict[str, Any]) -> bool:
@@ -455,28 +469,24 @@ class JiraClient:
             return False
         url = f"{self.base_url}/rest/api/3/issue/{key}/comment"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.post(url, json={"body": body})
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                return True
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.post(url, json={"body": body})
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            return True
         return False
 
     def update_issue_comment(self, issue_key: str, comment_id: str, body: dict[str, Any]) -> bool:
@@ -486,28 +496,24 @@ class JiraClient:
             return False
         url = f"{self.base_url}/rest/api/3/issue/{key}/comment/{value}"
         backoff = 0.5
-        with httpx.Client(
-            timeout=self.timeout,
-            auth=(self.email, self.api_token),
-            headers={"Accept": "application/json"},
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = client.put(url, json={"body": body})
-                except httpx.HTTPError:
-                    if attempt >= self.max_retries:
-                        raise
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
-                response.raise_for_status()
-                return True
+        client = self._http_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = client.put(url, json={"body": body})
+            except httpx.HTTPError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+
+            response.raise_for_status()
+            return True
         return False
 
     def create_kb_article(
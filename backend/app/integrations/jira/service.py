@@ -593,27 +593,40 @@ def _upsert_ticket(db: Session, issue: dict[str, Any]) -> tuple[Ticket, bool]:
     resolved_ticket_type = mapped.ticket_type
     resolved_category = mapped.category
     ai_applied = False
-    needs_ai_classification = any(
-        (
-            _category_was_defaulted(issue, mapped.category),
-            _ticket_type_was_defaulted(issue, mapped.ticket_type),
-            _priority_was_defaulted(issue, mapped.priority),
-        )
-    )
+    category_defaulted = _category_was_defaulted(issue, mapped.category)
+    ticket_type_defaulted = _ticket_type_was_defaulted(issue, mapped.ticket_type)
+    priority_defaulted = _priority_was_defaulted(issue, mapped.priority)
+    needs_ai_classification = category_defaulted or ticket_type_defaulted or priority_defaulted
 
-    def resolve_classification() -> None:
+    def resolve_classification(existing: Ticket | None = None) -> None:
         nonlocal ai_priority, ai_ticket_type, ai_category, resolved_priority, resolved_ticket_type, resolved_category, ai_applied
         if not needs_ai_classification:
             return
-        ai_priority, ai_ticket_type, ai_category = _classify_inbound_ticket(
-            mapped.title, mapped.description,
-            ticket_id=str(issue.get("key") or ""),
-        )
-        if ai_category is not None and _category_was_defaulted(issue, mapped.category):
+        # Jira re-syncs the same issue on every edit; when the text the model
+        # reads is unchanged, reuse the stored predictions instead of calling it again.
+        if (
+            existing is not None
+            and existing.title == mapped.title
+            and existing.description == mapped.description
+            and (
+                existing.predicted_priority is not None
+                or existing.predicted_ticket_type is not None
+                or existing.predicted_category is not None
+            )
+        ):
+            ai_priority = existing.predicted_priority
+            ai_ticket_type = existing.predicted_ticket_type
+            ai_category = existing.predicted_category
+        else:
+            ai_priority, ai_ticket_type, ai_category = _classify_inbound_ticket(
+                mapped.title, mapped.description,
+                ticket_id=str(issue.get("key") or ""),
+            )
+        if ai_category is not None and category_defaulted:
             resolved_category = ai_category
-        if ai_ticket_type is not None and _ticket_type_was_defaulted(issue, mapped.ticket_type):
+        if ai_ticket_type is not None and ticket_type_defaulted:
             resolved_ticket_type = ai_ticket_type
-        if ai_priority is not None and _priority_was_defaulted(issue, mapped.priority):
+        if ai_priority is not None and priority_defaulted:
             resolved_priority = ai_priority
         ai_applied = ai_priority is not None or ai_ticket_type is not None or ai_category is not None
 
@@ -674,7 +687,7 @@ def _upsert_ticket(db: Session, issue: dict[str, Any]) -> tuple[Ticket, bool]:
         db.flush()
         return ticket, False
 
-    resolve_classification()
+    resolve_classification(ticket)
     previous_assignee = ticket.assignee
     reporter_user = _resolve_local_reporter_user(db, issue, mapped.reporter)
     ticket.title = mapped.title
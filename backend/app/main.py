@@ -17,6 +17,7 @@ from app.core.exceptions import ITSMGatekeeperException
 from app.core.rate_limit import install_global_rate_limit_middleware
 from app.core.security_headers import install_security_headers_middleware
 from app.integrations.jira.auto_reconcile import start_jira_auto_reconcile, stop_jira_auto_reconcile
+from app.integrations.jira.client import close_shared_client as close_jira_http_client
 from app.core import cache as _cache_module
 from app.routers import ai, assignees, auth, emails, integrations_jira, notifications, problems, recommendations, sla, tickets, translations, users
 from app.routers import search as search_router
@@ -80,6 +81,7 @@ def create_app() -> FastAPI:
                 await stop_sla_monitor()
             except Exception:  # noqa: BLE001
                 pass
+            close_jira_http_client()
 
     app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
     app.add_middleware(
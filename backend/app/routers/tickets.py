@@ -39,10 +39,11 @@ from app.services.tickets import (
     compute_problem_insights,
     compute_priority_breakdown,
     compute_type_breakdown,
-    compute_stats,
+    compute_stats_sql,
     compute_weekly_trends,
     get_ticket,
     get_ticket_for_user,
+    list_ticket_analytics_rows_for_user,
     list_ticket_history_events,
     list_tickets_for_user,
     update_ticket_triage,
@@ -145,8 +146,7 @@ def get_stats(
     hit = _cache.get(key)
     if hit is not None:
         return TicketStats(**hit)
-    tickets = list_tickets_for_user(db, current_user)
-    result = TicketStats(**compute_stats(tickets))
+    result = TicketStats(**compute_stats_sql(db, current_user))
     _cache.set(key, result.model_dump(), ttl=settings.CACHE_TTL_STATS)
     return result
 
@@ -197,7 +197,7 @@ def get_performance_metrics(
     hit = _cache.get(key)
     if hit is not None:
         return TicketPerformanceOut(**hit)
-    tickets = list_tickets_for_user(db, current_user)
+    tickets = list_ticket_analytics_rows_for_user(db, current_user)
     metrics = compute_assignment_performance(
         tickets,
         date_from=date_from,
@@ -266,7 +266,7 @@ def get_agent_performance(
     now = dt.datetime.now(dt.timezone.utc)
     since = now - dt.timedelta(days=period_days)
 
-    tickets = list_tickets_for_user(db, current_user)
+    tickets = list_ticket_analytics_rows_for_user(db, current_user)
 
     # Filter by period and optional category
     period_tickets = [
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.orm import Session
 
@@ -25,7 +27,7 @@ def get_users(db: Session = Depends(get_db)) -> list[UserOut]:
 
 @router.patch("/{user_id}/role", response_model=UserOut)
 def set_role(
-    user_id: str,
+    user_id: UUID,
     payload: UserRoleUpdate,
     request: Request,
     db: Session = Depends(get_db),
@@ -39,7 +41,7 @@ def set_role(
     except Exception as exc:  # noqa: BLE001
         raise BadRequestError("jira_role_sync_failed", details={"reason": str(exc)}) from exc
     if not user:
-        raise NotFoundError("user_not_found", details={"user_id": user_id})
+        raise NotFoundError("user_not_found", details={"user_id": str(user_id)})
     log_security_event(
         db, ROLE_CHANGED,
         user_id=user.id,
@@ -51,28 +53,28 @@ def set_role(
 
 
 @router.patch("/{user_id}/seniority", response_model=UserOut)
-def set_seniority(user_id: str, payload: UserSeniorityUpdate, db: Session = Depends(get_db)) -> UserOut:
+def set_seniority(user_id: UUID, payload: UserSeniorityUpdate, db: Session = Depends(get_db)) -> UserOut:
     user = update_seniority(db, user_id, payload.seniority_level)
     if not user:
-        raise NotFoundError("user_not_found", details={"user_id": user_id})
+        raise NotFoundError("user_not_found", details={"user_id": str(user_id)})
     return UserOut.model_validate(user)
 
 
 @router.patch("/{user_id}/specializations", response_model=UserOut)
 def set_specializations(
-    user_id: str,
+    user_id: UUID,
     payload: UserSpecializationsUpdate,
     db: Session = Depends(get_db),
 ) -> UserOut:
     user = update_specializations(db, user_id, payload.specializations)
     if not user:
-        raise NotFoundError("user_not_found", details={"user_id": user_id})
+        raise NotFoundError("user_not_found", details={"user_id": str(user_id)})
     return UserOut.model_validate(user)
 
 
 @router.post("/{user_id}/unlock", response_model=UserOut)
 def unlock_account(
-    user_id: str,
+    user_id: UUID,
     request: Request,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
@@ -80,7 +82,7 @@ def unlock_account(
     """Clear brute-force lockout for a user account. Admin only."""
     user = db.get(User, user_id)
     if not user:
-        raise NotFoundError("user_not_found", details={"user_id": user_id})
+        raise NotFoundError("user_not_found", details={"user_id": str(user_id)})
     user = unlock_user(
         db, user,
         actor_id=admin.id,
@@ -91,7 +93,7 @@ def unlock_account(
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response, response_model=None)
-def remove_user(user_id: str, db: Session = Depends(get_db)) -> Response:
+def remove_user(user_id: UUID, db: Session = Depends(get_db)) -> Response:
     if not delete_user(db, user_id):
-        raise NotFoundError("user_not_found", details={"user_id": user_id})
+        raise NotFoundError("user_not_found", details={"user_id": str(user_id)})
     return Response(status_code=status.HTTP_204_NO_CONTENT)
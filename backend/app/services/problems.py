@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
+import heapq
 import logging
 import math
 import re
-from collections import Counter, defaultdict
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Mapping
 from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 import unicodedata
 from uuid import uuid4
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Integer, cast, func
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models.enums import ProblemStatus, RecommendationImpact, RecommendationType, TicketCategory, TicketPriority, TicketStatus
 from app.models.problem import Problem
@@ -26,23 +33,27 @@ from app.services.notifications_service import (
     create_notifications_for_users,
     resolve_problem_recipients,
 )
-from app.services.tickets import select_best_assignee, update_status
-from app.services.users import list_assignees
+from app.services.tickets import RESOLVED_STATUSES, select_best_assignee, update_status_bulk
+from app.services.users import assignee_name_map
 
 logger = logging.getLogger(__name__)
 
-ACTIVE_TICKET_STATUSES = {
-    TicketStatus.open,
-    TicketStatus.in_progress,
-    TicketStatus.waiting_for_customer,
-    TicketStatus.waiting_for_support_vendor,
-    TicketStatus.pending,
-}
+ACTIVE_TICKET_STATUSES = frozenset(
+    {
+        TicketStatus.open,
+        TicketStatus.in_progress,
+        TicketStatus.waiting_for_customer,
+        TicketStatus.waiting_for_support_vendor,
+        TicketStatus.pending,
+    }
+)
+_ACTIVE_TICKET_STATUS_LIST = tuple(ACTIVE_TICKET_STATUSES)
 PROBLEM_TRIGGER_WINDOW_DAYS = 3
 PROBLEM_TRIGGER_MIN_COUNT = 5
 PROBLEM_MATCH_SCORE_THRESHOLD = 0.45
 PROBLEM_SEMANTIC_SIMILARITY_WEIGHT = 0.35
 PROBLEM_SEMANTIC_MAX_LINKED_TICKETS = 6
+DESCRIPTION_TAG_SCORE = 3
 SIMILARITY_TICKET_ID_RE = re.compile(r"\b[a-z]{1,12}-\d+\b", re.IGNORECASE)
 SIMILARITY_NOISE_TAG_PREFIXES = (
     "local_",
@@ -123,14 +134,27 @@ PERMANENT_FIX_HINTS: dict[TicketCategory, str] = {
     TicketCategory.problem: "Document RCA actions as a permanent runbook and track recurrence reduction weekly.",
 }
 
-PROBLEM_TRANSITIONS: dict[ProblemStatus, set[ProblemStatus]] = {
-    ProblemStatus.open: set(ProblemStatus),
-    ProblemStatus.investigating: set(ProblemStatus),
-    ProblemStatus.known_error: set(ProblemStatus),
-    ProblemStatus.resolved: set(ProblemStatus),
-    ProblemStatus.closed: set(ProblemStatus),
+PROBLEM_TRANSITIONS: Mapping[ProblemStatus, frozenset[ProblemStatus]] = MappingProxyType(
+    {
+        ProblemStatus.open: frozenset(ProblemStatus),
+        ProblemStatus.investigating: frozenset(ProblemStatus),
+        ProblemStatus.known_error: frozenset(ProblemStatus),
+        ProblemStatus.resolved: frozenset(ProblemStatus),
+        ProblemStatus.closed: frozenset(ProblemStatus),
+    }
+)
+
+_PRIORITY_ORDER = {
+    "critical": 4,
+    "high": 3,
+    "medium": 2,
+    "low": 1,
 }
 
+CLASSIFY_CACHE_MAX_ENTRIES = 256
+_CLASSIFY_CACHE: OrderedDict[str, tuple[TicketPriority, object, TicketCategory, tuple[str, ...]]] = OrderedDict()
+_CLASSIFY_CACHE_LOCK = threading.Lock()
+
 _semantic_embeddings_enabled: bool | None = None
 _semantic_unavailable_logged = False
 
@@ -153,27 +177,26 @@ def normalize_text(value: str | None) -> str:
 
 
 def _normalize_tokens(value: str | None) -> list[str]:
+    return list(_tokens_for(value))
+
+
+@lru_cache(maxsize=4096)
+def _tokens_for(value: str | None) -> tuple[str, ...]:
     text = normalize_text(value)
-    tokens = [token for token in text.split() if len(token) > 2 and token not in SIMILARITY_STOPWORDS]
-    return tokens
+    return tuple(token for token in text.split() if len(token) > 2 and token not in SIMILARITY_STOPWORDS)
 
 
 def _next_problem_id(db: Session) -> str:
-    ids = [row[0] for row in db.query(Problem.id).all()]
-    max_num = 0
-    for problem_id in ids:
-        match = re.search(r"(\d+)$", problem_id or "")
-        if not match:
-            continue
-        max_num = max(max_num, int(match.group(1)))
-    return f"PB-{max_num + 1:04d}"
+    # Let the database find the highest numeric suffix instead of streaming every id back.
+    max_num = db.query(func.max(cast(func.substring(Problem.id, r"(\d+)$"), Integer))).scalar()
+    return f"PB-{int(max_num or 0) + 1:04d}"
 
 
 def _next_recommendation_id(db: Session) -> str:
-    for _ in range(6):
-        candidate = f"REC-{uuid4().hex[:8].upper()}"
-        exists = db.query(Recommendation.id).filter(Recommendation.id == candidate).first()
-        if not exists:
+    candidates = [f"REC-{uuid4().hex[:8].upper()}" for _ in range(6)]
+    taken = {row[0] for row in db.query(Recommendation.id).filter(Recommendation.id.in_(candidates)).all()}
+    for candidate in candidates:
+        if candidate not in taken:
             return candidate
     return f"REC-{uuid4().hex.upper()}"
 
@@ -184,11 +207,26 @@ def compute_similarity_key(
     description: str | None = None,
     tags: list[str] | None = None,
 ) -> str:
-    primary_tag = _select_primary_similarity_tag(tags=tags, title=title, description=description)
-    if primary_tag:
-        return f"{category.value}|tag:{primary_tag}"[:255]
+    return _compute_similarity_key_cached(title, category.value, description, tuple(tags or ()))
+
 
+@lru_cache(maxsize=4096)
+def _compute_similarity_key_cached(
+    title: str,
+    category_value: str,
+    description: str | None,
+    tags: tuple[str, ...],
+) -> str:
     title_tokens = _normalize_tokens(title)
+    primary_tag = _select_primary_similarity_tag(
+        tags=list(tags),
+        title=title,
+        description=description,
+        title_tokens=title_tokens,
+    )
+    if primary_tag:
+        return f"{category_value}|tag:{primary_tag}"[:255]
+
     top_keywords: list[str] = []
     for token in title_tokens:
         if token not in top_keywords:
@@ -201,7 +239,7 @@ def compute_similarity_key(
         top_keywords = [token for token, _ in token_counts.most_common(3)]
     if not top_keywords:
         top_keywords = ["generic"]
-    return f"{category.value}|kw:{'-'.join(top_keywords)}"[:255]
+    return f"{category_value}|kw:{'-'.join(top_keywords)}"[:255]
 
 
 def _normalize_tag(tag: str | None) -> str:
@@ -384,6 +422,11 @@ def _ticket_pair_similarity_score(ticket: Ticket, other: Ticket) -> float:
     return score
 
 
+def _linked_tickets_by_recency(problem: Problem) -> list[Ticket]:
+    # Linked tickets are co-loaded with the Problem row; order them like the former per-problem query.
+    return sorted(problem.tickets or [], key=lambda item: item.updated_at, reverse=True)
+
+
 def find_similar_tickets(
     *,
     ticket: Ticket,
@@ -433,6 +476,7 @@ def _find_similar_problem(
 ) -> Problem | None:
     candidates = (
         db.query(Problem)
+        .options(selectinload(Problem.tickets))
         .filter(Problem.category == ticket.category)
         .order_by(Problem.updated_at.desc())
         .all()
@@ -442,12 +486,7 @@ def _find_similar_problem(
 
     scored: list[tuple[float, Problem]] = []
     for problem in candidates:
-        linked = (
-            db.query(Ticket)
-            .filter(Ticket.problem_id == problem.id)
-            .order_by(Ticket.updated_at.desc())
-            .all()
-        )
+        linked = _linked_tickets_by_recency(problem)
         score = _problem_match_score(ticket=ticket, similarity_key=similarity_key, problem=problem, linked_tickets=linked)
         if score >= min_score:
             scored.append((score, problem))
@@ -464,6 +503,7 @@ def _recent_similar_tickets(
     ticket: Ticket,
     window_days: int = PROBLEM_TRIGGER_WINDOW_DAYS,
     min_score: float = PROBLEM_MATCH_SCORE_THRESHOLD,
+    min_count: int = PROBLEM_TRIGGER_MIN_COUNT,
 ) -> list[Ticket]:
     now = _utcnow()
     cutoff = now - dt.timedelta(days=max(1, window_days))
@@ -472,13 +512,33 @@ def _recent_similar_tickets(
         .filter(Ticket.category == ticket.category)
         .all()
     )
-    rows: list[Ticket] = []
+    groups: dict[str, list[Ticket]] = defaultdict(list)
     for candidate in candidates:
         if _ticket_event_time(candidate) < cutoff:
             continue
-        if _ticket_pair_similarity_score(ticket, candidate) < min_score:
+        key = compute_similarity_key(
+            candidate.title,
+            candidate.category,
+            description=candidate.description,
+            tags=candidate.tags,
+        )
+        groups[key].append(candidate)
+
+    similarity_key = compute_similarity_key(
+        ticket.title,
+        ticket.category,
+        description=ticket.description,
+        tags=ticket.tags,
+    )
+    # Same-key tickets always score 1.0; only sweep other buckets when the
+    # exact-key bucket alone cannot reach the problem trigger threshold.
+    rows = list(groups.get(similarity_key, []))
+    if len(rows) >= min_count:
+        return rows
+    for key, bucket in groups.items():
+        if key == similarity_key:
             continue
-        rows.append(candidate)
+        rows.extend(candidate for candidate in bucket if _ticket_pair_similarity_score(ticket, candidate) >= min_score)
     return rows
 
 
@@ -489,28 +549,59 @@ def _similarity_tag_score(tag: str, *, title_tokens: set[str], description_token
     if tag in title_tokens:
         score += 6
     if tag in description_tokens:
-        score += 3
+        score += DESCRIPTION_TAG_SCORE
     if len(tag) <= 4:
         score += 1
     return score
 
 
-def _select_primary_similarity_tag(*, tags: list[str] | None, title: str, description: str | None) -> str | None:
+def _select_primary_similarity_tag(
+    *,
+    tags: list[str] | None,
+    title: str,
+    description: str | None,
+    title_tokens: list[str] | None = None,
+) -> str | None:
     normalized = _normalize_tags(tags)
     if not normalized:
         return None
 
-    title_tokens = set(_normalize_tokens(title))
-    description_tokens = set(_normalize_tokens(description))
-    ranked = sorted(
+    title_token_set = set(title_tokens if title_tokens is not None else _normalize_tokens(title))
+    return _select_primary_similarity_tag_fast(
         normalized,
-        key=lambda tag: (
-            -_similarity_tag_score(tag, title_tokens=title_tokens, description_tokens=description_tokens),
-            len(tag),
+        title_tokens=title_token_set,
+        description=description,
+    )
+
+
+def _select_primary_similarity_tag_fast(
+    normalized_tags: list[str],
+    *,
+    title_tokens: set[str],
+    description: str | None,
+) -> str | None:
+    def rank(tag: str, score: int) -> tuple[int, int, str]:
+        return (-score, len(tag), tag)
+
+    partial = {tag: _similarity_tag_score(tag, title_tokens=title_tokens, description_tokens=set()) for tag in normalized_tags}
+    leader = min(normalized_tags, key=lambda tag: rank(tag, partial[tag]))
+    # A description hit is worth DESCRIPTION_TAG_SCORE, so only tokenize the
+    # description when another tag is close enough for it to change the pick.
+    contested = any(
+        tag != leader and partial[tag] + DESCRIPTION_TAG_SCORE >= partial[leader]
+        for tag in normalized_tags
+    )
+    if not contested:
+        return leader
+
+    description_tokens = set(_normalize_tokens(description))
+    return min(
+        normalized_tags,
+        key=lambda tag: rank(
             tag,
+            _similarity_tag_score(tag, title_tokens=title_tokens, description_tokens=description_tokens),
         ),
     )
-    return ranked[0] if ranked else None
 
 
 def _primary_tag_from_tickets(tickets: list[Ticket]) -> str | None:
@@ -525,8 +616,8 @@ def _primary_tag_from_tickets(tickets: list[Ticket]) -> str | None:
             picks[primary] += 1
     if not picks:
         return None
-    ranked = sorted(picks.items(), key=lambda item: (-item[1], len(item[0]), item[0]))
-    return ranked[0][0]
+    best, _ = min(picks.items(), key=lambda item: (-item[1], len(item[0]), item[0]))
+    return best
 
 
 def _extract_similarity_tokens(similarity_key: str | None) -> set[str]:
@@ -630,18 +721,18 @@ def _detach_if_problem_mismatch(
 ) -> None:
     if not ticket.problem_id:
         return
-    current = db.query(Problem).filter(Problem.id == ticket.problem_id).first()
+    current = (
+        db.query(Problem)
+        .options(joinedload(Problem.tickets))
+        .filter(Problem.id == ticket.problem_id)
+        .first()
+    )
     if not current:
         ticket.problem_id = None
         db.add(ticket)
         db.flush()
         return
-    linked = (
-        db.query(Ticket)
-        .filter(Ticket.problem_id == current.id)
-        .order_by(Ticket.updated_at.desc())
-        .all()
-    )
+    linked = _linked_tickets_by_recency(current)
     score = _problem_match_score(ticket=ticket, similarity_key=similarity_key, problem=current, linked_tickets=linked)
     if score >= min_score:
         return
@@ -725,6 +816,39 @@ def _recompute_problem_counters(db: Session, problem: Problem) -> None:
     recompute_problem_stats(db, problem.id)
 
 
+def _recompute_problem_counters_bulk(db: Session, problem_ids: list[str]) -> None:
+    """Recompute counters for several problems from one GROUP BY (problem_id, status) query."""
+    ids = sorted({problem_id for problem_id in problem_ids if problem_id})
+    if not ids:
+        return
+    event_time = func.coalesce(Ticket.jira_created_at, Ticket.created_at)
+    rows = (
+        db.query(Ticket.problem_id, Ticket.status, func.count(Ticket.id), func.max(event_time))
+        .filter(Ticket.problem_id.in_(ids))
+        .group_by(Ticket.problem_id, Ticket.status)
+        .all()
+    )
+    occurrences: Counter[str] = Counter()
+    active: Counter[str] = Counter()
+    last_seen: dict[str, dt.datetime] = {}
+    for problem_id, status, count, latest in rows:
+        occurrences[problem_id] += count
+        if status in ACTIVE_TICKET_STATUSES:
+            active[problem_id] += count
+        if latest is not None:
+            latest = latest.replace(tzinfo=dt.timezone.utc) if latest.tzinfo is None else latest.astimezone(dt.timezone.utc)
+            last_seen[problem_id] = max(latest, last_seen.get(problem_id, latest))
+
+    now = _utcnow()
+    for problem in db.query(Problem).filter(Problem.id.in_(ids)).all():
+        problem.occurrences_count = occurrences.get(problem.id, 0)
+        problem.active_count = active.get(problem.id, 0)
+        problem.last_seen_at = last_seen.get(problem.id, problem.last_seen_at)
+        problem.updated_at = now
+        db.add(problem)
+    db.flush()
+
+
 def _upsert_recommendation(
     db: Session,
     *,
@@ -734,8 +858,12 @@ def _upsert_recommendation(
     related_tickets: list[str],
     impact: RecommendationImpact,
     confidence: int,
+    existing_by_title: dict[str, Recommendation] | None = None,
 ) -> None:
-    existing = db.query(Recommendation).filter(Recommendation.title == title).first()
+    if existing_by_title is None:
+        existing = db.query(Recommendation).filter(Recommendation.title == title).first()
+    else:
+        existing = existing_by_title.get(title)
     if existing:
         existing.description = description
         existing.type = rec_type
@@ -759,6 +887,20 @@ def _upsert_recommendation(
 
 def _emit_problem_recommendations(db: Session, problem: Problem, tickets: list[Ticket], *, created: bool) -> None:
     related_ticket_ids = [ticket.id for ticket in tickets]
+    has_solution = bool(problem.workaround or problem.permanent_fix)
+    titles: list[str] = []
+    if created:
+        titles.extend([f"Recurring pattern detected -> {problem.id}", f"Workflow reinforcement for {problem.id}"])
+    if has_solution:
+        titles.append(f"Solution update for {problem.id}")
+    if not titles:
+        return
+    # One lookup for every recommendation this pass may touch instead of one per title.
+    existing_by_title = {
+        rec.title: rec
+        for rec in db.query(Recommendation).filter(Recommendation.title.in_(titles)).all()
+    }
+
     if created:
         _upsert_recommendation(
             db,
@@ -771,6 +913,7 @@ def _emit_problem_recommendations(db: Session, problem: Problem, tickets: list[T
             related_tickets=related_ticket_ids,
             impact=RecommendationImpact.high,
             confidence=90,
+            existing_by_title=existing_by_title,
         )
         _upsert_recommendation(
             db,
@@ -783,9 +926,10 @@ def _emit_problem_recommendations(db: Session, problem: Problem, tickets: list[T
             related_tickets=related_ticket_ids,
             impact=RecommendationImpact.medium,
             confidence=80,
+            existing_by_title=existing_by_title,
         )
 
-    if problem.workaround or problem.permanent_fix:
+    if has_solution:
         snippet = problem.permanent_fix or problem.workaround or ""
         _upsert_recommendation(
             db,
@@ -795,6 +939,7 @@ def _emit_problem_recommendations(db: Session, problem: Problem, tickets: list[T
             related_tickets=related_ticket_ids,
             impact=RecommendationImpact.high if problem.permanent_fix else RecommendationImpact.medium,
             confidence=88 if problem.permanent_fix else 72,
+            existing_by_title=existing_by_title,
         )
 
 
@@ -976,13 +1121,13 @@ def derive_problem_assignee(problem: Problem, *, tickets: list[Ticket] | None =
 
     if not assignee_stats:
         return None
-    ranked = sorted(
+    best, _ = min(
         assignee_stats.items(),
         # Prefer the most recently active assignee so manual reassignment
         # is reflected immediately in Problem views.
         key=lambda item: (-item[1][1], -item[1][0], item[0].casefold()),
     )
-    return ranked[0][0]
+    return best
 
 
 def assign_problem_assignee(
@@ -992,7 +1137,8 @@ def assign_problem_assignee(
     mode: str,
     assignee: str | None = None,
 ) -> tuple[str, int]:
-    linked = db.query(Ticket).filter(Ticket.problem_id == problem.id).all()
+    # Callers load the Problem via get_problem(), which already joins its tickets.
+    linked = list(problem.tickets or [])
     if not linked:
         raise ValueError("problem_has_no_linked_tickets")
 
@@ -1014,7 +1160,7 @@ def assign_problem_assignee(
         requested = (assignee or "").strip()
         if not requested:
             raise ValueError("assignee_required_for_manual_mode")
-        allowed = {user.name.casefold(): user.name for user in list_assignees(db)}
+        allowed = assignee_name_map(db)
         selected_assignee = allowed.get(requested.casefold())
         if not selected_assignee:
             raise ValueError("assignee_not_assignable")
@@ -1058,6 +1204,7 @@ def assign_problem_assignee(
     return selected_assignee, updated_tickets
 
 
+@lru_cache(maxsize=2048)
 def _summary_snippet(text: str | None, *, max_len: int = 180) -> str | None:
     value = re.sub(r"\s+", " ", (text or "").strip())
     if not value:
@@ -1067,12 +1214,35 @@ def _summary_snippet(text: str | None, *, max_len: int = 180) -> str | None:
     return value[: max_len - 3].rstrip() + "..."
 
 
+def _cached_classify(title: str, description: str) -> tuple[TicketPriority, object, TicketCategory, list[str]]:
+    # Dashboard redraws rebuild suggestions for unchanged problems; reuse the
+    # classifier output for identical (title, description) input.
+    key = hashlib.blake2s(f"{title}\x00{description}".encode("utf-8"), digest_size=16).hexdigest()
+    with _CLASSIFY_CACHE_LOCK:
+        hit = _CLASSIFY_CACHE.get(key)
+        if hit is not None:
+            _CLASSIFY_CACHE.move_to_end(key)
+    if hit is None:
+        priority, ticket_type, category, recommendations = classify_ticket(title, description)
+        hit = (priority, ticket_type, category, tuple(recommendations))
+        with _CLASSIFY_CACHE_LOCK:
+            _CLASSIFY_CACHE[key] = hit
+            _CLASSIFY_CACHE.move_to_end(key)
+            while len(_CLASSIFY_CACHE) > CLASSIFY_CACHE_MAX_ENTRIES:
+                _CLASSIFY_CACHE.popitem(last=False)
+    priority, ticket_type, category, recommendations = hit
+    return priority, ticket_type, category, list(recommendations)
+
+
 def _top_problem_keywords(problem: Problem, linked: list[Ticket], *, limit: int = 3) -> list[str]:
-    counts = Counter()
-    counts.update(_normalize_tokens(problem.title))
-    for ticket in linked:
-        counts.update(_normalize_tokens(ticket.title))
-        counts.update(_normalize_tokens(ticket.description))
+    counts = Counter(
+        chain(
+            _tokens_for(problem.title),
+            chain.from_iterable(
+                chain(_tokens_for(ticket.title), _tokens_for(ticket.description)) for ticket in linked
+            ),
+        )
+    )
     return [token for token, _ in counts.most_common(limit)]
 
 
@@ -1090,23 +1260,24 @@ def _field_suggestion_from_ai(
     return f"{prefix}: {suggestion}"
 
 
-def _suggestion_confidence_from_origin(origin: str, *, rank: int = 0) -> int:
-    base = {
+_ORIGIN_CONFIDENCE: Mapping[str, int] = MappingProxyType(
+    {
         "existing": 92,
         "resolved": 86,
         "ai": 78,
         "fallback": 66,
-    }.get(origin, 72)
-    return max(50, min(96, base - (rank * 4)))
+    }
+)
+_DEFAULT_ORIGIN_CONFIDENCE = 72
+
+
+def _suggestion_confidence_from_origin(origin: str, *, rank: int = 0) -> int:
+    confidence = _ORIGIN_CONFIDENCE.get(origin, _DEFAULT_ORIGIN_CONFIDENCE) - (rank * 4)
+    return 50 if confidence < 50 else 96 if confidence > 96 else confidence
 
 
 def _field_confidence(origin: str) -> int:
-    return {
-        "existing": 92,
-        "resolved": 86,
-        "ai": 78,
-        "fallback": 66,
-    }.get(origin, 72)
+    return _ORIGIN_CONFIDENCE.get(origin, _DEFAULT_ORIGIN_CONFIDENCE)
 
 
 def build_problem_ai_suggestions(db: Session, problem: Problem, *, tickets: list[Ticket] | None = None, limit: int = 5) -> dict[str, object]:
@@ -1133,42 +1304,52 @@ def build_problem_ai_suggestions(db: Session, problem: Problem, *, tickets: list
     if root_cause_snippet:
         push(f"Validate root cause in production telemetry: {root_cause_snippet}", origin="existing")
 
-    resolved = sorted(
-        [
-            ticket
-            for ticket in linked
-            if ticket.status in {TicketStatus.resolved, TicketStatus.closed} and (ticket.resolution or "").strip()
-        ],
-        key=lambda item: item.updated_at,
-        reverse=True,
-    )
-    for ticket in resolved[:2]:
-        resolution_snippet = _summary_snippet(ticket.resolution)
-        if resolution_snippet:
-            push(f"Reuse validated resolution from {ticket.id}: {resolution_snippet}", origin="resolved")
-
-    description_parts = [
-        problem.root_cause or "",
-        problem.workaround or "",
-        problem.permanent_fix or "",
-        " ".join((ticket.title or "") for ticket in linked[:6]),
-    ]
-    description = " ".join(part for part in description_parts if part).strip()
-    _, _, _, ai_recommendations = classify_ticket(problem.title, description or problem.title)
-    ai_scored = score_recommendations(
-        ai_recommendations,
-        start_confidence=80,
-        rank_decay=6,
-        floor=58,
-        ceiling=90,
-    )
-    ai_confidence_map = {
-        str(item["text"]).casefold(): int(item["confidence"])
-        for item in ai_scored
-        if str(item.get("text", "")).strip()
-    }
-    for item in ai_scored:
-        push(_summary_snippet(str(item["text"])), origin="ai")
+    # A fully documented problem already fills every field and the first three
+    # suggestion slots from its own text, so resolved tickets and the classifier
+    # cannot change the payload.
+    fully_documented = bool(root_cause_snippet and workaround_snippet and permanent_fix_snippet) and limit <= 3
+
+    resolved: list[Ticket] = []
+    ai_recommendations: list[str] = []
+    ai_confidence_map: dict[str, int] = {}
+    if not fully_documented:
+        # Only the two most recent resolutions are ever read.
+        resolved = heapq.nlargest(
+            2,
+            (
+                ticket
+                for ticket in linked
+                if ticket.status in RESOLVED_STATUSES and (ticket.resolution or "").strip()
+            ),
+            key=lambda item: item.updated_at,
+        )
+        for ticket in resolved[:2]:
+            resolution_snippet = _summary_snippet(ticket.resolution)
+            if resolution_snippet:
+                push(f"Reuse validated resolution from {ticket.id}: {resolution_snippet}", origin="resolved")
+
+        description_parts = [
+            problem.root_cause or "",
+            problem.workaround or "",
+            problem.permanent_fix or "",
+            " ".join((ticket.title or "") for ticket in linked[:6]),
+        ]
+        description = " ".join(part for part in description_parts if part).strip()
+        _, _, _, ai_recommendations = _cached_classify(problem.title, description or problem.title)
+        ai_scored = score_recommendations(
+            ai_recommendations,
+            start_confidence=80,
+            rank_decay=6,
+            floor=58,
+            ceiling=90,
+        )
+        ai_confidence_map = {
+            str(item["text"]).casefold(): int(item["confidence"])
+            for item in ai_scored
+            if str(item.get("text", "")).strip()
+        }
+        for item in ai_scored:
+            push(_summary_snippet(str(item["text"])), origin="ai")
 
     if not suggestion_rows:
         push("Collect logs and timeline evidence to confirm a single root cause before rollout.", origin="fallback")
@@ -1178,9 +1359,6 @@ def build_problem_ai_suggestions(db: Session, problem: Problem, *, tickets: list
     if not assignee:
         assignee = select_best_assignee(db, category=problem.category, priority=TicketPriority.high)
 
-    keywords = _top_problem_keywords(problem, linked)
-    keyword_line = ", ".join(keywords) if keywords else problem.category.value
-
     root_cause_source = "fallback"
     if root_cause_snippet:
         root_cause_suggestion = root_cause_snippet
@@ -1194,6 +1372,8 @@ def build_problem_ai_suggestions(db: Session, problem: Problem, *, tickets: list
         if root_cause_suggestion:
             root_cause_source = "ai"
     if not root_cause_suggestion:
+        keywords = _top_problem_keywords(problem, linked)
+        keyword_line = ", ".join(keywords) if keywords else problem.category.value
         root_cause_suggestion = (
             f"Hypothesis around recurring pattern ({keyword_line}). {ROOT_CAUSE_HINTS.get(problem.category, ROOT_CAUSE_HINTS[TicketCategory.problem])}"
         )
@@ -1264,8 +1444,8 @@ def build_problem_ai_suggestions(db: Session, problem: Problem, *, tickets: list
 
 
 def _validate_problem_transition(current: ProblemStatus, target: ProblemStatus) -> None:
-    allowed = PROBLEM_TRANSITIONS.get(current, {current})
-    if target not in allowed:
+    allowed = PROBLEM_TRANSITIONS.get(current)
+    if target != current and (allowed is None or target not in allowed):
         raise ValueError("invalid_problem_status_transition")
 
 
@@ -1303,21 +1483,30 @@ def update_problem(db: Session, problem: Problem, payload: ProblemUpdate) -> Pro
     return problem
 
 
-def link_ticket(db: Session, problem: Problem, ticket: Ticket) -> bool:
+def link_ticket(db: Session, problem: Problem, ticket: Ticket, *, defer: bool = False) -> bool:
+    """Link a ticket to a problem.
+
+    With ``defer=True`` the counters and commit are left to the caller, which
+    should finish a batch with ``_recompute_problem_counters_bulk`` and one commit.
+    """
     if ticket.problem_id == problem.id:
         return False
     ticket.problem_id = problem.id
     db.add(ticket)
+    if defer:
+        return True
     _recompute_problem_counters(db, problem)
     db.commit()
     return True
 
 
-def unlink_ticket(db: Session, problem: Problem, ticket: Ticket) -> bool:
+def unlink_ticket(db: Session, problem: Problem, ticket: Ticket, *, defer: bool = False) -> bool:
     if ticket.problem_id != problem.id:
         return False
     ticket.problem_id = None
     db.add(ticket)
+    if defer:
+        return True
     _recompute_problem_counters(db, problem)
     db.commit()
     return True
@@ -1334,62 +1523,56 @@ def resolve_linked_tickets(
 ) -> int:
     linked = (
         db.query(Ticket)
-        .filter(Ticket.problem_id == problem.id, Ticket.status.in_(list(ACTIVE_TICKET_STATUSES)))
+        .filter(Ticket.problem_id == problem.id, Ticket.status.in_(_ACTIVE_TICKET_STATUS_LIST))
         .all()
     )
-    resolved_count = 0
-    for ticket in linked:
-        updated = update_status(
-            db,
-            ticket.id,
-            TicketStatus.resolved,
-            actor=actor,
-            actor_id=actor_id,
-            actor_role=actor_role,
-            resolution_comment=resolution_comment,
-        )
-        if updated:
-            resolved_count += 1
-    db.refresh(problem)
+    # The status changes share one commit instead of one per ticket; notifications
+    # and Jira sync still run per ticket afterwards.
+    resolved_count = update_status_bulk(
+        db,
+        linked,
+        TicketStatus.resolved,
+        actor=actor,
+        actor_id=actor_id,
+        actor_role=actor_role,
+        resolution_comment=resolution_comment,
+    )
+    # recompute_problem_stats reloads the problem row, so no separate refresh is needed.
     _recompute_problem_counters(db, problem)
     db.commit()
     return resolved_count
 
 
 def problem_analytics_summary(db: Session) -> dict[str, object]:
-    problems = db.query(Problem).all()
-    by_status = Counter(problem.status.value for problem in problems)
-    top_candidates = [
-        problem
-        for problem in problems
-        if problem.status in {ProblemStatus.open, ProblemStatus.investigating, ProblemStatus.known_error}
-    ]
-    top = sorted(
-        top_candidates,
-        key=lambda problem: (problem.active_count, problem.occurrences_count, problem.updated_at),
-        reverse=True,
-    )[:6]
+    status_rows = db.query(Problem.status, func.count(Problem.id)).group_by(Problem.status).all()
+    by_status = {status.value: int(count) for status, count in status_rows}
+    active_total = db.query(func.coalesce(func.sum(Problem.active_count), 0)).scalar() or 0
+    top = (
+        db.query(Problem)
+        .filter(Problem.status.in_([ProblemStatus.open, ProblemStatus.investigating, ProblemStatus.known_error]))
+        .order_by(Problem.active_count.desc(), Problem.occurrences_count.desc(), Problem.updated_at.desc())
+        .limit(6)
+        .all()
+    )
+    linked_by_problem: dict[str, list] = defaultdict(list)
+    if top:
+        # Only four columns feed the payload, so stream plain rows in batches
+        # instead of hydrating every linked Ticket into the identity map.
+        linked_rows = (
+            db.query(Ticket.id, Ticket.problem_id, Ticket.priority, Ticket.updated_at)
+            .filter(Ticket.problem_id.in_([problem.id for problem in top]))
+            .order_by(Ticket.problem_id, Ticket.updated_at.desc())
+            .yield_per(500)
+        )
+        for row in linked_rows:
+            linked_by_problem[row.problem_id].append(row)
     top_payload = []
     for problem in top:
-        linked = (
-            db.query(Ticket)
-            .filter(Ticket.problem_id == problem.id)
-            .order_by(Ticket.updated_at.desc())
-            .all()
-        )
+        linked = linked_by_problem.get(problem.id, [])
         ticket_ids = [ticket.id for ticket in linked]
         latest = linked[0] if linked else None
-        priority_order = {
-            "critical": 4,
-            "high": 3,
-            "medium": 2,
-            "low": 1,
-        }
-        highest_priority = "low"
-        for ticket in linked:
-            level = ticket.priority.value
-            if priority_order[level] > priority_order[highest_priority]:
-                highest_priority = level
+        highest = max(linked, key=lambda ticket: _PRIORITY_ORDER[ticket.priority.value], default=None)
+        highest_priority = highest.priority.value if highest is not None else "low"
         fix_text = (problem.permanent_fix or "").strip()
         workaround_text = (problem.workaround or "").strip()
         if fix_text:
@@ -1424,12 +1607,12 @@ def problem_analytics_summary(db: Session) -> dict[str, object]:
             }
         )
     return {
-        "total": len(problems),
+        "total": sum(by_status.values()),
         "open": by_status.get(ProblemStatus.open.value, 0),
         "investigating": by_status.get(ProblemStatus.investigating.value, 0),
         "known_error": by_status.get(ProblemStatus.known_error.value, 0),
         "resolved": by_status.get(ProblemStatus.resolved.value, 0),
         "closed": by_status.get(ProblemStatus.closed.value, 0),
-        "active_total": sum(problem.active_count for problem in problems),
+        "active_total": int(active_total),
         "top": top_payload,
     }
@@ -46,41 +46,83 @@ def _one_step_higher(priority: TicketPriority) -> TicketPriority:
     return TicketPriority.critical
 
 
-def compute_escalation(ticket: Ticket) -> tuple[TicketPriority | None, str | None]:
-    """Return the escalated priority (if any) and reason."""
-    if ticket.status in {TicketStatus.resolved, TicketStatus.closed}:
-        return None, None
-
-    current = ticket.priority
+_REMAINING_NONE = 0
+_REMAINING_LE_HIGH = 1
+_REMAINING_LE_STEP = 2
+_REMAINING_ABOVE_STEP = 3
+
+
+def _decide_escalation(
+    resolution_breached: bool,
+    first_response_breached: bool,
+    remaining_bucket: int,
+    current: TicketPriority,
+) -> tuple[TicketPriority | None, str | None]:
     target: TicketPriority | None = None
     reason: str | None = None
 
-    if bool(ticket.sla_resolution_breached):
+    if resolution_breached:
         target = TicketPriority.critical
         reason = "jira_sla_resolution_breached"
-    elif bool(ticket.sla_first_response_breached):
+    elif first_response_breached:
         if _PRIORITY_RANK[current] < _PRIORITY_RANK[TicketPriority.high]:
             target = TicketPriority.high
             reason = "jira_sla_first_response_breached"
-    else:
-        remaining = ticket.sla_remaining_minutes
-        escalate_high_minutes = max(1, int(settings.SLA_ESCALATE_HIGH_MINUTES))
-        escalate_step_minutes = max(escalate_high_minutes, int(settings.SLA_ESCALATE_STEP_MINUTES))
-        if remaining is not None:
-            if remaining <= escalate_high_minutes and _PRIORITY_RANK[current] < _PRIORITY_RANK[TicketPriority.high]:
-                target = TicketPriority.high
-                reason = "jira_sla_remaining_le_high_threshold"
-            elif remaining <= escalate_step_minutes:
-                stepped = _one_step_higher(current)
-                if _is_higher(stepped, current):
-                    target = stepped
-                    reason = "jira_sla_remaining_le_step_threshold"
+    elif remaining_bucket == _REMAINING_LE_HIGH and _PRIORITY_RANK[current] < _PRIORITY_RANK[TicketPriority.high]:
+        target = TicketPriority.high
+        reason = "jira_sla_remaining_le_high_threshold"
+    elif remaining_bucket in {_REMAINING_LE_HIGH, _REMAINING_LE_STEP}:
+        stepped = _one_step_higher(current)
+        if _is_higher(stepped, current):
+            target = stepped
+            reason = "jira_sla_remaining_le_step_threshold"
 
     if target is None or not _is_higher(target, current):
         return None, None
     return target, reason
 
 
+# Every (resolution_breached, first_response_breached, remaining_bucket, priority)
+# combination is small enough to decide once at import time.
+_ESCALATION_TABLE: dict[tuple[bool, bool, int, TicketPriority], tuple[TicketPriority | None, str | None]] = {
+    (resolution_breached, first_response_breached, bucket, priority): _decide_escalation(
+        resolution_breached, first_response_breached, bucket, priority
+    )
+    for resolution_breached in (False, True)
+    for first_response_breached in (False, True)
+    for bucket in (_REMAINING_NONE, _REMAINING_LE_HIGH, _REMAINING_LE_STEP, _REMAINING_ABOVE_STEP)
+    for priority in _PRIORITY_RANK
+}
+
+
+def _remaining_bucket(remaining: int | None) -> int:
+    if remaining is None:
+        return _REMAINING_NONE
+    escalate_high_minutes = max(1, int(settings.SLA_ESCALATE_HIGH_MINUTES))
+    escalate_step_minutes = max(escalate_high_minutes, int(settings.SLA_ESCALATE_STEP_MINUTES))
+    if remaining <= escalate_high_minutes:
+        return _REMAINING_LE_HIGH
+    if remaining <= escalate_step_minutes:
+        return _REMAINING_LE_STEP
+    return _REMAINING_ABOVE_STEP
+
+
+def compute_escalation(ticket: Ticket) -> tuple[TicketPriority | None, str | None]:
+    """Return the escalated priority (if any) and reason."""
+    if ticket.status in {TicketStatus.resolved, TicketStatus.closed}:
+        return None, None
+
+    resolution_breached = bool(ticket.sla_resolution_breached)
+    first_response_breached = bool(ticket.sla_first_response_breached)
+    # Breach flags take precedence, so the SLA clock only matters when neither is set.
+    bucket = (
+        _REMAINING_NONE
+        if resolution_breached or first_response_breached
+        else _remaining_bucket(ticket.sla_remaining_minutes)
+    )
+    return _ESCALATION_TABLE[(resolution_breached, first_response_breached, bucket, ticket.priority)]
+
+
 def apply_escalation(db: Session, ticket: Ticket, actor: str = "system") -> bool:
     """Apply escalation in-place. Caller is responsible for commit."""
     target, reason = compute_escalation(ticket)
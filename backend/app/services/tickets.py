@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import datetime as dt
+import heapq
 import logging
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
 from typing import Any, Literal
-from sqlalchemy import func, or_
+from sqlalchemy import Numeric, cast, event, func, or_
 from sqlalchemy.orm import Session
 
 from app.integrations.jira.client import JiraClient
@@ -38,18 +42,21 @@ from app.services.automation_webhooks import trigger_critical_ticket_detected
 
 logger = logging.getLogger(__name__)
 
-ACTIVE_STATUSES = {
-    TicketStatus.open,
-    TicketStatus.in_progress,
-    TicketStatus.waiting_for_customer,
-    TicketStatus.waiting_for_support_vendor,
-    TicketStatus.pending,
-}
-RESOLVED_STATUSES = {TicketStatus.resolved, TicketStatus.closed}
+ACTIVE_STATUSES = frozenset(
+    {
+        TicketStatus.open,
+        TicketStatus.in_progress,
+        TicketStatus.waiting_for_customer,
+        TicketStatus.waiting_for_support_vendor,
+        TicketStatus.pending,
+    }
+)
+RESOLVED_STATUSES = frozenset({TicketStatus.resolved, TicketStatus.closed})
 PROBLEM_REPEAT_THRESHOLD = 3
 PROBLEM_TRIGGER_WINDOW_DAYS = 7
 PROBLEM_TRIGGER_COUNT_WINDOW = 5
 PROBLEM_TRIGGER_COUNT_DAY = 4
+PROBLEM_PROMOTION_TAGS = ("problem", "root-cause-analysis")
 MODEL_VERSION_MAX_LEN = 40
 HISTORY_EVENT_CREATE = "TICKET_CREATED"
 HISTORY_EVENT_STATUS = "TICKET_STATUS_UPDATED"
@@ -57,25 +64,30 @@ HISTORY_EVENT_TRIAGE = "TICKET_TRIAGE_UPDATED"
 HISTORY_EVENT_NOTE = "TICKET_NOTE_ADDED"
 HISTORY_EVENT_JIRA_ALIGN = "TICKET_STATUS_ALIGNED_FROM_JIRA"
 
-SIGNATURE_STOPWORDS = {
-    "the",
-    "and",
-    "for",
-    "with",
-    "from",
-    "this",
-    "that",
-    "les",
-    "des",
-    "pour",
-    "avec",
-    "dans",
-    "une",
-    "sur",
-    "ticket",
-    "incident",
-    "issue",
-}
+SIGNATURE_STOPWORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "from",
+        "this",
+        "that",
+        "les",
+        "des",
+        "pour",
+        "avec",
+        "dans",
+        "une",
+        "sur",
+        "ticket",
+        "incident",
+        "issue",
+    }
+)
+_SIGNATURE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.\!\?;])\s+")
 
 CATEGORY_ROUTING = {
     TicketCategory.infrastructure: {
@@ -113,8 +125,27 @@ CATEGORY_ROUTING = {
 }
 
 
-def _normalize_specializations(specializations: list[str] | None) -> set[str]:
-    return {str(item).strip().lower() for item in (specializations or []) if str(item).strip()}
+# Routing config resolved once into (method, specializations) so assignment
+# does not rebuild the specialization set on every call.
+_DEFAULT_ROUTING_PLAN: tuple[str, frozenset[str]] = ("balanced", frozenset())
+_CATEGORY_ROUTING_PLANS: dict[TicketCategory, tuple[str, frozenset[str]]] = {
+    category: (
+        str(routing.get("method") or "balanced"),
+        frozenset(routing.get("specializations") or ()),
+    )
+    for category, routing in CATEGORY_ROUTING.items()
+}
+
+
+def _normalize_specializations(specializations: list[str] | None) -> frozenset[str]:
+    # Routing re-checks the same agent rosters for every ticket; the raw tuple
+    # is a cheap key and makes edits to a user's list miss the cache naturally.
+    return _normalize_specializations_cached(tuple(specializations or ()))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_specializations_cached(specializations: tuple) -> frozenset[str]:
+    return frozenset(str(item).strip().lower() for item in specializations if str(item).strip())
 
 
 def _seniority_rank(level: SeniorityLevel | None) -> int:
@@ -126,14 +157,81 @@ def _seniority_rank(level: SeniorityLevel | None) -> int:
     }.get(level, 0)
 
 
-def _active_ticket_counts(db: Session) -> dict[str, int]:
-    rows = (
-        db.query(Ticket.assignee, func.count(Ticket.id))
+def _assignee_candidates(
+    db: Session,
+    category: TicketCategory,
+    *,
+    with_last_assigned: bool,
+) -> tuple[list[User], dict[str, int], dict[str, dt.datetime]]:
+    # One round-trip returns every agent with its active load and, for
+    # round-robin routing, when it last received a ticket in this category.
+    load_sq = (
+        db.query(Ticket.assignee.label("assignee"), func.count(Ticket.id).label("cnt"))
         .filter(Ticket.status.in_(ACTIVE_STATUSES))
         .group_by(Ticket.assignee)
-        .all()
+        .subquery()
     )
-    return {assignee: count for assignee, count in rows if assignee}
+    columns = [User, func.coalesce(load_sq.c.cnt, 0)]
+    last_sq = None
+    if with_last_assigned:
+        last_sq = (
+            db.query(Ticket.assignee.label("assignee"), func.max(Ticket.created_at).label("last_at"))
+            .filter(Ticket.category == category)
+            .group_by(Ticket.assignee)
+            .subquery()
+        )
+        columns.append(last_sq.c.last_at)
+    query = db.query(*columns).outerjoin(load_sq, load_sq.c.assignee == User.name)
+    if last_sq is not None:
+        query = query.outerjoin(last_sq, last_sq.c.assignee == User.name)
+    rows = query.filter(User.role.in_([UserRole.admin, UserRole.agent])).order_by(User.name.asc()).all()
+
+    agents: list[User] = []
+    load_map: dict[str, int] = {}
+    last_assigned: dict[str, dt.datetime] = {}
+    for row in rows:
+        user = row[0]
+        agents.append(user)
+        load_map[user.name] = int(row[1] or 0)
+        if last_sq is not None and row[2] is not None:
+            last_assigned[user.name] = row[2]
+    return agents, load_map, last_assigned
+
+
+_ASSIGNEE_CANDIDATES_INFO_KEY = "assignee_candidates"
+
+
+def _session_assignee_candidates(
+    db: Session,
+    category: TicketCategory,
+    *,
+    with_last_assigned: bool,
+) -> tuple[list[User], dict[str, int], dict[str, dt.datetime]]:
+    # Reuse the roster/load snapshot for repeated routing calls in one unit of
+    # work; the flush/commit listeners below drop it as soon as it may be stale.
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return _assignee_candidates(db, category, with_last_assigned=with_last_assigned)
+    cache = info.setdefault(_ASSIGNEE_CANDIDATES_INFO_KEY, {})
+    key = (category if with_last_assigned else None, with_last_assigned)
+    if key not in cache:
+        cache[key] = _assignee_candidates(db, category, with_last_assigned=with_last_assigned)
+    return cache[key]
+
+
+@event.listens_for(Session, "after_flush")
+def _drop_assignee_candidates_on_flush(session: Session, _flush_context: Any) -> None:
+    if _ASSIGNEE_CANDIDATES_INFO_KEY not in session.info:
+        return
+    touched = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, (Ticket, User)) for obj in touched):
+        session.info.pop(_ASSIGNEE_CANDIDATES_INFO_KEY, None)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _drop_assignee_candidates_on_transaction_end(session: Session) -> None:
+    session.info.pop(_ASSIGNEE_CANDIDATES_INFO_KEY, None)
 
 
 def _filter_candidates_by_specs(users: list[User], specs: set[str]) -> list[User]:
@@ -142,7 +240,7 @@ def _filter_candidates_by_specs(users: list[User], specs: set[str]) -> list[User
     return [
         u
         for u in users
-        if _normalize_specializations(u.specializations).intersection(specs)
+        if not _normalize_specializations(u.specializations).isdisjoint(specs)
     ]
 
 
@@ -167,23 +265,19 @@ def _balanced_workload(candidates: list[User], load_map: dict[str, int]) -> User
         load = load_map.get(user.name, 0)
         load_ratio = load / max_tickets
         return (load_ratio, load, user.name.lower())
-    return sorted(candidates, key=sort_key)[0]
+    return min(candidates, key=sort_key)
 
 
-def _round_robin(db: Session, candidates: list[User], category: TicketCategory) -> User | None:
+def _round_robin(candidates: list[User], last_assigned: dict[str, dt.datetime]) -> User | None:
     if not candidates:
         return None
     ordered = sorted(candidates, key=lambda u: u.name.lower())
     names = [u.name for u in ordered]
-    last = (
-        db.query(Ticket)
-        .filter(Ticket.category == category, Ticket.assignee.in_(names))
-        .order_by(Ticket.created_at.desc())
-        .first()
-    )
-    if not last or last.assignee not in names:
+    recent = [name for name in names if name in last_assigned]
+    if not recent:
         return ordered[0]
-    idx = (names.index(last.assignee) + 1) % len(names)
+    last = max(recent, key=last_assigned.__getitem__)
+    idx = (names.index(last) + 1) % len(names)
     return ordered[idx]
 
 
@@ -196,7 +290,7 @@ def _direct_assignment(candidates: list[User], load_map: dict[str, int]) -> User
         load = load_map.get(user.name, 0)
         return (-_seniority_rank(user.seniority_level), load, user.name.lower())
 
-    return sorted(candidates, key=sort_key)[0]
+    return min(candidates, key=sort_key)
 
 
 def select_best_assignee(
@@ -205,30 +299,23 @@ def select_best_assignee(
     category: TicketCategory,
     priority: TicketPriority,
 ) -> str | None:
-    agents = (
-        db.query(User)
-        .filter(User.role.in_([UserRole.admin, UserRole.agent]))
-        .order_by(User.name.asc())
-        .all()
+    method, specs = _CATEGORY_ROUTING_PLANS.get(category, _DEFAULT_ROUTING_PLAN)
+
+    agents, load_map, last_assigned = _session_assignee_candidates(
+        db,
+        category,
+        with_last_assigned=method == "round_robin",
     )
     if not agents:
         return None
 
-    routing = CATEGORY_ROUTING.get(category)
-    specs = set()
-    method = "balanced"
-    if routing:
-        specs = set(routing.get("specializations") or [])
-        method = str(routing.get("method") or "balanced")
-
-    load_map = _active_ticket_counts(db)
     candidates = _apply_availability_and_capacity(agents, load_map)
     filtered = _filter_candidates_by_specs(candidates, specs)
     if filtered:
         candidates = filtered
 
     if method == "round_robin":
-        chosen = _round_robin(db, candidates, category)
+        chosen = _round_robin(candidates, last_assigned)
     elif method == "direct":
         chosen = _direct_assignment(candidates, load_map)
     else:
@@ -245,6 +332,51 @@ def list_tickets_for_user(db: Session, user: User) -> list[Ticket]:
     return filter_tickets_for_user(user, list_tickets(db))
 
 
+# Columns read by the performance dashboards. Loading these as plain rows skips
+# the text/JSONB payloads and the ORM identity map for every ticket.
+TICKET_ANALYTICS_COLUMNS = (
+    Ticket.id,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.ticket_type,
+    Ticket.category,
+    Ticket.assignee,
+    Ticket.reporter,
+    Ticket.reporter_id,
+    Ticket.problem_id,
+    Ticket.auto_assignment_applied,
+    Ticket.auto_priority_applied,
+    Ticket.predicted_priority,
+    Ticket.predicted_ticket_type,
+    Ticket.predicted_category,
+    Ticket.assignment_change_count,
+    Ticket.first_action_at,
+    Ticket.resolved_at,
+    Ticket.created_at,
+    Ticket.updated_at,
+    Ticket.jira_created_at,
+    Ticket.jira_updated_at,
+    Ticket.due_at,
+    Ticket.sla_status,
+    Ticket.sla_first_response_due_at,
+    Ticket.sla_resolution_due_at,
+    Ticket.sla_first_response_breached,
+    Ticket.sla_resolution_breached,
+    Ticket.sla_first_response_completed_at,
+    Ticket.sla_resolution_completed_at,
+)
+
+
+def list_ticket_analytics_rows_for_user(db: Session, user: User) -> list:
+    """Return lightweight named rows (not ``Ticket`` entities) visible to ``user``.
+
+    Rows expose the ``TICKET_ANALYTICS_COLUMNS`` as attributes, so the analytics
+    helpers accept them in place of full tickets.
+    """
+    rows = db.query(*TICKET_ANALYTICS_COLUMNS).order_by(Ticket.created_at.desc()).all()
+    return filter_tickets_for_user(user, rows)
+
+
 def get_ticket(db: Session, ticket_id: str) -> Ticket | None:
     return db.get(Ticket, ticket_id)
 
@@ -260,6 +392,19 @@ def get_ticket_for_user(db: Session, ticket_id: str, user: User) -> Ticket | Non
 
 # ── Targeted shortcut queries (bypass full table scan) ────────────────────
 
+def _scope_ticket_query(q, user: User):  # noqa: ANN001, ANN202
+    """Restrict a ticket query to the rows the user may see (customers: own tickets)."""
+    if effective_role(user.role) in {UserRole.admin, UserRole.agent}:
+        return q
+    # Same identity match as rbac: trimmed, case-insensitive equality. ILIKE
+    # would treat "_" and "%" in emails or names as wildcards.
+    identities = sorted({value.strip().lower() for value in (user.email, user.name) if value and value.strip()})
+    conditions = [Ticket.reporter_id == str(user.id)]
+    if identities:
+        conditions.append(func.lower(func.trim(Ticket.reporter)).in_(identities))
+    return q.filter(or_(*conditions))
+
+
 def get_recent_ticket_for_user(db: Session, user: User, *, open_only: bool = False) -> Ticket | None:
     """Return the single most recent ticket visible to the user.
 
@@ -269,14 +414,7 @@ def get_recent_ticket_for_user(db: Session, user: User, *, open_only: bool = Fal
     q = db.query(Ticket).order_by(Ticket.created_at.desc())
     if open_only:
         q = q.filter(Ticket.status == TicketStatus.open)
-    if effective_role(user.role) not in {UserRole.admin, UserRole.agent}:
-        q = q.filter(
-            or_(
-                Ticket.reporter_id == str(user.id),
-                Ticket.reporter.ilike(user.email),
-                Ticket.reporter.ilike(user.name),
-            )
-        )
+    q = _scope_ticket_query(q, user)
     return q.first()
 
 
@@ -288,14 +426,7 @@ def get_critical_tickets_for_user(db: Session, user: User, *, active_only: bool
     q = db.query(Ticket).filter(Ticket.priority == TicketPriority.critical).order_by(Ticket.created_at.desc())
     if active_only:
         q = q.filter(Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress]))
-    if effective_role(user.role) not in {UserRole.admin, UserRole.agent}:
-        q = q.filter(
-            or_(
-                Ticket.reporter_id == str(user.id),
-                Ticket.reporter.ilike(user.email),
-                Ticket.reporter.ilike(user.name),
-            )
-        )
+    q = _scope_ticket_query(q, user)
     return q.limit(50).all()
 
 
@@ -305,28 +436,17 @@ def get_tickets_by_category_for_user(db: Session, user: User) -> list[Ticket]:
     Loads only id and category columns to compute the most-used-categories stats.
     """
     q = db.query(Ticket.id, Ticket.category).order_by(Ticket.created_at.desc())
-    if effective_role(user.role) not in {UserRole.admin, UserRole.agent}:
-        q = q.filter(
-            or_(
-                Ticket.reporter_id == str(user.id),
-                Ticket.reporter.ilike(user.email),
-                Ticket.reporter.ilike(user.name),
-            )
-        )
+    q = _scope_ticket_query(q, user)
     rows = q.all()
     # Return lightweight namespace objects so formatters can access .category.value
     return [type("T", (), {"category": r.category})() for r in rows]
 
 
 def _next_comment_id(db: Session) -> str:
-    ids = [row[0] for row in db.query(TicketComment.id).all()]
-    max_num = 0
-    for cid in ids:
-        match = re.search(r"(\d+)$", cid or "")
-        if not match:
-            continue
-        max_num = max(max_num, int(match.group(1)))
-    return f"c{max_num + 1}"
+    # Let the database find the highest numeric suffix instead of streaming every id back.
+    # Jira-synced ids end in hex, so their digit runs can exceed a 32-bit integer.
+    max_num = db.query(func.max(cast(func.substring(TicketComment.id, r"(\d+)$"), Numeric))).scalar()
+    return f"c{int(max_num or 0) + 1}"
 
 
 def _normalize_model_version(value: str | None, *, default: str) -> str:
@@ -504,6 +624,8 @@ def ensure_jira_link_for_ticket(db: Session, ticket: Ticket) -> bool:
     ticket.external_updated_at = now
     ticket.last_synced_at = now
     db.add(ticket)
+    # Persist the link before any further Jira round trip: if the SLA sync
+    # hangs or the process dies, the next run must not create a second issue.
     db.commit()
     db.refresh(ticket)
 
@@ -521,43 +643,60 @@ def ensure_jira_link_for_ticket(db: Session, ticket: Ticket) -> bool:
     return True
 
 
-def _signature_tokens(text: str | None) -> set[str]:
-    normalized = re.sub(r"[^a-z0-9\s]", " ", (text or "").lower())
-    tokens = [
+@lru_cache(maxsize=4096)
+def _signature_tokens(text: str | None) -> frozenset[str]:
+    # Promotion checks re-read the same ticket texts on every status update,
+    # so keep the immutable token sets around between calls.
+    # Matching alphanumeric runs lazily lets islice stop scanning long
+    # descriptions at the twelfth token instead of rewriting the whole text.
+    tokens = (
         token
-        for token in normalized.split()
+        for token in map(re.Match.group, _SIGNATURE_TOKEN_RE.finditer((text or "").lower()))
         if len(token) > 2 and token not in SIGNATURE_STOPWORDS
-    ]
-    return set(tokens[:12])
+    )
+    return frozenset(islice(tokens, 12))
 
 
-def _signature_overlap(left: set[str], right: set[str]) -> float:
-    if not left or not right:
-        return 0.0
-    common = len(left.intersection(right))
-    return common / max(1, min(len(left), len(right)))
+def _signature_overlap_at_least(
+    left: frozenset[str],
+    right: frozenset[str],
+    threshold: float,
+    *,
+    left_len: int | None = None,
+) -> bool:
+    """Return whether the overlap ratio of two signatures reaches ``threshold``.
+
+    The ratio is the shared-token count over the smaller signature. Disjoint or
+    empty signatures are rejected by ``isdisjoint`` before any intersection is
+    built; callers scanning many signatures pass the seed's ``left_len``.
+    """
+    if not right or left.isdisjoint(right):
+        return False
+    smaller = min(len(left) if left_len is None else left_len, len(right))
+    return len(left.intersection(right)) / smaller >= threshold
 
 
-def _incident_signature(ticket: Ticket) -> set[str]:
+def _incident_signature(ticket: Ticket) -> frozenset[str]:
     return _signature_tokens(f"{ticket.title} {ticket.description}")
 
 
-def _comment_signature(comment: str | None) -> set[str]:
+def _comment_signature(comment: str | None) -> frozenset[str]:
     return _signature_tokens(comment or "")
 
 
 def _cluster_temporal_counts(cluster: list[Ticket], *, now: dt.datetime) -> tuple[int, int, str | None]:
     recent_cutoff = now - dt.timedelta(days=PROBLEM_TRIGGER_WINDOW_DAYS)
-    recent_occurrences_7d = sum(1 for item in cluster if analytics_created_at(item) >= recent_cutoff)
-
+    recent_occurrences_7d = 0
     day_counts: Counter[str] = Counter()
     for item in cluster:
-        day_key = analytics_created_at(item).date().isoformat()
-        day_counts[day_key] += 1
+        created = analytics_created_at(item)
+        if created >= recent_cutoff:
+            recent_occurrences_7d += 1
+        day_counts[created.date().isoformat()] += 1
 
     if not day_counts:
         return recent_occurrences_7d, 0, None
-    same_day_peak_date, same_day_peak = day_counts.most_common(1)[0]
+    same_day_peak_date, same_day_peak = max(day_counts.items(), key=itemgetter(1))
     return recent_occurrences_7d, same_day_peak, same_day_peak_date
 
 
@@ -588,8 +727,8 @@ def _resolution_recommendation_snippet(resolution: str | None) -> str | None:
     text = (resolution or "").strip()
     if not text:
         return None
-    normalized = re.sub(r"\s+", " ", text)
-    parts = re.split(r"(?<=[\.\!\?;])\s+", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", text)
+    parts = _SENTENCE_SPLIT_RE.split(normalized)
     head = (parts[0] if parts else normalized).strip()
     if not head:
         return None
@@ -600,20 +739,20 @@ def _resolution_recommendation_snippet(resolution: str | None) -> str | None:
 
 
 def _build_problem_ai_recommendation(cluster: list[Ticket]) -> tuple[str, int]:
-    snippets: list[str] = []
+    counts: Counter[str] = Counter()
     for item in cluster:
-        if item.status not in {TicketStatus.resolved, TicketStatus.closed}:
+        if item.status not in RESOLVED_STATUSES:
             continue
         snippet = _resolution_recommendation_snippet(item.resolution)
         if snippet:
-            snippets.append(snippet)
+            counts[snippet] += 1
 
-    if snippets:
-        counts = Counter(snippets)
-        chosen = counts.most_common(1)[0][0]
+    if counts:
+        chosen = max(counts, key=counts.__getitem__)
         return f"Recommendation IA: reproduire en priorite cette action qui a deja fonctionne: {chosen}", 84
 
-    dominant_category = Counter(t.category for t in cluster).most_common(1)[0][0]
+    category_counts = Counter(map(attrgetter("category"), cluster))
+    dominant_category = max(category_counts, key=category_counts.__getitem__)
     return f"Recommendation IA: {_fallback_problem_recommendation(dominant_category)}", 68
 
 
@@ -621,15 +760,30 @@ def _should_promote_to_problem(db: Session, ticket: Ticket, resolution_comment:
     if ticket.category == TicketCategory.problem:
         return False
 
-    others = db.query(Ticket).filter(Ticket.id != ticket.id).all()
+    # The checks below only read these columns, so skip the JSONB payloads and
+    # ORM hydration that loading full tickets would cost.
+    others = (
+        db.query(
+            Ticket.id,
+            Ticket.title,
+            Ticket.description,
+            Ticket.status,
+            Ticket.resolution,
+            Ticket.created_at,
+            Ticket.jira_created_at,
+        )
+        .filter(Ticket.id != ticket.id)
+        .all()
+    )
     if not others:
         return False
-    resolved_only = [item for item in others if item.status in {TicketStatus.resolved, TicketStatus.closed}]
 
     incident_matches = 1
     comment_matches = 1
     this_incident = _incident_signature(ticket)
     this_comment = _comment_signature(resolution_comment)
+    this_incident_len = len(this_incident)
+    this_comment_len = len(this_comment)
     now = dt.datetime.now(dt.timezone.utc)
     recent_cutoff = now - dt.timedelta(days=PROBLEM_TRIGGER_WINDOW_DAYS)
     created_at = analytics_created_at(ticket)
@@ -637,18 +791,38 @@ def _should_promote_to_problem(db: Session, ticket: Ticket, resolution_comment:
     same_day_incident_matches = 1
     same_day = created_at.date()
 
+    # Counters only grow, so stop scanning as soon as any threshold is reached.
     for existing in others:
-        overlap = _signature_overlap(this_incident, _incident_signature(existing))
-        if overlap >= 0.6:
+        if _signature_overlap_at_least(
+            this_incident,
+            _incident_signature(existing),
+            0.6,
+            left_len=this_incident_len,
+        ):
             incident_matches += 1
             existing_created = analytics_created_at(existing)
             if existing_created >= recent_cutoff:
                 recent_incident_matches += 1
             if existing_created.date() == same_day:
                 same_day_incident_matches += 1
-    for existing in resolved_only:
-        if _signature_overlap(this_comment, _comment_signature(existing.resolution or "")) >= 0.8:
-            comment_matches += 1
+            if (
+                incident_matches >= PROBLEM_REPEAT_THRESHOLD
+                or recent_incident_matches >= PROBLEM_TRIGGER_COUNT_WINDOW
+                or same_day_incident_matches >= PROBLEM_TRIGGER_COUNT_DAY
+            ):
+                return True
+    if this_comment:
+        resolved_only = (item for item in others if item.status in RESOLVED_STATUSES)
+        for existing in resolved_only:
+            if _signature_overlap_at_least(
+                this_comment,
+                _comment_signature(existing.resolution or ""),
+                0.8,
+                left_len=this_comment_len,
+            ):
+                comment_matches += 1
+                if comment_matches >= PROBLEM_REPEAT_THRESHOLD:
+                    return True
 
     return (
         incident_matches >= PROBLEM_REPEAT_THRESHOLD
@@ -658,22 +832,22 @@ def _should_promote_to_problem(db: Session, ticket: Ticket, resolution_comment:
     )
 
 
-def update_status(
+def _apply_status_update(
     db: Session,
-    ticket_id: str,
+    ticket: Ticket,
     status: TicketStatus,
     *,
     actor: str,
     actor_id: str | None = None,
     actor_role: str | None = None,
     resolution_comment: str | None = None,
-) -> Ticket | None:
+) -> dict[str, Any]:
+    """Stage a status change (comment, promotion, problem link, history) without committing.
+
+    Returns the context ``_finish_status_update`` needs once the caller has committed.
+    """
     from app.services.problems import link_ticket_to_problem
 
-    ticket = db.get(Ticket, ticket_id)
-    if not ticket:
-        logger.warning("Ticket status update failed (not found): %s", ticket_id)
-        return None
     before_snapshot = _history_snapshot(ticket)
     now = dt.datetime.now(dt.timezone.utc)
     normalized_comment = (resolution_comment or "").strip()
@@ -686,7 +860,6 @@ def update_status(
     if status == TicketStatus.closed and not normalized_comment and not has_resolution:
         raise ValueError("resolution_comment_required")
 
-    comment_to_sync = ""
     comment_id: str | None = None
     if normalized_comment:
         comment = TicketComment(
@@ -698,18 +871,15 @@ def update_status(
         )
         db.add(comment)
         ticket.resolution = normalized_comment
-        comment_to_sync = normalized_comment
         comment_id = comment.id
 
     promotion_source = normalized_comment or (ticket.resolution or "")
-    if status in {TicketStatus.resolved, TicketStatus.closed} and promotion_source:
+    if status in RESOLVED_STATUSES and promotion_source:
         if _should_promote_to_problem(db, ticket, promotion_source):
             ticket.category = TicketCategory.problem
             tags = list(ticket.tags or [])
-            if "problem" not in tags:
-                tags.append("problem")
-            if "root-cause-analysis" not in tags:
-                tags.append("root-cause-analysis")
+            present = set(tags)
+            tags.extend(tag for tag in PROBLEM_PROMOTION_TAGS if tag not in present)
             ticket.tags = tags
 
     ticket.status = status
@@ -750,7 +920,23 @@ def update_status(
                 "changes": changes,
             },
         )
-    db.commit()
+    return {
+        "previous_status": previous_status,
+        "previous_problem_id": previous_problem_id,
+        "status_changed": status_changed,
+        "comment": normalized_comment,
+        "comment_id": comment_id,
+    }
+
+
+def _finish_status_update(db: Session, ticket: Ticket, context: dict[str, Any], *, actor: str) -> None:
+    """Send notifications and sync Jira for a status change that is already committed."""
+    normalized_comment = context["comment"]
+    comment_id = context["comment_id"]
+    status_changed = context["status_changed"]
+    previous_status = context["previous_status"]
+    previous_problem_id = context["previous_problem_id"]
+
     db.refresh(ticket)
     if status_changed:
         notify_ticket_status_change(
@@ -784,19 +970,86 @@ def update_status(
                 db.refresh(ticket)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Jira outbound update failed after status change for %s: %s", ticket.id, exc)
-        if comment_to_sync:
+        if normalized_comment:
             try:
-                add_jira_comment_for_ticket(ticket, comment_to_sync, author_name=actor)
+                add_jira_comment_for_ticket(ticket, normalized_comment, author_name=actor)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Jira comment sync failed after status change for %s: %s", ticket.id, exc)
         try:
             _align_ticket_status_with_jira(db, ticket)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Jira status realign failed after status change for %s: %s", ticket.id, exc)
-    logger.info("Ticket status updated: %s -> %s", ticket.id, status.value)
+    logger.info("Ticket status updated: %s -> %s", ticket.id, ticket.status.value)
+
+
+def update_status(
+    db: Session,
+    ticket_id: str,
+    status: TicketStatus,
+    *,
+    actor: str,
+    actor_id: str | None = None,
+    actor_role: str | None = None,
+    resolution_comment: str | None = None,
+) -> Ticket | None:
+    ticket = db.get(Ticket, ticket_id)
+    if not ticket:
+        logger.warning("Ticket status update failed (not found): %s", ticket_id)
+        return None
+    context = _apply_status_update(
+        db,
+        ticket,
+        status,
+        actor=actor,
+        actor_id=actor_id,
+        actor_role=actor_role,
+        resolution_comment=resolution_comment,
+    )
+    db.commit()
+    _finish_status_update(db, ticket, context, actor=actor)
     return ticket
 
 
+def update_status_bulk(
+    db: Session,
+    tickets: list[Ticket],
+    status: TicketStatus,
+    *,
+    actor: str,
+    actor_id: str | None = None,
+    actor_role: str | None = None,
+    resolution_comment: str | None = None,
+) -> int:
+    """Apply one status change to many tickets and commit the staged changes once.
+
+    Only the status commit is shared: notifications and Jira sync still run per
+    ticket after it, each with its own commits. A failing follow-up step is
+    logged and does not stop the remaining tickets.
+    """
+    staged: list[tuple[Ticket, dict[str, Any]]] = []
+    for ticket in tickets:
+        context = _apply_status_update(
+            db,
+            ticket,
+            status,
+            actor=actor,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            resolution_comment=resolution_comment,
+        )
+        staged.append((ticket, context))
+    if not staged:
+        return 0
+    db.commit()
+    for ticket, context in staged:
+        try:
+            _finish_status_update(db, ticket, context, actor=actor)
+        except Exception:  # noqa: BLE001
+            db.rollback()
+            logger.exception("Post-commit status update steps failed for %s", ticket.id)
+    return len(staged)
+
+
 def update_ticket_triage(
     db: Session,
     ticket_id: str,
@@ -1003,24 +1256,27 @@ def update_ticket_triage(
 
 def compute_stats(tickets: list[Ticket]) -> dict:
     total = len(tickets)
-    open_count = sum(1 for t in tickets if t.status == TicketStatus.open)
-    in_progress = sum(1 for t in tickets if t.status == TicketStatus.in_progress)
-    pending = sum(1 for t in tickets if _is_waiting_status(t.status))
-    resolved = sum(1 for t in tickets if t.status == TicketStatus.resolved)
-    closed = sum(1 for t in tickets if t.status == TicketStatus.closed)
-    critical = sum(1 for t in tickets if t.priority == TicketPriority.critical)
-    high = sum(1 for t in tickets if t.priority == TicketPriority.high)
-
-    resolved_tickets = [t for t in tickets if t.status in RESOLVED_STATUSES]
-    if resolved_tickets:
-        days = []
-        for ticket in resolved_tickets:
+    # Counter's C-level counting loop beats a Python += per ticket; only the
+    # resolved subset needs the per-ticket duration work below.
+    status_counts: Counter[TicketStatus] = Counter(map(attrgetter("status"), tickets))
+    priority_counts: Counter[TicketPriority] = Counter(map(attrgetter("priority"), tickets))
+    resolution_days = 0.0
+    resolved_count = 0
+    for ticket in tickets:
+        if ticket.status in RESOLVED_STATUSES:
             created = analytics_created_at(ticket)
             resolved_at = analytics_resolved_at(ticket) or analytics_updated_at(ticket)
-            days.append(max((resolved_at - created).total_seconds() / 86400, 0))
-        avg_resolution = round(sum(days) / len(days), 2)
-    else:
-        avg_resolution = 0.0
+            resolution_days += max((resolved_at - created).total_seconds() / 86400, 0)
+            resolved_count += 1
+
+    open_count = status_counts.get(TicketStatus.open, 0)
+    in_progress = status_counts.get(TicketStatus.in_progress, 0)
+    pending = sum(count for status, count in status_counts.items() if _is_waiting_status(status))
+    resolved = status_counts.get(TicketStatus.resolved, 0)
+    closed = status_counts.get(TicketStatus.closed, 0)
+    critical = priority_counts.get(TicketPriority.critical, 0)
+    high = priority_counts.get(TicketPriority.high, 0)
+    avg_resolution = round(resolution_days / resolved_count, 2) if resolved_count else 0.0
 
     resolution_rate = round(((resolved + closed) / total) * 100) if total else 0
 
@@ -1038,6 +1294,51 @@ def compute_stats(tickets: list[Ticket]) -> dict:
     }
 
 
+def compute_stats_sql(db: Session, user: User) -> dict:
+    """SQL-side equivalent of ``compute_stats`` for the tickets visible to ``user``.
+
+    Counts come from GROUP BY aggregates so no Ticket rows are hydrated.
+    """
+    status_counts = {
+        status: count
+        for status, count in _scope_ticket_query(
+            db.query(Ticket.status, func.count(Ticket.id)), user
+        ).group_by(Ticket.status).all()
+    }
+    priority_counts = {
+        priority: count
+        for priority, count in _scope_ticket_query(
+            db.query(Ticket.priority, func.count(Ticket.id)), user
+        ).group_by(Ticket.priority).all()
+    }
+    created = func.coalesce(Ticket.jira_created_at, Ticket.created_at)
+    resolved_at = func.coalesce(Ticket.resolved_at, Ticket.jira_updated_at, Ticket.updated_at)
+    avg_seconds = (
+        _scope_ticket_query(
+            db.query(func.avg(func.greatest(func.extract("epoch", resolved_at - created), 0))),
+            user,
+        )
+        .filter(Ticket.status.in_(RESOLVED_STATUSES))
+        .scalar()
+    )
+
+    total = sum(status_counts.values())
+    resolved = status_counts.get(TicketStatus.resolved, 0)
+    closed = status_counts.get(TicketStatus.closed, 0)
+    return {
+        "total": total,
+        "open": status_counts.get(TicketStatus.open, 0),
+        "in_progress": status_counts.get(TicketStatus.in_progress, 0),
+        "pending": sum(count for status, count in status_counts.items() if _is_waiting_status(status)),
+        "resolved": resolved,
+        "closed": closed,
+        "critical": priority_counts.get(TicketPriority.critical, 0),
+        "high": priority_counts.get(TicketPriority.high, 0),
+        "resolution_rate": round(((resolved + closed) / total) * 100) if total else 0,
+        "avg_resolution_days": round(float(avg_seconds) / 86400, 2) if avg_seconds is not None else 0.0,
+    }
+
+
 def _avg(values: list[float]) -> float | None:
     if not values:
         return None
@@ -1077,6 +1378,25 @@ def _is_ia_ticket(ticket: Ticket) -> bool:
     return bool(ticket.auto_assignment_applied or ticket.auto_priority_applied)
 
 
+def _prediction_matches(ticket: Ticket) -> tuple[int, int]:
+    """Return how many AI predictions a ticket carries and how many still match."""
+    checks = 0
+    matches = 0
+    predicted_priority = getattr(ticket, "predicted_priority", None)
+    if predicted_priority is not None:
+        checks += 1
+        matches += predicted_priority == ticket.priority
+    predicted_ticket_type = getattr(ticket, "predicted_ticket_type", None)
+    if predicted_ticket_type is not None:
+        checks += 1
+        matches += predicted_ticket_type == ticket.ticket_type
+    predicted_category = getattr(ticket, "predicted_category", None)
+    if predicted_category is not None:
+        checks += 1
+        matches += predicted_category == ticket.category
+    return checks, matches
+
+
 def _filter_performance_tickets(
     tickets: list[Ticket],
     *,
@@ -1134,72 +1454,66 @@ def compute_assignment_performance(
     now = dt.datetime.now(dt.timezone.utc)
     resolved_tickets = [t for t in tickets if t.status in RESOLVED_STATUSES]
 
-    before_group = [t for t in resolved_tickets if not _is_ia_ticket(t)]
-    after_group = [t for t in resolved_tickets if _is_ia_ticket(t)]
-
-    mttr_before = _avg(
-        [
-            _duration_hours(analytics_created_at(t), analytics_resolved_at(t) or analytics_updated_at(t))
-            for t in before_group
-        ]
-    )
-    mttr_after = _avg(
-        [
-            _duration_hours(analytics_created_at(t), analytics_resolved_at(t) or analytics_updated_at(t))
-            for t in after_group
-        ]
-    )
-
-    reassigned_tickets = sum(1 for t in tickets if int(t.assignment_change_count or 0) > 0)
-    reassignment_rate = round((reassigned_tickets / total) * 100, 2) if total else 0.0
-
+    # Resolve each ticket's timestamps once and bucket its duration for every
+    # MTTR breakdown, instead of recomputing it per priority/category scan.
+    resolved_ends: list[dt.datetime] = []
+    mttr_values: list[float] = []
+    mttr_before_values: list[float] = []
+    mttr_after_values: list[float] = []
+    mttr_priority_values: dict[TicketPriority, list[float]] = {priority: [] for priority in TicketPriority}
+    mttr_category_values: dict[TicketCategory, list[float]] = {category_value: [] for category_value in TicketCategory}
+    for t in resolved_tickets:
+        resolved_end = analytics_resolved_at(t) or analytics_updated_at(t)
+        hours = _duration_hours(analytics_created_at(t), resolved_end)
+        resolved_ends.append(resolved_end)
+        mttr_values.append(hours)
+        (mttr_after_values if _is_ia_ticket(t) else mttr_before_values).append(hours)
+        if t.priority in mttr_priority_values:
+            mttr_priority_values[t.priority].append(hours)
+        if t.category in mttr_category_values:
+            mttr_category_values[t.category].append(hours)
+
+    mttr_before = _avg(mttr_before_values)
+    mttr_after = _avg(mttr_after_values)
+
+    # One scan collects reassignment, first-action, auto-assignment and
+    # classification tallies; the prediction checks are shared by the
+    # classification accuracy and the auto-triage no-correction rate.
+    reassigned_tickets = 0
     first_action_values: list[float] = []
+    auto_assign_samples = 0
+    auto_assign_correct = 0
+    classification_samples = 0
+    classification_correct = 0
+    auto_triage_no_correction_count = 0
     for ticket in tickets:
+        unchanged_assignment = int(ticket.assignment_change_count or 0) == 0
+        if not unchanged_assignment:
+            reassigned_tickets += 1
         first_action = analytics_first_action_at(ticket)
-        if first_action is None:
-            continue
-        first_action_values.append(_duration_hours(analytics_created_at(ticket), first_action))
+        if first_action is not None:
+            first_action_values.append(_duration_hours(analytics_created_at(ticket), first_action))
+        checks, matches = _prediction_matches(ticket)
+        if checks:
+            classification_samples += 1
+            if checks == matches:
+                classification_correct += 1
+        if _is_ia_ticket(ticket):
+            auto_assign_samples += 1
+            if unchanged_assignment:
+                auto_assign_correct += 1
+                if checks == matches:
+                    auto_triage_no_correction_count += 1
+
+    reassignment_rate = round((reassigned_tickets / total) * 100, 2) if total else 0.0
     avg_first_action = _avg(first_action_values)
     median_first_action = _median(first_action_values)
-
-    auto_assigned = [t for t in tickets if _is_ia_ticket(t)]
-    auto_assign_samples = len(auto_assigned)
-    auto_assign_correct = sum(1 for t in auto_assigned if int(t.assignment_change_count or 0) == 0)
     auto_assign_accuracy = (
         round((auto_assign_correct / auto_assign_samples) * 100, 2)
         if auto_assign_samples
         else None
     )
 
-    classified = [
-        t
-        for t in tickets
-        if (
-            getattr(t, "predicted_priority", None) is not None
-            or getattr(t, "predicted_ticket_type", None) is not None
-            or getattr(t, "predicted_category", None) is not None
-        )
-    ]
-    classification_samples = len(classified)
-    classification_correct = 0
-    for ticket in classified:
-        checks = 0
-        matches = 0
-        if getattr(ticket, "predicted_priority", None) is not None:
-            checks += 1
-            if ticket.predicted_priority == ticket.priority:
-                matches += 1
-        if getattr(ticket, "predicted_ticket_type", None) is not None:
-            checks += 1
-            if ticket.predicted_ticket_type == ticket.ticket_type:
-                matches += 1
-        if getattr(ticket, "predicted_category", None) is not None:
-            checks += 1
-            if ticket.predicted_category == ticket.category:
-                matches += 1
-        if checks > 0 and checks == matches:
-            classification_correct += 1
-
     classification_accuracy = (
         round((classification_correct / classification_samples) * 100, 2)
         if classification_samples
@@ -1245,38 +1559,19 @@ def compute_assignment_performance(
     except Exception:  # noqa: BLE001
         logger.debug("Failed to compute confidence distribution from classification log.", exc_info=True)
 
-    mttr_values = [
-        _duration_hours(analytics_created_at(t), analytics_resolved_at(t) or analytics_updated_at(t))
-        for t in resolved_tickets
-    ]
     mttr_global = _avg(mttr_values)
     mttr_p90 = _percentile(mttr_values, 0.9)
 
-    mttr_by_priority: dict[str, float | None] = {}
-    for priority in TicketPriority:
-        scoped = [
-            _duration_hours(analytics_created_at(t), analytics_resolved_at(t) or analytics_updated_at(t))
-            for t in resolved_tickets
-            if t.priority == priority
-        ]
-        mttr_by_priority[priority.value] = _avg(scoped)
-
-    mttr_by_category: dict[str, float | None] = {}
-    for category_value in TicketCategory:
-        scoped = [
-            _duration_hours(analytics_created_at(t), analytics_resolved_at(t) or analytics_updated_at(t))
-            for t in resolved_tickets
-            if t.category == category_value
-        ]
-        mttr_by_category[category_value.value] = _avg(scoped)
+    mttr_by_priority: dict[str, float | None] = {
+        priority.value: _avg(values) for priority, values in mttr_priority_values.items()
+    }
+    mttr_by_category: dict[str, float | None] = {
+        category_value.value: _avg(values) for category_value, values in mttr_category_values.items()
+    }
 
     throughput_window_days = 7
     throughput_cutoff = now - dt.timedelta(days=throughput_window_days)
-    throughput_resolved_7d = sum(
-        1
-        for t in resolved_tickets
-        if (analytics_resolved_at(t) or analytics_updated_at(t)) >= throughput_cutoff
-    )
+    throughput_resolved_7d = sum(1 for resolved_end in resolved_ends if resolved_end >= throughput_cutoff)
 
     backlog_threshold_days = 7
     backlog_cutoff = now - dt.timedelta(days=backlog_threshold_days)
@@ -1286,29 +1581,7 @@ def compute_assignment_performance(
         if t.status in ACTIVE_STATUSES and analytics_created_at(t) < backlog_cutoff
     )
 
-    auto_triage_samples = sum(1 for t in tickets if _is_ia_ticket(t))
-    auto_triage_no_correction_count = 0
-    for ticket in tickets:
-        if not _is_ia_ticket(ticket):
-            continue
-        assignment_ok = int(ticket.assignment_change_count or 0) == 0
-        predicted_checks = 0
-        predicted_matches = 0
-        if ticket.predicted_priority is not None:
-            predicted_checks += 1
-            if ticket.predicted_priority == ticket.priority:
-                predicted_matches += 1
-        if ticket.predicted_ticket_type is not None:
-            predicted_checks += 1
-            if ticket.predicted_ticket_type == ticket.ticket_type:
-                predicted_matches += 1
-        if ticket.predicted_category is not None:
-            predicted_checks += 1
-            if ticket.predicted_category == ticket.category:
-                predicted_matches += 1
-        triage_ok = predicted_checks == 0 or predicted_checks == predicted_matches
-        if assignment_ok and triage_ok:
-            auto_triage_no_correction_count += 1
+    auto_triage_samples = auto_assign_samples
     auto_triage_no_correction_rate = (
         round((auto_triage_no_correction_count / auto_triage_samples) * 100, 2)
         if auto_triage_samples
@@ -1424,100 +1697,84 @@ def compute_assignment_performance(
     }
 
 
+CATEGORY_BREAKDOWN_LABELS: tuple[tuple[TicketCategory, str], ...] = (
+    (TicketCategory.infrastructure, "Infrastructure"),
+    (TicketCategory.network, "Reseau"),
+    (TicketCategory.security, "Securite"),
+    (TicketCategory.application, "Application"),
+    (TicketCategory.service_request, "Demande de service"),
+    (TicketCategory.hardware, "Materiel"),
+    (TicketCategory.email, "Email"),
+    (TicketCategory.problem, "Probleme"),
+)
+TYPE_BREAKDOWN_LABELS: tuple[tuple[TicketType, str], ...] = (
+    (TicketType.incident, "Incident"),
+    (TicketType.service_request, "Service request"),
+)
+PRIORITY_BREAKDOWN_LABELS: tuple[tuple[TicketPriority, str, str], ...] = (
+    (TicketPriority.critical, "Critique", "#dc2626"),
+    (TicketPriority.high, "Haute", "#f59e0b"),
+    (TicketPriority.medium, "Moyenne", "#2e9461"),
+    (TicketPriority.low, "Basse", "#64748b"),
+)
+
+
 def compute_category_breakdown(tickets: list[Ticket]) -> list[dict]:
-    categories = [
-        TicketCategory.infrastructure,
-        TicketCategory.network,
-        TicketCategory.security,
-        TicketCategory.application,
-        TicketCategory.service_request,
-        TicketCategory.hardware,
-        TicketCategory.email,
-        TicketCategory.problem,
-    ]
-    labels = {
-        TicketCategory.infrastructure: "Infrastructure",
-        TicketCategory.network: "Reseau",
-        TicketCategory.security: "Securite",
-        TicketCategory.application: "Application",
-        TicketCategory.service_request: "Demande de service",
-        TicketCategory.hardware: "Materiel",
-        TicketCategory.email: "Email",
-        TicketCategory.problem: "Probleme",
-    }
-    return [
-        {"category": labels[c], "count": sum(1 for t in tickets if t.category == c)}
-        for c in categories
-    ]
+    counts = Counter(t.category for t in tickets)
+    return [{"category": label, "count": counts.get(c, 0)} for c, label in CATEGORY_BREAKDOWN_LABELS]
 
 
 def compute_type_breakdown(tickets: list[Ticket]) -> list[dict]:
-    ticket_types = [
-        TicketType.incident,
-        TicketType.service_request,
-    ]
-    labels = {
-        TicketType.incident: "Incident",
-        TicketType.service_request: "Service request",
-    }
+    counts = Counter(ticket.ticket_type for ticket in tickets)
     return [
-        {"ticket_type": labels[ticket_type], "count": sum(1 for ticket in tickets if ticket.ticket_type == ticket_type)}
-        for ticket_type in ticket_types
+        {"ticket_type": label, "count": counts.get(ticket_type, 0)}
+        for ticket_type, label in TYPE_BREAKDOWN_LABELS
     ]
 
 
 def compute_priority_breakdown(tickets: list[Ticket]) -> list[dict]:
-    priorities = [
-        TicketPriority.critical,
-        TicketPriority.high,
-        TicketPriority.medium,
-        TicketPriority.low,
-    ]
-    labels = {
-        TicketPriority.critical: "Critique",
-        TicketPriority.high: "Haute",
-        TicketPriority.medium: "Moyenne",
-        TicketPriority.low: "Basse",
-    }
-    colors = {
-        TicketPriority.critical: "#dc2626",
-        TicketPriority.high: "#f59e0b",
-        TicketPriority.medium: "#2e9461",
-        TicketPriority.low: "#64748b",
-    }
+    counts = Counter(t.priority for t in tickets)
     return [
-        {
-            "priority": labels[p],
-            "count": sum(1 for t in tickets if t.priority == p),
-            "fill": colors[p],
-        }
-        for p in priorities
+        {"priority": label, "count": counts.get(p, 0), "fill": color}
+        for p, label, color in PRIORITY_BREAKDOWN_LABELS
     ]
 
 
 def compute_weekly_trends(tickets: list[Ticket], weeks: int = 6) -> list[dict]:
     now = dt.datetime.now(dt.timezone.utc)
-    buckets = []
-    for i in range(weeks):
-        start = (now - dt.timedelta(weeks=weeks - i)).replace(hour=0, minute=0, second=0, microsecond=0)
-        end = start + dt.timedelta(weeks=1)
-        opened = sum(1 for t in tickets if start <= analytics_created_at(t) < end)
-        closed = sum(
-            1
-            for t in tickets
-            if t.status in RESOLVED_STATUSES and start <= (analytics_resolved_at(t) or analytics_updated_at(t)) < end
-        )
-        pending = sum(
-            1
-            for t in tickets
-            if _is_waiting_status(t.status) and start <= analytics_updated_at(t) < end
-        )
-        buckets.append({"week": f"Sem {i + 1}", "opened": opened, "closed": closed, "pending": pending})
-    return buckets
+    # Week i covers [origin + i weeks, origin + (i + 1) weeks), so each timestamp
+    # maps to its bucket with one floor division instead of a scan per week.
+    origin = (now - dt.timedelta(weeks=weeks)).replace(hour=0, minute=0, second=0, microsecond=0)
+    week = dt.timedelta(weeks=1)
+    opened = [0] * weeks
+    closed = [0] * weeks
+    pending = [0] * weeks
+    for ticket in tickets:
+        index = (analytics_created_at(ticket) - origin) // week
+        if 0 <= index < weeks:
+            opened[index] += 1
+        if ticket.status in RESOLVED_STATUSES:
+            index = ((analytics_resolved_at(ticket) or analytics_updated_at(ticket)) - origin) // week
+            if 0 <= index < weeks:
+                closed[index] += 1
+        elif _is_waiting_status(ticket.status):
+            index = (analytics_updated_at(ticket) - origin) // week
+            if 0 <= index < weeks:
+                pending[index] += 1
+    return [
+        {"week": f"Sem {i + 1}", "opened": opened[i], "closed": closed[i], "pending": pending[i]}
+        for i in range(weeks)
+    ]
+
+
+_ZERO_OFFSET = dt.timedelta(0)
 
 
 def _to_utc(value: dt.datetime) -> dt.datetime:
-    if value.tzinfo is None:
+    tzinfo = value.tzinfo
+    if tzinfo is dt.timezone.utc:
+        return value
+    if tzinfo is None or value.utcoffset() == _ZERO_OFFSET:
         return value.replace(tzinfo=dt.timezone.utc)
     return value.astimezone(dt.timezone.utc)
 
@@ -1549,19 +1806,27 @@ def _days_since(value: dt.datetime, *, now: dt.datetime) -> int:
     return max(0, int(delta.total_seconds() // 86400))
 
 
+_PRIORITY_RANK = {
+    TicketPriority.critical: 0,
+    TicketPriority.high: 1,
+    TicketPriority.medium: 2,
+    TicketPriority.low: 3,
+}
+_PRIORITY_LABELS_BY_RANK = ("critical", "high", "medium", "low")
+_LOWEST_PRIORITY_RANK = len(_PRIORITY_LABELS_BY_RANK) - 1
+
+
 def _priority_rank(priority: TicketPriority) -> int:
-    order = {
-        TicketPriority.critical: 0,
-        TicketPriority.high: 1,
-        TicketPriority.medium: 2,
-        TicketPriority.low: 3,
-    }
-    return order.get(priority, 99)
+    return _PRIORITY_RANK.get(priority, 99)
 
 
-def _ticket_insight_payload(ticket: Ticket, *, now: dt.datetime) -> dict:
-    created = analytics_created_at(ticket)
-    updated = analytics_updated_at(ticket)
+def _ticket_insight_payload(
+    ticket: Ticket,
+    *,
+    now: dt.datetime,
+    created: dt.datetime,
+    updated: dt.datetime,
+) -> dict:
     ticket_type = ticket.ticket_type or TicketType.service_request
     return {
         "id": ticket.id,
@@ -1592,30 +1857,51 @@ def compute_operational_insights(
     recent_cutoff = now - dt.timedelta(days=recent_window_days)
     stale_cutoff = now - dt.timedelta(days=stale_window_days)
 
-    active_tickets = [t for t in tickets if t.status in ACTIVE_STATUSES]
-
-    critical_recent = [
-        t
-        for t in active_tickets
-        if t.priority == TicketPriority.critical and analytics_created_at(t) >= recent_cutoff
-    ]
-    critical_recent.sort(key=analytics_created_at, reverse=True)
+    # Partition active tickets in one pass. Only the stale filter needs every
+    # active ticket's updated-at; created-at is normalized for critical tickets
+    # and, later, for the few stale rows that reach the payload.
+    created_at: dict[str, dt.datetime] = {}
+    updated_at: dict[str, dt.datetime] = {}
+    critical_recent: list[Ticket] = []
+    stale_active: list[Ticket] = []
+    active_statuses = ACTIVE_STATUSES
+    critical = TicketPriority.critical
+    for t in tickets:
+        if t.status not in active_statuses:
+            continue
+        updated = updated_at[t.id] = analytics_updated_at(t)
+        if t.priority == critical:
+            created = created_at[t.id] = analytics_created_at(t)
+            if created >= recent_cutoff:
+                critical_recent.append(t)
+        if updated <= stale_cutoff:
+            stale_active.append(t)
+
+    # Only top_n rows survive, so select them with a bounded heap instead of
+    # sorting every candidate.
+    critical_recent = heapq.nlargest(top_n, critical_recent, key=lambda t: created_at[t.id])
+    stale_active = heapq.nsmallest(
+        top_n,
+        stale_active,
+        # Inactive days only fall as updated-at grows, so ordering by
+        # updated-at alone yields the same (rank, -inactive_days, updated) order
+        # without building a timedelta per candidate.
+        key=lambda t: (_priority_rank(t.priority), updated_at[t.id]),
+    )
 
-    stale_active = [
-        t
-        for t in active_tickets
-        if analytics_updated_at(t) <= stale_cutoff
+    critical_recent_rows = [
+        _ticket_insight_payload(ticket, now=now, created=created_at[ticket.id], updated=updated_at[ticket.id])
+        for ticket in critical_recent
     ]
-    stale_active.sort(
-        key=lambda t: (
-            _priority_rank(t.priority),
-            -_days_since(analytics_updated_at(t), now=now),
-            analytics_updated_at(t),
+    stale_active_rows = [
+        _ticket_insight_payload(
+            ticket,
+            now=now,
+            created=created_at.get(ticket.id) or analytics_created_at(ticket),
+            updated=updated_at[ticket.id],
         )
-    )
-
-    critical_recent_rows = [_ticket_insight_payload(ticket, now=now) for ticket in critical_recent[:top_n]]
-    stale_active_rows = [_ticket_insight_payload(ticket, now=now) for ticket in stale_active[:top_n]]
+        for ticket in stale_active
+    ]
 
     return {
         "critical_recent": critical_recent_rows,
@@ -1634,40 +1920,78 @@ def compute_problem_insights(tickets: list[Ticket], *, min_repetitions: int = 2,
         return []
 
     now = dt.datetime.now(dt.timezone.utc)
-    insights: list[dict] = []
-
-    def _cluster_to_payload(cluster: list[Ticket], *, problem_id: str | None) -> dict:
-        cluster_sorted = sorted(cluster, key=analytics_updated_at, reverse=True)
-        active_count = sum(1 for t in cluster if t.status in ACTIVE_STATUSES)
-        problem_count = 1 if problem_id else sum(1 for t in cluster if t.category == TicketCategory.problem)
-        highest_priority = "low"
-        if any(t.priority == TicketPriority.critical for t in cluster):
-            highest_priority = "critical"
-        elif any(t.priority == TicketPriority.high for t in cluster):
-            highest_priority = "high"
-        elif any(t.priority == TicketPriority.medium for t in cluster):
-            highest_priority = "medium"
-
+    # (rank key, newest-first cluster, summary) per cluster; display fields and
+    # the recommendation are only built for the clusters that survive the limit.
+    ranked: list[tuple[tuple[int, int, int, int, int], list[Ticket], dict]] = []
+    # Filled once the linked/unlinked split is known, so tickets in linked
+    # groups below min_repetitions never pay for timestamp normalization.
+    updated_at: dict[str, dt.datetime] = {}
+
+    active_statuses = ACTIVE_STATUSES
+    problem_category = TicketCategory.problem
+    priority_rank = _PRIORITY_RANK.get
+
+    def _updated_key(ticket: Ticket) -> dt.datetime:
+        return updated_at[ticket.id]
+
+    def _rank_cluster(cluster: list[Ticket], *, problem_id: str | None, presorted: bool = False) -> None:
+        cluster_sorted = cluster if presorted else sorted(cluster, key=_updated_key, reverse=True)
+        active_count = 0
+        category_problem_count = 0
+        best_rank = _LOWEST_PRIORITY_RANK
+        for t in cluster:
+            if t.status in active_statuses:
+                active_count += 1
+            if t.category == problem_category:
+                category_problem_count += 1
+            rank = priority_rank(t.priority, _LOWEST_PRIORITY_RANK)
+            if rank < best_rank:
+                best_rank = rank
+        problem_count = 1 if problem_id else category_problem_count
+        highest_priority = _PRIORITY_LABELS_BY_RANK[best_rank]
+
+        # Each ticket lands in at most one cluster, so creation timestamps are
+        # normalized here exactly once per clustered ticket.
         recent_occurrences_7d, same_day_peak, same_day_peak_date = _cluster_temporal_counts(cluster_sorted, now=now)
         trigger_reasons = _problem_trigger_reasons(recent_occurrences_7d, same_day_peak)
         problem_triggered = bool(trigger_reasons)
-        ai_recommendation, ai_recommendation_confidence = _build_problem_ai_recommendation(cluster_sorted)
-
-        return {
+        summary = {
             "problem_id": problem_id,
-            "title": cluster_sorted[0].title,
-            "occurrences": len(cluster_sorted),
             "active_count": active_count,
             "problem_count": problem_count,
             "highest_priority": highest_priority,
-            "latest_ticket_id": cluster_sorted[0].id,
-            "latest_updated_at": analytics_updated_at(cluster_sorted[0]).isoformat(),
-            "ticket_ids": [t.id for t in cluster_sorted[:5]],
             "problem_triggered": problem_triggered,
             "trigger_reasons": trigger_reasons,
             "recent_occurrences_7d": recent_occurrences_7d,
             "same_day_peak": same_day_peak,
             "same_day_peak_date": same_day_peak_date,
+        }
+        rank_key = (
+            int(problem_triggered),
+            problem_count,
+            _LOWEST_PRIORITY_RANK - best_rank,
+            len(cluster_sorted),
+            active_count,
+        )
+        ranked.append((rank_key, cluster_sorted, summary))
+
+    def _cluster_to_payload(cluster_sorted: list[Ticket], summary: dict) -> dict:
+        ai_recommendation, ai_recommendation_confidence = _build_problem_ai_recommendation(cluster_sorted)
+        return {
+            "problem_id": summary["problem_id"],
+            "title": cluster_sorted[0].title,
+            "occurrences": len(cluster_sorted),
+            "active_count": summary["active_count"],
+            "problem_count": summary["problem_count"],
+            "highest_priority": summary["highest_priority"],
+            "latest_ticket_id": cluster_sorted[0].id,
+            "latest_updated_at": updated_at[cluster_sorted[0].id].isoformat(),
+            "ticket_ids": [t.id for t in cluster_sorted[:5]],
+            "problem_triggered": summary["problem_triggered"],
+            "trigger_reasons": summary["trigger_reasons"],
+            "recent_occurrences_7d": summary["recent_occurrences_7d"],
+            "same_day_peak": summary["same_day_peak"],
+            "same_day_peak_date": summary["same_day_peak_date"],
             "ai_recommendation": ai_recommendation,
             "ai_recommendation_confidence": ai_recommendation_confidence,
         }
@@ -1683,40 +2007,44 @@ def compute_problem_insights(tickets: list[Ticket], *, min_repetitions: int = 2,
     for problem_id, cluster in linked_groups.items():
         if len(cluster) < min_repetitions:
             continue
-        insights.append(_cluster_to_payload(cluster, problem_id=problem_id))
-
-    sorted_tickets = sorted(unlinked, key=analytics_updated_at, reverse=True)
-    signatures = {t.id: _incident_signature(t) for t in sorted_tickets}
-    visited: set[str] = set()
-
-    for ticket in sorted_tickets:
-        if ticket.id in visited:
+        for t in cluster:
+            updated_at[t.id] = analytics_updated_at(t)
+        _rank_cluster(cluster, problem_id=problem_id)
+
+    for t in unlinked:
+        updated_at[t.id] = analytics_updated_at(t)
+
+    sorted_tickets = sorted(unlinked, key=_updated_key, reverse=True)
+    signatures = [_incident_signature(t) for t in sorted_tickets]
+    # Inverted index token -> positions in sorted_tickets: only tickets sharing
+    # at least one token can reach the overlap threshold, so each seed is
+    # compared against its postings instead of the whole backlog.
+    postings: dict[str, list[int]] = defaultdict(list)
+    for position, signature in enumerate(signatures):
+        for token in signature:
+            postings[token].append(position)
+    visited = bytearray(len(sorted_tickets))
+
+    for position, ticket in enumerate(sorted_tickets):
+        if visited[position]:
             continue
 
-        seed_sig = signatures.get(ticket.id, set())
+        seed_sig = signatures[position]
+        seed_len = len(seed_sig)
         cluster: list[Ticket] = [ticket]
-        visited.add(ticket.id)
-        for other in sorted_tickets:
-            if other.id in visited:
+        visited[position] = 1
+        candidates = {other_position for token in seed_sig for other_position in postings[token]}
+        for other_position in sorted(candidates):
+            if visited[other_position]:
                 continue
-            other_sig = signatures.get(other.id, set())
-            if _signature_overlap(seed_sig, other_sig) >= 0.6:
-                cluster.append(other)
-                visited.add(other.id)
+            if _signature_overlap_at_least(seed_sig, signatures[other_position], 0.6, left_len=seed_len):
+                cluster.append(sorted_tickets[other_position])
+                visited[other_position] = 1
 
         if len(cluster) < min_repetitions:
             continue
-        insights.append(_cluster_to_payload(cluster, problem_id=None))
-
-    priority_weight = {"critical": 3, "high": 2, "medium": 1, "low": 0}
-    insights.sort(
-        key=lambda item: (
-            int(bool(item.get("problem_triggered"))),
-            item["problem_count"],
-            priority_weight.get(item["highest_priority"], 0),
-            item["occurrences"],
-            item["active_count"],
-        ),
-        reverse=True,
-    )
-    return insights[:limit]
+        # Clusters are gathered in sorted_tickets order, already newest first.
+        _rank_cluster(cluster, problem_id=None, presorted=True)
+
+    ranked.sort(key=itemgetter(0), reverse=True)
+    return [_cluster_to_payload(cluster_sorted, summary) for _, cluster_sorted, summary in ranked[:limit]]
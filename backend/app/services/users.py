@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Callable
 from uuid import UUID
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.integrations.jira.roles import sync_jira_project_roles_for_user
 from app.models.user import User
@@ -13,9 +14,38 @@ from app.models.enums import SeniorityLevel, UserRole
 
 logger = logging.getLogger(__name__)
 
+# Columns rendered by UserOut / UserAssigneeOut. Credentials and lockout state
+# stay deferred so listings never ship password hashes or OAuth ids.
+_USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.name,
+    User.role,
+    User.is_verified,
+    User.created_at,
+    User.specializations,
+    User.seniority_level,
+    User.is_available,
+    User.max_concurrent_tickets,
+)
+_ASSIGNEE_LIST_COLUMNS = (
+    User.id,
+    User.name,
+    User.role,
+    User.specializations,
+    User.seniority_level,
+    User.is_available,
+    User.max_concurrent_tickets,
+)
+
 
 def list_users(db: Session) -> list[User]:
-    return db.query(User).order_by(User.created_at.desc()).all()
+    return (
+        db.query(User)
+        .options(load_only(*_USER_LIST_COLUMNS))
+        .order_by(User.created_at.desc())
+        .all()
+    )
 
 
 def _normalize_assignable_role(role: UserRole) -> UserRole:
@@ -24,18 +54,36 @@ def _normalize_assignable_role(role: UserRole) -> UserRole:
     return UserRole.user if role == UserRole.viewer else role
 
 
-def update_role(db: Session, user_id: str, role: UserRole) -> User | None:
-    try:
-        user_uuid = UUID(user_id)
-    except ValueError:
+def _get_user(db: Session, user_id: UUID, *, action: str) -> User | None:
+    user = db.get(User, user_id)
+    if not user:
+        logger.warning("User %s failed (not found): %s", action, user_id)
+    return user
+
+
+def _update_user(
+    db: Session,
+    user_id: UUID,
+    mutator: Callable[[User], None],
+    *,
+    action: str,
+) -> User | None:
+    # The instance is already persistent, so the commit alone emits the UPDATE;
+    # attributes expired by the commit reload lazily when the caller reads them.
+    user = _get_user(db, user_id, action=action)
+    if not user:
         return None
-    user = db.get(User, user_uuid)
+    mutator(user)
+    db.commit()
+    return user
+
+
+def update_role(db: Session, user_id: UUID, role: UserRole) -> User | None:
+    user = _get_user(db, user_id, action="role update")
     if not user:
-        logger.warning("User role update failed (not found): %s", user_id)
         return None
     normalized_role = _normalize_assignable_role(role)
     user.role = normalized_role
-    db.add(user)
     db.flush()
     try:
         sync_jira_project_roles_for_user(user)
@@ -44,36 +92,23 @@ def update_role(db: Session, user_id: str, role: UserRole) -> User | None:
         logger.warning("User role update failed during Jira sync for %s: %s", user.email, exc)
         raise
     db.commit()
-    db.refresh(user)
     logger.info("User role updated: %s -> %s", user.email, normalized_role.value)
     return user
 
 
-def update_seniority(db: Session, user_id: str, seniority_level: SeniorityLevel) -> User | None:
-    try:
-        user_uuid = UUID(user_id)
-    except ValueError:
-        return None
-    user = db.get(User, user_uuid)
-    if not user:
-        logger.warning("User seniority update failed (not found): %s", user_id)
-        return None
-    user.seniority_level = seniority_level
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    logger.info("User seniority updated: %s -> %s", user.email, seniority_level.value)
+def update_seniority(db: Session, user_id: UUID, seniority_level: SeniorityLevel) -> User | None:
+    def apply(user: User) -> None:
+        user.seniority_level = seniority_level
+
+    user = _update_user(db, user_id, apply, action="seniority update")
+    if user:
+        logger.info("User seniority updated: %s -> %s", user.email, seniority_level.value)
     return user
 
 
-def delete_user(db: Session, user_id: str) -> bool:
-    try:
-        user_uuid = UUID(user_id)
-    except ValueError:
-        return False
-    user = db.get(User, user_uuid)
+def delete_user(db: Session, user_id: UUID) -> bool:
+    user = _get_user(db, user_id, action="delete")
     if not user:
-        logger.warning("User delete failed (not found): %s", user_id)
         return False
     db.delete(user)
     db.commit()
@@ -81,27 +116,25 @@ def delete_user(db: Session, user_id: str) -> bool:
     return True
 
 
-def update_specializations(db: Session, user_id: str, specializations: list[str]) -> User | None:
-    try:
-        user_uuid = UUID(user_id)
-    except ValueError:
-        return None
-    user = db.get(User, user_uuid)
-    if not user:
-        logger.warning("User specializations update failed (not found): %s", user_id)
-        return None
-    user.specializations = [s for s in specializations if s]
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    logger.info("User specializations updated: %s", user.email)
+def update_specializations(db: Session, user_id: UUID, specializations: list[str]) -> User | None:
+    def apply(user: User) -> None:
+        user.specializations = [s for s in specializations if s]
+
+    user = _update_user(db, user_id, apply, action="specializations update")
+    if user:
+        logger.info("User specializations updated: %s", user.email)
     return user
 
 
 def list_assignees(db: Session) -> list[User]:
     return (
         db.query(User)
+        .options(load_only(*_ASSIGNEE_LIST_COLUMNS))
         .filter(User.role.in_([UserRole.admin, UserRole.agent]))
         .order_by(User.name.asc())
         .all()
     )
+
+
+def assignee_name_map(db: Session) -> dict[str, str]:
+    return {user.name.casefold(): user.name for user in list_assignees(db)}
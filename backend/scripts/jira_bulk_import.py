@@ -10,15 +10,23 @@ Usage examples (PowerShell):
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import heapq
+import importlib.util
 import json
+import random
 import re
+import sqlite3
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
-from sqlalchemy.orm import selectinload
+import orjson
+from sqlalchemy.orm import Query, Session, load_only, raiseload, selectinload
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE_DIR))
@@ -26,7 +34,7 @@ sys.path.append(str(BASE_DIR))
 from app.core.config import settings  # noqa: E402
 from app.db.session import SessionLocal  # noqa: E402
 from app.models.enums import TicketPriority, TicketStatus, UserRole  # noqa: E402
-from app.models.ticket import Ticket  # noqa: E402
+from app.models.ticket import Ticket, TicketComment  # noqa: E402
 from app.models.user import User  # noqa: E402
 
 SEARCH_JQL_PATH = "/rest/api/3/search/jql"
@@ -34,7 +42,6 @@ PROJECT_PATH = "/rest/api/3/project/{project_key}"
 PRIORITIES_PATH = "/rest/api/3/priority"
 CREATEMETA_ISSUETYPE_PATH = "/rest/api/3/issue/createmeta/{project_key}/issuetypes/{issue_type_id}"
 CREATE_ISSUE_PATH = "/rest/api/3/issue"
-CREATE_COMMENT_PATH = "/rest/api/3/issue/{issue_key}/comment"
 ISSUE_PATH = "/rest/api/3/issue/{issue_key}"
 USER_SEARCH_PATH = "/rest/api/3/user/search"
 CREATE_USER_PATH = "/rest/api/3/user"
@@ -43,9 +50,43 @@ MAX_SUMMARY_LEN = 255
 MAX_LABELS = 12
 SOURCE_LABEL = "source_local_itsm"
 SEED_LABEL_PREFIX = "twseed_"
+SEED_LABEL_QUERY_CHUNK = 50
+TICKET_BATCH_SIZE = 100
+MAX_REQUEST_RETRIES = 4
+MAX_BACKOFF_SECONDS = 30.0
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+SEED_LOOKUP_DELAYS = (1.0, 2.0, 4.0, 8.0)
+META_CACHE_PATH = BASE_DIR / ".jira_meta_cache.json"
+IMPORT_STATE_PATH = BASE_DIR / ".jira_import_state.sqlite"
+# httpx only speaks HTTP/2 when the optional h2 package (httpx[http2]) is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 LABEL_SAFE_RE = re.compile(r"[^a-zA-Z0-9_-]+")
 
+# Columns read when building Jira payloads; SLA, AI and raw payload columns stay unloaded.
+TICKET_IMPORT_COLUMNS = (
+    Ticket.id,
+    Ticket.title,
+    Ticket.description,
+    Ticket.resolution,
+    Ticket.reporter,
+    Ticket.assignee,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.category,
+    Ticket.tags,
+    Ticket.created_at,
+)
+COMMENT_IMPORT_COLUMNS = (
+    TicketComment.id,
+    TicketComment.ticket_id,
+    TicketComment.author,
+    TicketComment.content,
+    TicketComment.created_at,
+)
+# Placeholder body for empty text; payloads are only serialized, never mutated.
+_EMPTY_ADF_PARAGRAPHS = ({"type": "paragraph", "content": [{"type": "text", "text": "-"}]},)
+
 PRIORITY_TO_JIRA = {
     TicketPriority.critical: "Highest",
     TicketPriority.high: "High",
@@ -75,7 +116,25 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--project-key", default="", help="Override Jira project key (else JIRA_PROJECT_KEY)")
     parser.add_argument("--issue-type", default="", help="Preferred Jira issue type name (e.g. Incident)")
     parser.add_argument("--max-comments", type=int, default=8, help="Max comments imported per ticket")
-    parser.add_argument("--sleep-ms", type=int, default=80, help="Delay between write requests (ms)")
+    parser.add_argument(
+        "--sleep-ms",
+        type=int,
+        default=80,
+        help="Spacing between requests until Jira advertises its own rate limit (ms, 0 disables)",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="Max tickets pushed to Jira concurrently")
+    parser.add_argument(
+        "--meta-ttl-hours",
+        type=float,
+        default=24.0,
+        help="Reuse cached Jira metadata (issue types, priorities, fields, roles) younger than this",
+    )
+    parser.add_argument("--refresh-meta", action="store_true", help="Ignore the Jira metadata cache and refetch it")
+    parser.add_argument(
+        "--no-state-cache",
+        action="store_true",
+        help="Ignore the local resume log and look up every existing issue in Jira",
+    )
     parser.add_argument(
         "--user-products",
         default="jira-servicedesk",
@@ -136,6 +195,8 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# Status, category, priority and tag labels repeat across most tickets.
+@lru_cache(maxsize=4096)
 def _sanitize_label(value: str) -> str:
     cleaned = LABEL_SAFE_RE.sub("_", (value or "").strip().lower()).strip("_")
     return cleaned[:255]
@@ -154,45 +215,233 @@ def _truncate(text: str, *, max_len: int) -> str:
 
 
 def _adf_from_text(text: str) -> dict[str, Any]:
-    paragraphs = []
-    for line in (text or "").splitlines():
-        clean = line.strip()
-        if not clean:
+    paragraphs = [
+        {"type": "paragraph", "content": [{"type": "text", "text": clean[:32000]}]}
+        for line in (text or "").splitlines()
+        if (clean := line.strip())
+    ]
+    return {"type": "doc", "version": 1, "content": paragraphs or list(_EMPTY_ADF_PARAGRAPHS)}
+
+
+def _header_float(response: httpx.Response, name: str) -> float | None:
+    try:
+        value = float(response.headers.get(name, ""))
+    except ValueError:
+        return None
+    return value if value >= 0 else None
+
+
+class _TokenBucket:
+    """Client-side token bucket shared by every request of the import.
+
+    It starts from the ``--sleep-ms`` cadence and switches to the rate Jira
+    advertises through its ``X-RateLimit-*`` headers as soon as one arrives.
+    """
+
+    def __init__(self, *, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, _request: httpx.Request | None = None) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    async def observe(self, response: httpx.Response) -> None:
+        fill_rate = _header_float(response, "x-ratelimit-fillrate")
+        if fill_rate:
+            interval = _header_float(response, "x-ratelimit-interval-seconds") or 1.0
+            self._refill()
+            self.rate = fill_rate / interval
+        limit = _header_float(response, "x-ratelimit-limit")
+        if limit:
+            self.capacity = limit
+        remaining = _header_float(response, "x-ratelimit-remaining")
+        if remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+
+
+def _backoff_seconds(attempt: int) -> float:
+    # Full jitter keeps concurrent workers from retrying in lockstep.
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, float(2**attempt)))
+
+
+def _retry_after_seconds(response: httpx.Response, attempt: int) -> float:
+    retry_after = _header_float(response, "retry-after")
+    return retry_after if retry_after is not None else _backoff_seconds(attempt)
+
+
+async def _jira_send(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    payload: Any = None,
+    idempotent: bool | None = None,
+) -> httpx.Response:
+    """Send one Jira request, retrying rate limits and transient failures.
+
+    429 responses are always retried since Jira rejected the request without
+    processing it. 5xx responses and transport errors are only retried for
+    idempotent requests (GET and field-setting PUTs by default), because a
+    POST may have taken effect before the failure was reported.
+    """
+    # Relative API paths resolve against the client's base_url; absolute URLs
+    # returned by Jira (project role links) are used as-is. The body is
+    # encoded once and reused on retries.
+    if idempotent is None:
+        idempotent = method in {"GET", "PUT"}
+    content = orjson.dumps(payload) if payload is not None else None
+    headers = {"Content-Type": "application/json"} if content is not None else None
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+        last_attempt = attempt == MAX_REQUEST_RETRIES
+        try:
+            response = await client.request(method, url, params=params, content=content, headers=headers)
+        except httpx.TransportError:
+            if not idempotent or last_attempt:
+                raise
+            await asyncio.sleep(_backoff_seconds(attempt))
             continue
-        paragraphs.append(
-            {
-                "type": "paragraph",
-                "content": [{"type": "text", "text": clean[:32000]}],
-            }
-        )
-    if not paragraphs:
-        paragraphs = [{"type": "paragraph", "content": [{"type": "text", "text": "-"}]}]
-    return {"type": "doc", "version": 1, "content": paragraphs}
+        if last_attempt:
+            return response
+        if response.status_code == 429:
+            await asyncio.sleep(_retry_after_seconds(response, attempt))
+        elif idempotent and response.status_code in TRANSIENT_STATUS_CODES:
+            await asyncio.sleep(_backoff_seconds(attempt))
+        else:
+            return response
+    return response
 
 
-def _jira_get(client: httpx.Client, path: str, *, params: dict[str, Any] | None = None) -> dict[str, Any]:
-    url = f"{settings.JIRA_BASE_URL.rstrip('/')}{path}"
-    response = client.get(url, params=params)
+async def _jira_get(client: httpx.AsyncClient, path: str, *, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    response = await _jira_send(client, "GET", path, params=params)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def _jira_post(client: httpx.Client, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-    url = f"{settings.JIRA_BASE_URL.rstrip('/')}{path}"
-    response = client.post(url, json=payload)
+async def _jira_post(client: httpx.AsyncClient, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    response = await _jira_send(client, "POST", path, payload=payload)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def _jira_put(client: httpx.Client, path: str, payload: dict[str, Any]) -> None:
-    url = f"{settings.JIRA_BASE_URL.rstrip('/')}{path}"
-    response = client.put(url, json=payload)
+async def _jira_put(
+    client: httpx.AsyncClient,
+    path: str,
+    payload: dict[str, Any],
+    *,
+    idempotent: bool = True,
+) -> None:
+    response = await _jira_send(client, "PUT", path, payload=payload, idempotent=idempotent)
     if response.status_code not in (200, 204):
         response.raise_for_status()
 
 
-def _resolve_issue_type(client: httpx.Client, project_key: str, preferred_name: str | None) -> dict[str, str]:
-    data = _jira_get(client, PROJECT_PATH.format(project_key=project_key))
+class _JiraMetaCache:
+    """On-disk cache for Jira metadata that does not change between import runs."""
+
+    def __init__(self, path: Path, *, ttl_seconds: float, refresh: bool = False) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, Any] = {} if refresh else self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def get(self, client: httpx.AsyncClient, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        key = json.dumps([str(client.base_url).rstrip("/"), path, params or {}], sort_keys=True)
+        entry = self._entries.get(key)
+        if isinstance(entry, dict) and time.time() - float(entry.get("fetched_at") or 0) < self.ttl_seconds:
+            return entry.get("data")
+        data = await _jira_get(client, path, params=params)
+        self._entries[key] = {"fetched_at": time.time(), "data": data}
+        self._dirty = True
+        return data
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.write_text(json.dumps(self._entries), encoding="utf-8")
+        except OSError as exc:
+            print(f"Could not write Jira metadata cache {self.path}: {exc}")
+            return
+        self._dirty = False
+
+
+class _ImportStateLog:
+    """SQLite log of tickets already pushed to Jira, used to resume imports.
+
+    Entries are keyed by Jira site as well as project, so a log written
+    against one site is never trusted for another with the same project key.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(imports)")}
+        if columns and "site" not in columns:
+            # Logs written before entries were keyed by site cannot be
+            # attributed to one; drop them and let seed lookups rebuild.
+            self._conn.execute("DROP TABLE imports")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS imports ("
+            "site TEXT NOT NULL, project_key TEXT NOT NULL, ticket_id TEXT NOT NULL, issue_key TEXT NOT NULL, "
+            "content_hash TEXT, updated_at INTEGER NOT NULL, PRIMARY KEY (site, project_key, ticket_id))"
+        )
+
+    def load(self, site: str, project_key: str) -> dict[str, tuple[str, str | None]]:
+        rows = self._conn.execute(
+            "SELECT ticket_id, issue_key, content_hash FROM imports WHERE site = ? AND project_key = ?",
+            (site, project_key),
+        )
+        return {ticket_id: (issue_key, content_hash) for ticket_id, issue_key, content_hash in rows}
+
+    def record(self, site: str, project_key: str, ticket_id: str, issue_key: str, content_hash: str | None) -> None:
+        self._conn.execute(
+            "INSERT INTO imports (site, project_key, ticket_id, issue_key, content_hash, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (site, project_key, ticket_id) DO UPDATE SET "
+            "issue_key = excluded.issue_key, content_hash = excluded.content_hash, updated_at = excluded.updated_at",
+            (site, project_key, ticket_id, issue_key, content_hash, int(time.time())),
+        )
+
+    def forget(self, site: str, project_key: str, ticket_id: str) -> None:
+        self._conn.execute(
+            "DELETE FROM imports WHERE site = ? AND project_key = ? AND ticket_id = ?",
+            (site, project_key, ticket_id),
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+async def _resolve_issue_type(
+    client: httpx.AsyncClient,
+    project_key: str,
+    preferred_name: str | None,
+    *,
+    meta_cache: _JiraMetaCache,
+) -> dict[str, str]:
+    data = await meta_cache.get(client, PROJECT_PATH.format(project_key=project_key))
     issue_types = [it for it in (data.get("issueTypes") or []) if not it.get("subtask")]
     if not issue_types:
         raise RuntimeError(f"No issue types available for project {project_key}")
@@ -214,8 +463,8 @@ def _resolve_issue_type(client: httpx.Client, project_key: str, preferred_name:
     return {"id": str(fallback["id"]), "name": str(fallback["name"])}
 
 
-def _fetch_priority_names(client: httpx.Client) -> set[str]:
-    data = _jira_get(client, PRIORITIES_PATH)
+async def _fetch_priority_names(client: httpx.AsyncClient, *, meta_cache: _JiraMetaCache) -> set[str]:
+    data = await meta_cache.get(client, PRIORITIES_PATH)
     if isinstance(data, list):
         return {str(item.get("name", "")).strip() for item in data if item.get("name")}
     return set()
@@ -225,8 +474,14 @@ def _simplify(value: str) -> str:
     return re.sub(r"[^a-z0-9]+", " ", (value or "").lower()).strip()
 
 
-def _fetch_createmeta_fields(client: httpx.Client, project_key: str, issue_type_id: str) -> list[dict[str, Any]]:
-    data = _jira_get(
+async def _fetch_createmeta_fields(
+    client: httpx.AsyncClient,
+    project_key: str,
+    issue_type_id: str,
+    *,
+    meta_cache: _JiraMetaCache,
+) -> list[dict[str, Any]]:
+    data = await meta_cache.get(
         client,
         CREATEMETA_ISSUETYPE_PATH.format(project_key=project_key, issue_type_id=issue_type_id),
         params={"expand": "fields"},
@@ -302,8 +557,13 @@ def _parse_user_products(raw: str) -> list[str]:
     return values or ["jira-servicedesk"]
 
 
-def _fetch_project_role_urls(client: httpx.Client, project_key: str) -> dict[str, str]:
-    data = _jira_get(client, PROJECT_ROLES_PATH.format(project_key=project_key))
+async def _fetch_project_role_urls(
+    client: httpx.AsyncClient,
+    project_key: str,
+    *,
+    meta_cache: _JiraMetaCache,
+) -> dict[str, str]:
+    data = await meta_cache.get(client, PROJECT_ROLES_PATH.format(project_key=project_key))
     if not isinstance(data, dict):
         return {}
     return {str(name): str(url) for name, url in data.items() if isinstance(url, str)}
@@ -318,10 +578,10 @@ def _pick_agent_role_url(role_urls: dict[str, str]) -> str | None:
     return None
 
 
-def _search_jira_users(client: httpx.Client, query: str, *, max_results: int = 20) -> list[dict[str, Any]]:
+async def _search_jira_users(client: httpx.AsyncClient, query: str, *, max_results: int = 20) -> list[dict[str, Any]]:
     if not query.strip():
         return []
-    data = _jira_get(
+    data = await _jira_get(
         client,
         USER_SEARCH_PATH,
         params={"query": query.strip(), "maxResults": max_results},
@@ -331,7 +591,13 @@ def _search_jira_users(client: httpx.Client, query: str, *, max_results: int = 2
     return []
 
 
-def _find_user_account_id(client: httpx.Client, *, name: str, email: str) -> str | None:
+async def _find_user_account_id(
+    client: httpx.AsyncClient,
+    *,
+    name: str,
+    email: str,
+    search_cache: dict[str, list[dict[str, Any]]] | None = None,
+) -> str | None:
     candidates = [email, name, email.split("@", 1)[0] if "@" in email else ""]
     seen: set[str] = set()
     for candidate in candidates:
@@ -339,7 +605,12 @@ def _find_user_account_id(client: httpx.Client, *, name: str, email: str) -> str
         if not key or key in seen:
             continue
         seen.add(key)
-        users = _search_jira_users(client, candidate)
+        if search_cache is not None and key in search_cache:
+            users = search_cache[key]
+        else:
+            users = await _search_jira_users(client, candidate)
+            if search_cache is not None:
+                search_cache[key] = users
         if not users:
             continue
 
@@ -362,20 +633,20 @@ def _find_user_account_id(client: httpx.Client, *, name: str, email: str) -> str
     return None
 
 
-def _create_jira_user(client: httpx.Client, *, name: str, email: str, products: list[str]) -> str | None:
+async def _create_jira_user(client: httpx.AsyncClient, *, name: str, email: str, products: list[str]) -> str | None:
     payload = {
         "emailAddress": email.strip(),
         "displayName": name.strip() or email.strip(),
         "products": products,
     }
-    response = client.post(f"{settings.JIRA_BASE_URL.rstrip('/')}{CREATE_USER_PATH}", json=payload)
+    response = await _jira_send(client, "POST", CREATE_USER_PATH, payload=payload)
     if response.status_code in (200, 201):
-        data = response.json()
+        data = orjson.loads(response.content)
         return str(data.get("accountId") or "").strip() or None
     if response.status_code == 409:
-        return _find_user_account_id(client, name=name, email=email)
+        return await _find_user_account_id(client, name=name, email=email)
     if response.status_code == 400 and "already" in response.text.lower():
-        return _find_user_account_id(client, name=name, email=email)
+        return await _find_user_account_id(client, name=name, email=email)
     if response.status_code in (400, 403):
         # Permission or payload constraints; caller handles fallback.
         return None
@@ -383,10 +654,10 @@ def _create_jira_user(client: httpx.Client, *, name: str, email: str, products:
     return None
 
 
-def _add_user_to_project_role(client: httpx.Client, role_url: str, account_id: str) -> bool:
+async def _add_user_to_project_role(client: httpx.AsyncClient, role_url: str, account_id: str) -> bool:
     if not role_url or not account_id:
         return False
-    response = client.post(role_url, json={"user": [account_id]})
+    response = await _jira_send(client, "POST", role_url, payload={"user": [account_id]})
     if response.status_code in (200, 201, 204):
         return True
     if response.status_code == 400 and "already" in response.text.lower():
@@ -397,23 +668,24 @@ def _add_user_to_project_role(client: httpx.Client, role_url: str, account_id: s
     return False
 
 
-def _get_myself_account_id(client: httpx.Client) -> str | None:
-    data = _jira_get(client, "/rest/api/3/myself")
+async def _get_myself_account_id(client: httpx.AsyncClient) -> str | None:
+    data = await _jira_get(client, "/rest/api/3/myself")
     if not isinstance(data, dict):
         return None
     account_id = str(data.get("accountId") or "").strip()
     return account_id or None
 
 
-def _sync_local_users_to_jira(
-    client: httpx.Client,
+async def _sync_local_users_to_jira(
+    client: httpx.AsyncClient,
     *,
     project_key: str,
     local_users: list[dict[str, str]],
     products: list[str],
     allow_create: bool,
+    meta_cache: _JiraMetaCache,
 ) -> tuple[dict[str, str], list[str]]:
-    role_urls = _fetch_project_role_urls(client, project_key)
+    role_urls = await _fetch_project_role_urls(client, project_key, meta_cache=meta_cache)
     agent_role_url = _pick_agent_role_url(role_urls)
 
     name_to_account: dict[str, str] = {}
@@ -424,6 +696,19 @@ def _sync_local_users_to_jira(
     existing = 0
     role_added = 0
 
+    # Email searches resolve most users, so they are issued concurrently up
+    # front; name and email-prefix searches only run for the misses.
+    search_cache: dict[str, list[dict[str, Any]]] = {}
+    emails = list(
+        dict.fromkeys(
+            str(user.get("email") or "").strip().lower()
+            for user in local_users
+            if str(user.get("name") or "").strip() and str(user.get("email") or "").strip()
+        )
+    )
+    for email, found in zip(emails, await asyncio.gather(*(_search_jira_users(client, email) for email in emails))):
+        search_cache[email] = found
+
     for user in local_users:
         name = str(user.get("name") or "").strip()
         email = str(user.get("email") or "").strip().lower()
@@ -431,11 +716,11 @@ def _sync_local_users_to_jira(
         if not name or not email:
             continue
 
-        account_id = _find_user_account_id(client, name=name, email=email)
+        account_id = await _find_user_account_id(client, name=name, email=email, search_cache=search_cache)
         if account_id:
             existing += 1
         elif allow_create:
-            account_id = _create_jira_user(client, name=name, email=email, products=products)
+            account_id = await _create_jira_user(client, name=name, email=email, products=products)
             if account_id:
                 created += 1
 
@@ -443,7 +728,7 @@ def _sync_local_users_to_jira(
             continue
 
         if role in {"admin", "agent"} and agent_role_url and allow_create:
-            if _add_user_to_project_role(client, agent_role_url, account_id):
+            if await _add_user_to_project_role(client, agent_role_url, account_id):
                 role_added += 1
 
         name_to_account[name] = account_id
@@ -451,7 +736,7 @@ def _sync_local_users_to_jira(
             assignment_set.add(account_id)
             assignment_pool.append(account_id)
 
-    myself = _get_myself_account_id(client)
+    myself = await _get_myself_account_id(client)
     if myself and myself not in assignment_set:
         assignment_set.add(myself)
         assignment_pool.append(myself)
@@ -460,8 +745,8 @@ def _sync_local_users_to_jira(
     return name_to_account, assignment_pool
 
 
-def _detect_project_key(client: httpx.Client) -> str:
-    data = _jira_get(
+async def _detect_project_key(client: httpx.AsyncClient) -> str:
+    data = await _jira_get(
         client,
         SEARCH_JQL_PATH,
         params={
@@ -490,15 +775,17 @@ def _resolve_priority_name(local_priority: TicketPriority, available: set[str])
     return None
 
 
-def _fetch_existing_seed_issues(client: httpx.Client, project_key: str) -> dict[str, str]:
+async def _fetch_seed_issue_chunk(client: httpx.AsyncClient, project_key: str, seed_labels: list[str]) -> dict[str, str]:
     seed_to_issue: dict[str, str] = {}
+    quoted_labels = ", ".join(f'"{label}"' for label in seed_labels)
+    jql = f'project = "{project_key}" AND labels in ({quoted_labels}) ORDER BY created DESC'
     start_at = 0
     while True:
-        data = _jira_get(
+        data = await _jira_get(
             client,
             SEARCH_JQL_PATH,
             params={
-                "jql": f'project = "{project_key}" AND labels IS NOT EMPTY ORDER BY created DESC',
+                "jql": jql,
                 "fields": "labels",
                 "maxResults": 100,
                 "startAt": start_at,
@@ -523,6 +810,24 @@ def _fetch_existing_seed_issues(client: httpx.Client, project_key: str) -> dict[
     return seed_to_issue
 
 
+async def _fetch_existing_seed_issues(
+    client: httpx.AsyncClient,
+    project_key: str,
+    seed_labels: list[str],
+) -> dict[str, str]:
+    # Only the labels of the tickets being imported are looked up, in JQL
+    # chunks, instead of scanning every labelled issue of the project.
+    unique_labels = list(dict.fromkeys(seed_labels))
+    chunks = [
+        unique_labels[start : start + SEED_LABEL_QUERY_CHUNK]
+        for start in range(0, len(unique_labels), SEED_LABEL_QUERY_CHUNK)
+    ]
+    seed_to_issue: dict[str, str] = {}
+    for found in await asyncio.gather(*(_fetch_seed_issue_chunk(client, project_key, chunk) for chunk in chunks)):
+        seed_to_issue.update(found)
+    return seed_to_issue
+
+
 def _build_description(ticket: Ticket) -> str:
     lines = [
         "Imported from local ITSM platform",
@@ -583,7 +888,7 @@ def _load_local_users() -> list[dict[str, str]]:
     db = SessionLocal()
     try:
         users = (
-            db.query(User)
+            db.query(User.name, User.email, User.role)
             .filter(User.role.in_([UserRole.admin, UserRole.agent]))
             .order_by(User.created_at.asc())
             .all()
@@ -601,19 +906,19 @@ def _load_local_users() -> list[dict[str, str]]:
         db.close()
 
 
-def _create_issue(
-    client: httpx.Client,
-    *,
-    project_key: str,
-    issue_type_id: str,
+def _content_hash(fields: dict[str, Any]) -> str:
+    encoded = json.dumps(fields, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+def _issue_fields(
     ticket: Ticket,
+    *,
     jira_priority_name: str | None,
     assignee_account_id: str | None,
     extra_fields: dict[str, Any] | None = None,
-) -> str:
+) -> dict[str, Any]:
     fields: dict[str, Any] = {
-        "project": {"key": project_key},
-        "issuetype": {"id": issue_type_id},
         "summary": _truncate(f"[{ticket.id}] {ticket.title}", max_len=MAX_SUMMARY_LEN),
         "description": _adf_from_text(_build_description(ticket)),
         "labels": _build_labels(ticket),
@@ -624,145 +929,231 @@ def _create_issue(
         fields["assignee"] = {"accountId": assignee_account_id}
     if extra_fields:
         fields.update(extra_fields)
-    created = _jira_post(client, CREATE_ISSUE_PATH, {"fields": fields})
+    return fields
+
+
+def _is_transient_failure(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in TRANSIENT_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+async def _create_issue(
+    client: httpx.AsyncClient,
+    *,
+    project_key: str,
+    issue_type_id: str,
+    fields: dict[str, Any],
+    seed_label: str,
+) -> str:
+    payload = {"project": {"key": project_key}, "issuetype": {"id": issue_type_id}, **fields}
+    try:
+        created = await _jira_post(client, CREATE_ISSUE_PATH, {"fields": payload})
+    except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+        if not _is_transient_failure(exc):
+            raise
+        # Jira may have created the issue before failing, and its search index
+        # lags behind writes, so poll the seed label for a while rather than
+        # posting again. If it never shows up the ticket is reported as
+        # failed and the next run's seed lookup decides whether to create it.
+        for delay in SEED_LOOKUP_DELAYS:
+            await asyncio.sleep(delay)
+            found = await _fetch_existing_seed_issues(client, project_key, [seed_label])
+            if seed_label in found:
+                return found[seed_label]
+        raise RuntimeError(
+            f"Issue creation failed transiently and no issue labelled {seed_label} appeared; "
+            "the next run will reuse it if Jira created it"
+        ) from exc
     issue_key = str(created.get("key") or "").strip()
     if not issue_key:
         raise RuntimeError(f"Issue creation returned no key: {json.dumps(created)}")
     return issue_key
 
 
-def _update_issue(
-    client: httpx.Client,
-    *,
-    issue_key: str,
-    ticket: Ticket,
-    jira_priority_name: str | None,
-    assignee_account_id: str | None,
-    extra_fields: dict[str, Any] | None = None,
-) -> None:
-    fields: dict[str, Any] = {
-        "summary": _truncate(f"[{ticket.id}] {ticket.title}", max_len=MAX_SUMMARY_LEN),
-        "description": _adf_from_text(_build_description(ticket)),
-        "labels": _build_labels(ticket),
-    }
-    if jira_priority_name:
-        fields["priority"] = {"name": jira_priority_name}
-    if assignee_account_id:
-        fields["assignee"] = {"accountId": assignee_account_id}
-    if extra_fields:
-        fields.update(extra_fields)
-    _jira_put(client, ISSUE_PATH.format(issue_key=issue_key), {"fields": fields})
+async def _update_issue(client: httpx.AsyncClient, *, issue_key: str, fields: dict[str, Any]) -> None:
+    await _jira_put(client, ISSUE_PATH.format(issue_key=issue_key), {"fields": fields})
 
 
-def _add_comments(client: httpx.Client, issue_key: str, ticket: Ticket, *, max_comments: int, sleep_seconds: float) -> int:
-    count = 0
-    sorted_comments = sorted(ticket.comments or [], key=lambda c: c.created_at)[: max(0, max_comments)]
-    for comment in sorted_comments:
-        text = _comment_text(comment)
-        if not text:
-            continue
-        _jira_post(
-            client,
-            CREATE_COMMENT_PATH.format(issue_key=issue_key),
-            {"body": _adf_from_text(text)},
-        )
-        count += 1
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
-
+async def _add_comments(client: httpx.AsyncClient, issue_key: str, ticket: Ticket, *, max_comments: int) -> int:
+    # Ticket.comments is ordered by created_at on the relationship itself, so
+    # selectinload already returns them in import order.
+    first_comments = (ticket.comments or [])[: max(0, max_comments)]
+    texts = [text for text in map(_comment_text, first_comments) if text]
     resolution_text = _resolution_comment_text(ticket)
     if resolution_text:
-        _jira_post(
-            client,
-            CREATE_COMMENT_PATH.format(issue_key=issue_key),
-            {"body": _adf_from_text(resolution_text)},
+        texts.append(resolution_text)
+    if not texts:
+        return 0
+
+    # One issue edit adds every comment, in order, instead of a POST per comment.
+    # Repeating it would add the comments twice, so it is not retried on 5xx.
+    await _jira_put(
+        client,
+        ISSUE_PATH.format(issue_key=issue_key),
+        {"update": {"comment": [{"add": {"body": _adf_from_text(text)}} for text in texts]}},
+        idempotent=False,
+    )
+    return len(texts)
+
+
+def _flush_progress(lines: list[str]) -> None:
+    # Per-ticket progress is written once per batch instead of one print per ticket.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def _ticket_query(db: Session, limit: int) -> Query:
+    query = (
+        db.query(Ticket)
+        # Comments are the only relationship the import reads; any other lazy
+        # load would be a per-ticket query, so make it fail loudly instead.
+        .options(
+            load_only(*TICKET_IMPORT_COLUMNS),
+            selectinload(Ticket.comments).load_only(*COMMENT_IMPORT_COLUMNS),
+            raiseload("*"),
         )
-        count += 1
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
-    return count
+        .order_by(Ticket.created_at.asc())
+    )
+    if limit and limit > 0:
+        query = query.limit(limit)
+    return query
 
 
-def main() -> int:
-    args = parse_args()
-    project_key = (args.project_key or settings.JIRA_PROJECT_KEY).strip()
+def _iter_ticket_batches(query: Query, *, batch_size: int = TICKET_BATCH_SIZE) -> Iterator[list[Ticket]]:
+    # yield_per streams rows from the server-side cursor and selectinload
+    # fetches comments per chunk, so only one batch is held in memory.
+    batch: list[Ticket] = []
+    for ticket in query.yield_per(batch_size):
+        batch.append(ticket)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
+
+async def _run(args: argparse.Namespace) -> int:
     if not settings.JIRA_BASE_URL.strip() or not settings.JIRA_EMAIL.strip() or not settings.JIRA_API_TOKEN.strip():
         print("Missing Jira credentials. Set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in backend/.env")
         return 1
 
     db = SessionLocal()
+    state_log = _ImportStateLog(IMPORT_STATE_PATH)
     try:
-        query = (
-            db.query(Ticket)
-            .options(selectinload(Ticket.comments))
-            .order_by(Ticket.created_at.asc())
-        )
-        if args.limit and args.limit > 0:
-            query = query.limit(args.limit)
-        tickets = list(query.all())
+        return await _import_tickets(args, db, state_log)
     finally:
+        state_log.close()
         db.close()
 
-    if not tickets:
+
+async def _import_tickets(args: argparse.Namespace, db: Session, state_log: _ImportStateLog) -> int:
+    project_key = (args.project_key or settings.JIRA_PROJECT_KEY).strip()
+    query = _ticket_query(db, args.limit)
+    total = query.count()
+    if not total:
         print("No local tickets found to import.")
         return 0
 
     local_users = _load_local_users()
-    sleep_seconds = max(args.sleep_ms, 0) / 1000.0
+    bucket = _TokenBucket(rate=1000.0 / args.sleep_ms if args.sleep_ms > 0 else 0.0)
+    concurrency = max(args.concurrency, 1)
 
-    with httpx.Client(
-        timeout=30,
+    async with httpx.AsyncClient(
+        base_url=settings.JIRA_BASE_URL.rstrip("/"),
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(30.0, connect=5.0),
         auth=(settings.JIRA_EMAIL, settings.JIRA_API_TOKEN),
         headers={"Accept": "application/json"},
+        event_hooks={"request": [bucket.acquire], "response": [bucket.observe]},
+        limits=httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2),
     ) as client:
         if not project_key:
-            project_key = _detect_project_key(client)
+            project_key = await _detect_project_key(client)
         if not project_key:
             print("Missing project key. Set JIRA_PROJECT_KEY or pass --project-key.")
             return 1
 
-        issue_type = _resolve_issue_type(client, project_key, args.issue_type)
-        available_priorities = _fetch_priority_names(client)
-        create_fields = _fetch_createmeta_fields(client, project_key, issue_type["id"])
+        meta_cache = _JiraMetaCache(
+            META_CACHE_PATH,
+            ttl_seconds=max(args.meta_ttl_hours, 0) * 3600,
+            refresh=args.refresh_meta,
+        )
+        issue_type = await _resolve_issue_type(client, project_key, args.issue_type, meta_cache=meta_cache)
+        available_priorities = await _fetch_priority_names(client, meta_cache=meta_cache)
+        create_fields = await _fetch_createmeta_fields(client, project_key, issue_type["id"], meta_cache=meta_cache)
         urgency_field = _extract_select_field(create_fields, "Urgency")
         impact_field = _extract_select_field(create_fields, "Impact")
+        # Priority, urgency and impact only depend on the local priority, so
+        # the matching against Jira's allowed values runs once per priority.
+        jira_priority_names = {
+            priority: _resolve_priority_name(priority, available_priorities) for priority in TicketPriority
+        }
+        urgency_impact_by_priority = {
+            priority: _build_urgency_impact_fields(
+                local_priority=priority,
+                urgency_field=urgency_field,
+                impact_field=impact_field,
+            )
+            for priority in TicketPriority
+        }
+        lookup_existing = args.skip_existing or args.update_existing
         existing_seed_issues: dict[str, str] = {}
-        if args.skip_existing or args.update_existing:
-            existing_seed_issues = _fetch_existing_seed_issues(client, project_key)
+        recorded_imports: dict[str, tuple[str, str | None]] = {}
+        site = str(client.base_url).rstrip("/")
+        if lookup_existing and not args.no_state_cache:
+            # Tickets recorded by earlier runs need no Jira lookup at all.
+            recorded_imports = state_log.load(site, project_key)
+            for ticket_id, (issue_key, _) in recorded_imports.items():
+                existing_seed_issues[_seed_label(ticket_id)] = issue_key
 
         name_to_account: dict[str, str] = {}
         assignment_pool: list[str] = []
         if args.sync_users:
-            name_to_account, assignment_pool = _sync_local_users_to_jira(
+            name_to_account, assignment_pool = await _sync_local_users_to_jira(
                 client,
                 project_key=project_key,
                 local_users=local_users,
                 products=_parse_user_products(args.user_products),
                 allow_create=args.apply,
+                meta_cache=meta_cache,
             )
         else:
-            myself = _get_myself_account_id(client)
+            myself = await _get_myself_account_id(client)
             if myself:
                 assignment_pool = [myself]
+        meta_cache.save()
 
         assignment_load: dict[str, int] = {account_id: 0 for account_id in assignment_pool}
+        # (load, account_id) entries; an entry whose load no longer matches
+        # assignment_load was superseded by an explicit assignment and is dropped.
+        assignment_heap = [(0, account_id) for account_id in assignment_pool]
+        heapq.heapify(assignment_heap)
+        pool_accounts = frozenset(assignment_pool)
 
         def select_assignee_account(ticket: Ticket) -> str | None:
             explicit_name = (ticket.assignee or "").strip()
             explicit_account = name_to_account.get(explicit_name)
             if explicit_account:
-                assignment_load[explicit_account] = assignment_load.get(explicit_account, 0) + 1
+                load = assignment_load.get(explicit_account, 0) + 1
+                assignment_load[explicit_account] = load
+                if explicit_account in pool_accounts:
+                    heapq.heappush(assignment_heap, (load, explicit_account))
                 return explicit_account
-            if args.auto_assign and assignment_pool:
-                chosen = min(assignment_pool, key=lambda aid: (assignment_load.get(aid, 0), aid))
-                assignment_load[chosen] = assignment_load.get(chosen, 0) + 1
+            if args.auto_assign and assignment_heap:
+                load, chosen = heapq.heappop(assignment_heap)
+                while load != assignment_load[chosen]:
+                    load, chosen = heapq.heappop(assignment_heap)
+                assignment_load[chosen] = load + 1
+                heapq.heappush(assignment_heap, (load + 1, chosen))
                 return chosen
             return None
 
         print(f"Project: {project_key}")
         print(f"Issue type: {issue_type['name']} ({issue_type['id']})")
-        print(f"Tickets loaded: {len(tickets)}")
+        print(f"Tickets loaded: {total}")
         print(f"Skip existing: {args.skip_existing}")
         print(f"Mode: {'APPLY' if args.apply else 'DRY-RUN'}")
         print(f"User sync enabled: {args.sync_users}")
@@ -779,88 +1170,146 @@ def main() -> int:
 
         created_count = 0
         updated_existing = 0
+        unchanged_existing = 0
         skipped_existing = 0
         planned_count = 0
         comment_count = 0
         failures: list[tuple[str, str]] = []
-
-        for idx, ticket in enumerate(tickets, start=1):
-            ticket_seed_label = _seed_label(ticket.id)
-            existing_issue_key = existing_seed_issues.get(ticket_seed_label)
-
-            jira_priority_name = _resolve_priority_name(ticket.priority, available_priorities)
-            urgency_impact_fields = _build_urgency_impact_fields(
-                local_priority=ticket.priority,
-                urgency_field=urgency_field,
-                impact_field=impact_field,
-            )
-            assignee_account_id = select_assignee_account(ticket)
-            if not args.apply:
-                planned_count += 1
-                urgency_preview = urgency_impact_fields.get(str((urgency_field or {}).get("field_id")), {})
-                impact_preview = urgency_impact_fields.get(str((impact_field or {}).get("field_id")), {})
-                target_action = "update existing" if (args.skip_existing and existing_issue_key and args.update_existing) else "create"
-                print(
-                    f"[DRY-RUN {idx}/{len(tickets)}] would {target_action} {ticket.id} "
-                    f"(priority={ticket.priority.value}, urgency={urgency_preview.get('value')}, "
-                    f"impact={impact_preview.get('value')}, assignee_account={assignee_account_id}, "
-                    f"comments={len(ticket.comments or [])})"
-                )
-                continue
-
-            try:
-                if args.skip_existing and existing_issue_key:
-                    if args.update_existing:
-                        _update_issue(
-                            client,
-                            issue_key=existing_issue_key,
-                            ticket=ticket,
-                            jira_priority_name=jira_priority_name,
-                            assignee_account_id=assignee_account_id,
-                            extra_fields=urgency_impact_fields,
-                        )
-                        updated_existing += 1
-                        print(
-                            f"[{idx}/{len(tickets)}] updated {ticket.id} -> {existing_issue_key} "
-                            f"(comments=0, assignee_account={assignee_account_id})"
-                        )
-                    else:
+        progress: list[str] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def push_ticket(
+            idx: int,
+            ticket: Ticket,
+            *,
+            seed_label: str,
+            existing_issue_key: str | None,
+            jira_priority_name: str | None,
+            assignee_account_id: str | None,
+            urgency_impact_fields: dict[str, Any],
+        ) -> None:
+            nonlocal created_count, updated_existing, unchanged_existing, skipped_existing, comment_count
+            async with semaphore:
+                try:
+                    if args.skip_existing and existing_issue_key and not args.update_existing:
                         skipped_existing += 1
+                        return
+
+                    # Summary, description and labels are built once and shared
+                    # by whichever of the create or update requests is sent.
+                    fields = _issue_fields(
+                        ticket,
+                        jira_priority_name=jira_priority_name,
+                        assignee_account_id=assignee_account_id,
+                        extra_fields=urgency_impact_fields,
+                    )
+                    content_hash = _content_hash(fields)
+                    if args.skip_existing and existing_issue_key:
+                        if recorded_imports.get(ticket.id) == (existing_issue_key, content_hash):
+                            unchanged_existing += 1
+                            return
+                        try:
+                            await _update_issue(client, issue_key=existing_issue_key, fields=fields)
+                        except httpx.HTTPStatusError as exc:
+                            if exc.response.status_code != 404:
+                                raise
+                            # The issue was deleted, or the key was recorded for
+                            # another site: forget it and fall back to the seed
+                            # label lookup, then to a create.
+                            stale_issue_key = existing_issue_key
+                            state_log.forget(site, project_key, ticket.id)
+                            recorded_imports.pop(ticket.id, None)
+                            existing_seed_issues.pop(seed_label, None)
+                            found = await _fetch_existing_seed_issues(client, project_key, [seed_label])
+                            existing_issue_key = found.get(seed_label)
+                            if existing_issue_key == stale_issue_key:
+                                existing_issue_key = None
+                            if existing_issue_key:
+                                existing_seed_issues[seed_label] = existing_issue_key
+                                await _update_issue(client, issue_key=existing_issue_key, fields=fields)
+                        if existing_issue_key:
+                            state_log.record(site, project_key, ticket.id, existing_issue_key, content_hash)
+                            updated_existing += 1
+                            progress.append(
+                                f"[{idx}/{total}] updated {ticket.id} -> {existing_issue_key} "
+                                f"(comments=0, assignee_account={assignee_account_id})"
+                            )
+                            return
+
+                    issue_key = await _create_issue(
+                        client,
+                        project_key=project_key,
+                        issue_type_id=issue_type["id"],
+                        fields=fields,
+                        seed_label=seed_label,
+                    )
+                    created_count += 1
+                    existing_seed_issues[seed_label] = issue_key
+                    state_log.record(site, project_key, ticket.id, issue_key, content_hash)
+                    added_comments = await _add_comments(
+                        client,
+                        issue_key,
+                        ticket,
+                        max_comments=args.max_comments,
+                    )
+                    comment_count += added_comments
+                    progress.append(
+                        f"[{idx}/{total}] imported {ticket.id} -> {issue_key} "
+                        f"(comments={added_comments}, assignee_account={assignee_account_id})"
+                    )
+                except Exception as exc:
+                    failures.append((ticket.id, str(exc)))
+                    progress.append(f"[{idx}/{total}] FAILED {ticket.id}: {exc}")
+
+        # Assignee balancing depends on ticket order, so plans are resolved
+        # serially before each batch of Jira writes fans out.
+        processed = 0
+        for batch in _iter_ticket_batches(query):
+            batch_labels = [_seed_label(ticket.id) for ticket in batch]
+            unknown_labels = [label for label in batch_labels if label not in existing_seed_issues]
+            if lookup_existing and unknown_labels:
+                existing_seed_issues.update(await _fetch_existing_seed_issues(client, project_key, unknown_labels))
+            pending = []
+            for idx, ticket in enumerate(batch, start=processed + 1):
+                seed_label = _seed_label(ticket.id)
+                existing_issue_key = existing_seed_issues.get(seed_label)
+
+                jira_priority_name = jira_priority_names[ticket.priority]
+                urgency_impact_fields = urgency_impact_by_priority[ticket.priority]
+                assignee_account_id = select_assignee_account(ticket)
+                if not args.apply:
+                    planned_count += 1
+                    urgency_preview = urgency_impact_fields.get(str((urgency_field or {}).get("field_id")), {})
+                    impact_preview = urgency_impact_fields.get(str((impact_field or {}).get("field_id")), {})
+                    target_action = "update existing" if (args.skip_existing and existing_issue_key and args.update_existing) else "create"
+                    progress.append(
+                        f"[DRY-RUN {idx}/{total}] would {target_action} {ticket.id} "
+                        f"(priority={ticket.priority.value}, urgency={urgency_preview.get('value')}, "
+                        f"impact={impact_preview.get('value')}, assignee_account={assignee_account_id}, "
+                        f"comments={len(ticket.comments or [])})"
+                    )
                     continue
 
-                issue_key = _create_issue(
-                    client,
-                    project_key=project_key,
-                    issue_type_id=issue_type["id"],
-                    ticket=ticket,
-                    jira_priority_name=jira_priority_name,
-                    assignee_account_id=assignee_account_id,
-                    extra_fields=urgency_impact_fields,
-                )
-                created_count += 1
-                existing_seed_issues[ticket_seed_label] = issue_key
-                added_comments = _add_comments(
-                    client,
-                    issue_key,
-                    ticket,
-                    max_comments=args.max_comments,
-                    sleep_seconds=sleep_seconds,
-                )
-                comment_count += added_comments
-                print(
-                    f"[{idx}/{len(tickets)}] imported {ticket.id} -> {issue_key} "
-                    f"(comments={added_comments}, assignee_account={assignee_account_id})"
+                pending.append(
+                    push_ticket(
+                        idx,
+                        ticket,
+                        seed_label=seed_label,
+                        existing_issue_key=existing_issue_key,
+                        jira_priority_name=jira_priority_name,
+                        assignee_account_id=assignee_account_id,
+                        urgency_impact_fields=urgency_impact_fields,
+                    )
                 )
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
-            except Exception as exc:
-                failures.append((ticket.id, str(exc)))
-                print(f"[{idx}/{len(tickets)}] FAILED {ticket.id}: {exc}")
+            await asyncio.gather(*pending)
+            _flush_progress(progress)
+            processed += len(batch)
 
     print("\nSummary:")
     print(f"- planned: {planned_count}")
     print(f"- created: {created_count}")
     print(f"- updated existing: {updated_existing}")
+    print(f"- unchanged existing: {unchanged_existing}")
     print(f"- comments added: {comment_count}")
     print(f"- skipped existing: {skipped_existing}")
     print(f"- failed: {len(failures)}")
@@ -870,5 +1319,9 @@ def main() -> int:
     return 0 if not failures else 2
 
 
+def main() -> int:
+    return asyncio.run(_run(parse_args()))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
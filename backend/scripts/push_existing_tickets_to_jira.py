@@ -4,43 +4,56 @@ from __future__ import annotations
 
 import datetime as dt
 
-from sqlalchemy import or_
+from sqlalchemy import func, or_, tuple_
 
 from app.db.session import SessionLocal
+from app.integrations.jira.client import close_shared_client
 from app.models.ticket import Ticket
 from app.services.tickets import ensure_jira_link_for_ticket
 
+BATCH_SIZE = 500
+
 
 def main() -> None:
     db = SessionLocal()
     started = dt.datetime.now(dt.timezone.utc)
     try:
-        candidates = (
-            db.query(Ticket)
-            .filter(or_(Ticket.jira_key.is_(None), Ticket.jira_key == ""))
-            .order_by(Ticket.created_at.asc())
-            .all()
-        )
-        total = len(candidates)
+        unlinked = or_(Ticket.jira_key.is_(None), Ticket.jira_key == "")
+        total = db.query(func.count(Ticket.id)).filter(unlinked).scalar() or 0
         linked = 0
         failed = 0
 
         print(f"[backfill] candidates={total}")
-        for ticket in candidates:
-            ok = ensure_jira_link_for_ticket(db, ticket)
-            if ok:
-                linked += 1
-                print(f"[linked] {ticket.id} -> {ticket.jira_key}")
-            else:
-                failed += 1
-                print(f"[failed] {ticket.id}")
+        # ensure_jira_link_for_ticket commits per ticket, which would close a
+        # yield_per server-side cursor, so candidates are read in keyset pages
+        # of BATCH_SIZE. Linked tickets leave the filter and failed ones stay
+        # behind the cursor, so every ticket is visited once.
+        after: tuple[dt.datetime, str] | None = None
+        while True:
+            query = db.query(Ticket).filter(unlinked)
+            if after is not None:
+                query = query.filter(tuple_(Ticket.created_at, Ticket.id) > after)
+            batch = query.order_by(Ticket.created_at.asc(), Ticket.id.asc()).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+            after = (batch[-1].created_at, batch[-1].id)
+
+            for ticket in batch:
+                ok = ensure_jira_link_for_ticket(db, ticket)
+                if ok:
+                    linked += 1
+                    print(f"[linked] {ticket.id} -> {ticket.jira_key}")
+                else:
+                    failed += 1
+                    print(f"[failed] {ticket.id}")
+            db.expunge_all()
 
         duration = (dt.datetime.now(dt.timezone.utc) - started).total_seconds()
         print(f"[done] linked={linked} failed={failed} duration_s={duration:.2f}")
     finally:
         db.close()
+        close_shared_client()
 
 
 if __name__ == "__main__":
     main()
-
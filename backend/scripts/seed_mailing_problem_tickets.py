@@ -56,8 +56,12 @@ def seed() -> None:
     linked = 0
 
     try:
+        existing = {
+            row.id: row
+            for row in db.query(Ticket).filter(Ticket.id.in_([item["id"] for item in MAILING_TICKETS])).all()
+        }
         for index, payload in enumerate(MAILING_TICKETS):
-            ticket = db.query(Ticket).filter(Ticket.id == payload["id"]).first()
+            ticket = existing.get(payload["id"])
             if ticket is None:
                 created_at = now - dt.timedelta(hours=(len(MAILING_TICKETS) - index))
                 ticket = Ticket(
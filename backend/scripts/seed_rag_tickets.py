@@ -6,6 +6,8 @@ import datetime as dt
 import sys
 from pathlib import Path
 
+from sqlalchemy.orm import selectinload
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE_DIR))
 
@@ -553,8 +555,7 @@ RAG_TICKETS = [
 ]
 
 
-def _upsert_problem(db, payload: dict) -> bool:
-    row = db.query(Problem).filter(Problem.id == payload["id"]).first()
+def _upsert_problem(db, payload: dict, row: Problem | None) -> bool:
     created = row is None
     if row is None:
         row = Problem(id=payload["id"])
@@ -576,8 +577,7 @@ def _upsert_problem(db, payload: dict) -> bool:
     return created
 
 
-def _upsert_ticket(db, payload: dict) -> tuple[Ticket, bool]:
-    row = db.query(Ticket).filter(Ticket.id == payload["id"]).first()
+def _upsert_ticket(db, payload: dict, row: Ticket | None) -> tuple[Ticket, bool]:
     created = row is None
     if row is None:
         row = Ticket(id=payload["id"])
@@ -613,26 +613,35 @@ def seed_rag_tickets() -> None:
     updated_comments = 0
 
     try:
+        # Existing rows are fetched with one IN query per table (comments come
+        # with their tickets via selectinload) instead of one SELECT per payload.
+        existing_problems = {
+            row.id: row
+            for row in db.query(Problem).filter(Problem.id.in_([payload["id"] for payload in RAG_PROBLEMS])).all()
+        }
+        existing_tickets = {
+            row.id: row
+            for row in db.query(Ticket)
+            .options(selectinload(Ticket.comments))
+            .filter(Ticket.id.in_([payload["id"] for payload in RAG_TICKETS]))
+            .all()
+        }
+
         for problem_payload in RAG_PROBLEMS:
-            created = _upsert_problem(db, problem_payload)
+            created = _upsert_problem(db, problem_payload, existing_problems.get(problem_payload["id"]))
             if created:
                 inserted_problems += 1
             else:
                 updated_problems += 1
 
         for payload in RAG_TICKETS:
-            ticket, created = _upsert_ticket(db, payload)
+            ticket, created = _upsert_ticket(db, payload, existing_tickets.get(payload["id"]))
             if created:
                 inserted_tickets += 1
             else:
                 updated_tickets += 1
 
-            existing_comments = {
-                row.id: row
-                for row in db.query(TicketComment)
-                .filter(TicketComment.ticket_id == payload["id"])
-                .all()
-            }
+            existing_comments = {row.id: row for row in ticket.comments}
 
             for comment_payload in payload["comments"]:
                 comment_id = comment_payload["id"]
@@ -22,7 +22,7 @@ sys.path.append(str(BASE_DIR))
 
 from app.core.config import settings  # noqa: E402
 from app.db.session import SessionLocal  # noqa: E402
-from app.integrations.jira.client import JiraClient  # noqa: E402
+from app.integrations.jira.client import JiraClient, close_shared_client  # noqa: E402
 from app.integrations.jira.mapper import _parse_datetime as parse_jira_datetime  # noqa: E402
 from app.integrations.jira.outbound import (  # noqa: E402
     _adf_from_text,
@@ -306,4 +306,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    try:
+        raise SystemExit(main())
+    finally:
+        close_shared_client()
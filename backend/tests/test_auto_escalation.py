@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.models.enums import TicketPriority, TicketStatus
+from app.services.sla import auto_escalation
+
+
+def _ticket(**overrides) -> SimpleNamespace:  # noqa: ANN003
+    values = {
+        "status": TicketStatus.open,
+        "priority": TicketPriority.medium,
+        "sla_resolution_breached": False,
+        "sla_first_response_breached": False,
+        "sla_remaining_minutes": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_escalation_table_covers_every_priority_combination() -> None:
+    assert len(auto_escalation._ESCALATION_TABLE) == 2 * 2 * 4 * len(TicketPriority)
+
+
+def test_compute_escalation_resolution_breach_goes_critical() -> None:
+    target, reason = auto_escalation.compute_escalation(_ticket(sla_resolution_breached=True))
+    assert target == TicketPriority.critical
+    assert reason == "jira_sla_resolution_breached"
+
+
+def test_compute_escalation_steps_high_priority_near_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(auto_escalation.settings, "SLA_ESCALATE_HIGH_MINUTES", 30)
+    monkeypatch.setattr(auto_escalation.settings, "SLA_ESCALATE_STEP_MINUTES", 60)
+
+    assert auto_escalation.compute_escalation(_ticket(priority=TicketPriority.low, sla_remaining_minutes=20)) == (
+        TicketPriority.high,
+        "jira_sla_remaining_le_high_threshold",
+    )
+    assert auto_escalation.compute_escalation(_ticket(priority=TicketPriority.high, sla_remaining_minutes=45)) == (
+        TicketPriority.critical,
+        "jira_sla_remaining_le_step_threshold",
+    )
+    assert auto_escalation.compute_escalation(_ticket(sla_remaining_minutes=90)) == (None, None)
+
+
+def test_compute_escalation_ignores_closed_tickets() -> None:
+    ticket = _ticket(status=TicketStatus.closed, sla_resolution_breached=True)
+    assert auto_escalation.compute_escalation(ticket) == (None, None)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import httpx
+import pytest
+
+from scripts import jira_bulk_import
+
+
+def test_import_state_log_is_keyed_by_site(tmp_path) -> None:
+    log = jira_bulk_import._ImportStateLog(tmp_path / "state.sqlite")
+    try:
+        log.record("https://a.atlassian.net", "ITSM", "TW-1", "ITSM-1", "hash")
+
+        assert log.load("https://a.atlassian.net", "ITSM") == {"TW-1": ("ITSM-1", "hash")}
+        assert log.load("https://b.atlassian.net", "ITSM") == {}
+
+        log.forget("https://a.atlassian.net", "ITSM", "TW-1")
+        assert log.load("https://a.atlassian.net", "ITSM") == {}
+    finally:
+        log.close()
+
+
+def test_import_state_log_drops_entries_without_site(tmp_path) -> None:
+    path = tmp_path / "state.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE imports (project_key TEXT NOT NULL, ticket_id TEXT NOT NULL, issue_key TEXT NOT NULL, "
+        "content_hash TEXT, updated_at INTEGER NOT NULL, PRIMARY KEY (project_key, ticket_id))"
+    )
+    conn.execute("INSERT INTO imports VALUES ('ITSM', 'TW-1', 'ITSM-1', 'hash', 0)")
+    conn.commit()
+    conn.close()
+
+    log = jira_bulk_import._ImportStateLog(path)
+    try:
+        assert log.load("https://a.atlassian.net", "ITSM") == {}
+    finally:
+        log.close()
+
+
+def _create_issue_with(handler, monkeypatch) -> str:  # noqa: ANN001
+    monkeypatch.setattr(jira_bulk_import, "SEED_LOOKUP_DELAYS", (0.0, 0.0, 0.0))
+
+    async def _run() -> str:
+        async with httpx.AsyncClient(base_url="https://jira.test", transport=httpx.MockTransport(handler)) as client:
+            return await jira_bulk_import._create_issue(
+                client,
+                project_key="ITSM",
+                issue_type_id="10001",
+                fields={"summary": "VPN down", "labels": ["twseed_tw-1"]},
+                seed_label="twseed_tw-1",
+            )
+
+    return asyncio.run(_run())
+
+
+def test_create_issue_reuses_issue_found_after_transient_failure(monkeypatch) -> None:
+    calls = {"POST": 0, "GET": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.method] += 1
+        if request.method == "POST":
+            return httpx.Response(502)
+        # The search index only sees the issue on the second lookup.
+        if calls["GET"] < 2:
+            return httpx.Response(200, json={"issues": [], "total": 0})
+        return httpx.Response(
+            200,
+            json={"issues": [{"key": "ITSM-7", "fields": {"labels": ["twseed_tw-1"]}}], "total": 1},
+        )
+
+    assert _create_issue_with(handler, monkeypatch) == "ITSM-7"
+    assert calls == {"POST": 1, "GET": 2}
+
+
+def test_create_issue_does_not_post_again_when_issue_never_appears(monkeypatch) -> None:
+    calls = {"POST": 0, "GET": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.method] += 1
+        if request.method == "POST":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"issues": [], "total": 0})
+
+    with pytest.raises(RuntimeError, match="twseed_tw-1"):
+        _create_issue_with(handler, monkeypatch)
+    assert calls == {"POST": 1, "GET": len(jira_bulk_import.SEED_LOOKUP_DELAYS)}
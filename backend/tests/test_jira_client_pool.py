@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.config import settings
+from app.integrations.jira import client as jira_client_module
+from app.integrations.jira.client import JiraClient, close_shared_client
+
+
+@pytest.fixture(autouse=True)
+def _jira_settings(monkeypatch):  # noqa: ANN001, ANN202
+    monkeypatch.setattr(settings, "JIRA_BASE_URL", "https://jira.example.test")
+    monkeypatch.setattr(settings, "JIRA_EMAIL", "bot@example.test")
+    monkeypatch.setattr(settings, "JIRA_API_TOKEN", "token-1")
+    close_shared_client()
+    yield
+    close_shared_client()
+
+
+def test_jira_clients_share_one_pooled_http_client() -> None:
+    first = JiraClient()._http_client()
+    second = JiraClient()._http_client()
+
+    assert first is second
+    assert not first.is_closed
+
+
+def test_credential_change_closes_previous_http_client(monkeypatch) -> None:
+    previous = JiraClient()._http_client()
+
+    monkeypatch.setattr(settings, "JIRA_API_TOKEN", "token-2")
+    current = JiraClient()._http_client()
+
+    assert current is not previous
+    assert previous.is_closed
+    assert not current.is_closed
+
+
+def test_close_shared_client_closes_and_forgets_the_pool() -> None:
+    pooled = JiraClient()._http_client()
+
+    close_shared_client()
+
+    assert pooled.is_closed
+    assert jira_client_module._shared_client is None
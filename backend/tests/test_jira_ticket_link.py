@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.services import tickets as tickets_service
+
+
+class _RecordingDb:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.committed_jira_key: str | None = None
+        self._ticket = None
+
+    def add(self, obj) -> None:  # noqa: ANN001
+        self._ticket = obj
+
+    def commit(self) -> None:
+        self.events.append("commit")
+        self.committed_jira_key = getattr(self._ticket, "jira_key", None)
+
+    def refresh(self, _obj) -> None:  # noqa: ANN001
+        return None
+
+    def rollback(self) -> None:
+        self.events.append("rollback")
+
+
+def _link(monkeypatch, sync) -> tuple[_RecordingDb, SimpleNamespace, bool]:  # noqa: ANN001
+    db = _RecordingDb()
+    ticket = SimpleNamespace(id="TW-1", jira_key=None)
+    monkeypatch.setattr(tickets_service, "create_jira_issue_for_ticket", lambda _ticket: "HP-1")
+    monkeypatch.setattr(tickets_service, "JiraClient", lambda: object())
+    monkeypatch.setattr(tickets_service, "sync_ticket_sla", sync)
+    monkeypatch.setattr(tickets_service, "apply_escalation", lambda *_args, **_kwargs: db.events.append("escalation"))
+    linked = tickets_service.ensure_jira_link_for_ticket(db, ticket)
+    return db, ticket, linked
+
+
+def test_jira_link_is_committed_before_sla_sync_calls_jira(monkeypatch) -> None:
+    seen_committed_key: list[str | None] = []
+
+    def sync(db, _ticket, _jira_key, **_kwargs):  # noqa: ANN001, ANN003
+        seen_committed_key.append(db.committed_jira_key)
+        db.events.append("sla_sync")
+
+    db, ticket, linked = _link(monkeypatch, sync)
+
+    assert linked is True
+    assert ticket.jira_key == "HP-1"
+    assert seen_committed_key == ["HP-1"]
+    assert db.events == ["commit", "sla_sync", "escalation", "commit"]
+
+
+def test_failed_sla_sync_keeps_committed_jira_link(monkeypatch) -> None:
+    def sync(*_args, **_kwargs):  # noqa: ANN002, ANN003
+        raise RuntimeError("jira down")
+
+    db, ticket, linked = _link(monkeypatch, sync)
+
+    assert linked is True
+    assert db.committed_jira_key == "HP-1"
+    assert db.events == ["commit", "rollback"]
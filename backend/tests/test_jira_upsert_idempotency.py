@@ -156,3 +156,55 @@ def test_upsert_ticket_applies_ai_category_for_unknown_jsm_issue_type(monkeypatc
     assert ticket.predicted_category == TicketCategory.network
     assert ticket.predicted_priority == TicketPriority.high
     assert ticket.predicted_ticket_type == TicketType.incident
+
+
+def test_upsert_ticket_reuses_predictions_when_text_unchanged(monkeypatch) -> None:
+    existing = SimpleNamespace(
+        title="VPN timeout incident",
+        description="Users cannot connect to VPN.",
+        assignee="Agent",
+        assignment_change_count=0,
+        reporter_id=None,
+        priority_model_version="smart-v1",
+        predicted_priority=TicketPriority.high,
+        predicted_ticket_type=TicketType.incident,
+        predicted_category=TicketCategory.network,
+        jira_updated_at=None,
+        first_action_at=None,
+        resolved_at=None,
+        source="jira",
+        status=TicketStatus.open,
+    )
+    monkeypatch.setattr(service, "_find_ticket_for_issue", lambda *args, **kwargs: existing)
+    monkeypatch.setattr(service, "_resolve_local_reporter_user", lambda *args, **kwargs: None)
+
+    def fail_classify(*_args, **_kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("classifier must not run for unchanged text")
+
+    monkeypatch.setattr(service, "classify_ticket", fail_classify)
+
+    issue = {
+        "id": "5002",
+        "key": "HP-5002",
+        "fields": {
+            "summary": "VPN timeout incident",
+            "description": "Users cannot connect to VPN.",
+            "status": {"name": "Open", "statusCategory": {"key": "new"}},
+            "priority": {"name": "Medium"},
+            "issuetype": {"name": "Email Request"},
+            "labels": [],
+            "components": [],
+            "assignee": {"displayName": "Agent"},
+            "reporter": {"displayName": "Reporter"},
+            "created": "2026-02-14T10:00:00.000+0000",
+            "updated": "2026-02-14T10:05:00.000+0000",
+            "comment": {"comments": [], "total": 0},
+        },
+    }
+
+    ticket, upserted = service._upsert_ticket(_FakeDb(), issue)
+
+    assert upserted is True
+    assert ticket.category == TicketCategory.network
+    assert ticket.predicted_priority == TicketPriority.high
+    assert ticket.auto_priority_applied is True
@@ -77,6 +77,48 @@ def test_compute_similarity_key_groups_same_primary_tag() -> None:
     assert timeout_key == "network|tag:vpn"
 
 
+def test_compute_similarity_key_reuses_cached_result() -> None:
+    problems._compute_similarity_key_cached.cache_clear()
+    kwargs = {
+        "title": "Mailbox quota exceeded",
+        "description": "Users cannot receive mail",
+        "category": TicketCategory.email,
+        "tags": ["mailbox", "quota"],
+    }
+    first = problems.compute_similarity_key(**kwargs)
+    second = problems.compute_similarity_key(**kwargs)
+
+    assert first == second
+    assert problems._compute_similarity_key_cached.cache_info().hits == 1
+
+
+def test_primary_tag_skips_description_when_title_decides(monkeypatch) -> None:
+    calls: list[str | None] = []
+    original = problems._normalize_tokens
+
+    def tracking(value):  # noqa: ANN001
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(problems, "_normalize_tokens", tracking)
+    picked = problems._select_primary_similarity_tag(
+        tags=["outlook", "network"],
+        title="Outlook crashes on startup",
+        description="network drive mapped",
+    )
+    assert picked == "outlook"
+    assert "network drive mapped" not in calls
+
+
+def test_primary_tag_uses_description_to_break_close_scores() -> None:
+    picked = problems._select_primary_similarity_tag(
+        tags=["printer", "toner"],
+        title="Device offline",
+        description="toner cartridge reported empty",
+    )
+    assert picked == "toner"
+
+
 def test_detect_problems_threshold_and_rerun_idempotent(monkeypatch) -> None:
     tickets = [
         _make_ticket("TW-9001", "VPN outage site A", TicketCategory.network),
@@ -12,6 +12,9 @@ class _Query:
         self._first_item = first_item
         self._rows = list(rows or [])
 
+    def options(self, *args, **kwargs):  # noqa: ANN001
+        return self
+
     def filter(self, *args, **kwargs):  # noqa: ANN001
         return self
 
@@ -177,3 +180,198 @@ def test_ticket_pair_similarity_uses_hybrid_semantic_score(monkeypatch) -> None:
 
     assert lexical_only < problems.PROBLEM_MATCH_SCORE_THRESHOLD
     assert hybrid_score >= problems.PROBLEM_MATCH_SCORE_THRESHOLD
+
+
+def test_recent_similar_tickets_returns_key_bucket_without_pairwise_scoring(monkeypatch) -> None:
+    now = dt.datetime.now(dt.timezone.utc)
+
+    def make(ticket_id: str, title: str, tags: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=ticket_id,
+            title=title,
+            description="Users cannot connect",
+            category=TicketCategory.network,
+            tags=tags,
+            created_at=now,
+            jira_created_at=None,
+        )
+
+    ticket = make("TW-1", "VPN timeout", ["vpn"])
+    same_key = [make(f"TW-{idx}", "VPN drops", ["vpn"]) for idx in range(2, 4)]
+    other = make("TW-9", "Printer jam", ["printer"])
+    monkeypatch.setattr(
+        problems,
+        "_ticket_pair_similarity_score",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("pairwise scoring not expected")),
+    )
+
+    rows = problems._recent_similar_tickets(_FakeDb(tickets=[*same_key, other]), ticket=ticket, min_count=2)
+
+    assert [row.id for row in rows] == ["TW-2", "TW-3"]
+
+
+def test_problem_analytics_summary_loads_linked_tickets_in_one_query() -> None:
+    now = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    from app.models.enums import ProblemStatus, TicketPriority
+
+    def make_problem(problem_id: str, active: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=problem_id,
+            title=f"Problem {problem_id}",
+            status=ProblemStatus.investigating,
+            category=TicketCategory.network,
+            active_count=active,
+            occurrences_count=active,
+            updated_at=now,
+            permanent_fix=None,
+            workaround=None,
+        )
+
+    def make_ticket(ticket_id: str, problem_id: str, priority: TicketPriority, hours: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=ticket_id,
+            problem_id=problem_id,
+            priority=priority,
+            updated_at=now - dt.timedelta(hours=hours),
+        )
+
+    problem_rows = [make_problem("PB-0001", 2), make_problem("PB-0002", 1)]
+    ticket_rows = [
+        make_ticket("TW-1", "PB-0001", TicketPriority.medium, 1),
+        make_ticket("TW-2", "PB-0001", TicketPriority.critical, 2),
+        make_ticket("TW-3", "PB-0002", TicketPriority.low, 1),
+    ]
+
+    class _AggregateQuery(_Query):
+        def __init__(self, *, rows=None, scalar_value=None):  # noqa: ANN001
+            super().__init__(rows=rows)
+            self._scalar_value = scalar_value
+
+        def group_by(self, *args, **kwargs):  # noqa: ANN001
+            return self
+
+        def limit(self, *args, **kwargs):  # noqa: ANN001
+            return self
+
+        def yield_per(self, *args, **kwargs):  # noqa: ANN001
+            return iter(self._rows)
+
+        def scalar(self):  # noqa: ANN201
+            return self._scalar_value
+
+    class _CountingDb:
+        def __init__(self) -> None:
+            self.ticket_queries = 0
+            self.problem_row_queries = 0
+
+        def query(self, *columns):  # noqa: ANN001
+            if columns[0] is problems.Problem:
+                self.problem_row_queries += 1
+                return _AggregateQuery(rows=problem_rows)
+            if getattr(columns[0], "class_", None) is problems.Ticket:
+                self.ticket_queries += 1
+                return _AggregateQuery(rows=ticket_rows)
+            if len(columns) == 2:
+                return _AggregateQuery(rows=[(ProblemStatus.investigating, 2), (ProblemStatus.resolved, 3)])
+            return _AggregateQuery(scalar_value=3)
+
+    db = _CountingDb()
+    summary = problems.problem_analytics_summary(db)
+
+    assert db.ticket_queries == 1
+    assert db.problem_row_queries == 1
+    assert summary["total"] == 5
+    assert summary["investigating"] == 2
+    assert summary["resolved"] == 3
+    assert summary["active_total"] == 3
+    by_id = {item["id"]: item for item in summary["top"]}
+    assert by_id["PB-0001"]["ticket_ids"] == ["TW-1", "TW-2"]
+    assert by_id["PB-0001"]["highest_priority"] == "critical"
+    assert by_id["PB-0002"]["ticket_ids"] == ["TW-3"]
+
+
+def test_cached_classify_reuses_result_for_identical_input(monkeypatch) -> None:
+    from app.models.enums import TicketPriority
+
+    calls: list[tuple[str, str]] = []
+
+    def fake_classify(title: str, description: str):  # noqa: ANN202
+        calls.append((title, description))
+        return TicketPriority.high, None, TicketCategory.network, ["Restart the VPN gateway"]
+
+    monkeypatch.setattr(problems, "classify_ticket", fake_classify)
+    problems._CLASSIFY_CACHE.clear()
+
+    first = problems._cached_classify("VPN drops", "Users disconnected")
+    first[3].append("mutated by caller")
+    second = problems._cached_classify("VPN drops", "Users disconnected")
+
+    assert calls == [("VPN drops", "Users disconnected")]
+    assert second[3] == ["Restart the VPN gateway"]
+
+
+def test_link_ticket_defer_skips_recompute_and_commit(monkeypatch) -> None:
+    problem = SimpleNamespace(id="PB-0004")
+    ticket = SimpleNamespace(id="TW-4", problem_id=None)
+    monkeypatch.setattr(
+        problems,
+        "_recompute_problem_counters",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("deferred link must not recompute")),
+    )
+    fake_db = _FakeDb()
+
+    assert problems.link_ticket(fake_db, problem, ticket, defer=True) is True
+    assert ticket.problem_id == "PB-0004"
+    assert fake_db.added == [ticket]
+
+
+def test_recompute_problem_counters_bulk_uses_grouped_rows() -> None:
+    now = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    first = SimpleNamespace(id="PB-0001", occurrences_count=0, active_count=0, last_seen_at=None, updated_at=now)
+    second = SimpleNamespace(id="PB-0002", occurrences_count=9, active_count=9, last_seen_at=None, updated_at=now)
+    grouped = [
+        ("PB-0001", TicketStatus.open, 2, now - dt.timedelta(hours=1)),
+        ("PB-0001", TicketStatus.resolved, 3, now),
+        ("PB-0002", TicketStatus.closed, 1, now - dt.timedelta(days=1)),
+    ]
+
+    class _GroupedQuery(_Query):
+        def group_by(self, *args, **kwargs):  # noqa: ANN001
+            return self
+
+    class _GroupedDb(_FakeDb):
+        def query(self, *columns):  # noqa: ANN001
+            if columns[0] is problems.Problem:
+                return _Query(rows=[first, second])
+            return _GroupedQuery(rows=grouped)
+
+    problems._recompute_problem_counters_bulk(_GroupedDb(), ["PB-0001", "PB-0002"])
+
+    assert (first.occurrences_count, first.active_count, first.last_seen_at) == (5, 2, now)
+    assert (second.occurrences_count, second.active_count) == (1, 0)
+
+
+def test_ai_suggestions_skip_classifier_for_fully_documented_problem(monkeypatch) -> None:
+    now = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    problem = SimpleNamespace(
+        id="PB-0007",
+        title="VPN gateway drops sessions",
+        category=TicketCategory.network,
+        root_cause="Gateway firmware leaks session slots.",
+        workaround="Restart the gateway nightly.",
+        permanent_fix="Upgrade gateway firmware to 4.2.",
+        tickets=[],
+    )
+    linked = [SimpleNamespace(id="TW-1", assignee="Nadia", updated_at=now, status=TicketStatus.resolved, resolution="Rebooted")]
+    monkeypatch.setattr(
+        problems,
+        "_cached_classify",
+        lambda *_args: (_ for _ in ()).throw(AssertionError("classifier must not run")),
+    )
+
+    payload = problems.build_problem_ai_suggestions(None, problem, tickets=linked, limit=3)
+
+    assert payload["assignee"] == "Nadia"
+    assert len(payload["suggestions"]) == 3
+    assert payload["root_cause_suggestion"] == "Gateway firmware leaks session slots."
+    assert payload["permanent_fix_confidence"] == problems._field_confidence("existing")
@@ -49,10 +49,42 @@ def test_tickets_insights_route_returns_expected_sections(monkeypatch) -> None:
     assert "operational" in payload
 
 
+def test_tickets_stats_route_uses_sql_aggregates(monkeypatch) -> None:
+    monkeypatch.setattr(tickets_router._cache, "get", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(tickets_router._cache, "set", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(
+        tickets_router,
+        "list_tickets_for_user",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("stats must not load ticket rows")),
+    )
+    monkeypatch.setattr(
+        tickets_router,
+        "compute_stats_sql",
+        lambda db, user: {
+            "total": 3,
+            "open": 1,
+            "in_progress": 0,
+            "pending": 0,
+            "resolved": 1,
+            "closed": 1,
+            "critical": 1,
+            "high": 0,
+            "resolution_rate": 67,
+            "avg_resolution_days": 1.5,
+        },
+    )
+
+    client = TestClient(_make_app(), raise_server_exceptions=False)
+    response = client.get("/api/tickets/stats")
+
+    assert response.status_code == 200
+    assert response.json()["resolution_rate"] == 67
+
+
 def test_tickets_performance_route_returns_metrics(monkeypatch) -> None:
     monkeypatch.setattr(tickets_router._cache, "get", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(tickets_router._cache, "set", lambda *_args, **_kwargs: True)
-    monkeypatch.setattr(tickets_router, "list_tickets_for_user", lambda *_args, **_kwargs: ["ticket"])
+    monkeypatch.setattr(tickets_router, "list_ticket_analytics_rows_for_user", lambda *_args, **_kwargs: ["ticket"])
     monkeypatch.setattr(
         tickets_router,
         "compute_assignment_performance",
@@ -117,7 +149,7 @@ def test_tickets_agent_performance_route_returns_agents(monkeypatch) -> None:
         status=SimpleNamespace(value="resolved"),
         sla_resolution_breached=False,
     )
-    monkeypatch.setattr(tickets_router, "list_tickets_for_user", lambda *_args, **_kwargs: [sample_ticket])
+    monkeypatch.setattr(tickets_router, "list_ticket_analytics_rows_for_user", lambda *_args, **_kwargs: [sample_ticket])
 
     client = TestClient(_make_app(), raise_server_exceptions=False)
     response = client.get("/api/tickets/agent-performance")
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+from app.models.enums import SeniorityLevel, TicketCategory, TicketPriority
+from app.services import tickets as tickets_service
+
+
+def _agent(name: str, *, specs: list[str] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        specializations=specs or [],
+        is_available=True,
+        max_concurrent_tickets=5,
+        seniority_level=SeniorityLevel.middle,
+    )
+
+
+def test_round_robin_picks_successor_of_latest_assignee() -> None:
+    now = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    agents = [_agent("Amina"), _agent("Bilal"), _agent("Chloe")]
+
+    chosen = tickets_service._round_robin(
+        agents,
+        {"Amina": now - dt.timedelta(hours=2), "Bilal": now, "Ghost": now + dt.timedelta(hours=1)},
+    )
+
+    assert chosen.name == "Chloe"
+    assert tickets_service._round_robin(agents, {}).name == "Amina"
+
+
+def test_select_best_assignee_loads_candidates_once(monkeypatch) -> None:
+    calls: list[bool] = []
+    agents = [_agent("Amina", specs=["vpn"]), _agent("Bilal", specs=["vpn"])]
+
+    def fake_candidates(db, category, *, with_last_assigned):  # noqa: ANN001, ANN202
+        calls.append(with_last_assigned)
+        return agents, {"Amina": 3, "Bilal": 1}, {}
+
+    monkeypatch.setattr(tickets_service, "_assignee_candidates", fake_candidates)
+
+    chosen = tickets_service.select_best_assignee(None, category=TicketCategory.network, priority=TicketPriority.high)
+
+    assert chosen == "Bilal"
+    assert calls == [False]
+
+
+def test_next_comment_id_uses_sql_max_suffix() -> None:
+    class _ScalarQuery:
+        def __init__(self, value):  # noqa: ANN001
+            self.value = value
+
+        def scalar(self):  # noqa: ANN201
+            return self.value
+
+    class _Db:
+        def __init__(self, value):  # noqa: ANN001
+            self.value = value
+
+        def query(self, *columns):  # noqa: ANN001, ANN201
+            return _ScalarQuery(self.value)
+
+    assert tickets_service._next_comment_id(_Db(41)) == "c42"
+    assert tickets_service._next_comment_id(_Db(None)) == "c1"
+
+
+def test_assignee_candidates_are_cached_per_session_until_commit(monkeypatch) -> None:
+    from sqlalchemy.orm import Session
+
+    calls: list[TicketCategory] = []
+
+    def fake_candidates(db, category, *, with_last_assigned):  # noqa: ANN001, ANN202
+        calls.append(category)
+        return [_agent("Amina")], {"Amina": 0}, {}
+
+    monkeypatch.setattr(tickets_service, "_assignee_candidates", fake_candidates)
+    session = Session()
+
+    for _ in range(3):
+        assert tickets_service.select_best_assignee(session, category=TicketCategory.network, priority=TicketPriority.high) == "Amina"
+    assert calls == [TicketCategory.network]
+
+    session.commit()
+    tickets_service.select_best_assignee(session, category=TicketCategory.network, priority=TicketPriority.high)
+    assert len(calls) == 2
+
+
+def test_specialization_filter_is_stable_across_repeated_inputs() -> None:
+    agents = [_agent("Amina", specs=[" VPN ", "wifi"]), _agent("Bilal", specs=["printers"])]
+
+    first = tickets_service._normalize_specializations([" VPN ", "wifi"])
+    assert first == frozenset({"vpn", "wifi"})
+    assert tickets_service._normalize_specializations([" VPN ", "wifi"]) == first
+    assert tickets_service._normalize_specializations(None) == frozenset()
+
+    for _ in range(3):
+        matched = tickets_service._filter_candidates_by_specs(agents, {"vpn"})
+        assert [agent.name for agent in matched] == ["Amina"]
+
+    # Editing an agent's list is picked up on the next call.
+    agents[1].specializations = ["printers", "vpn"]
+    matched = tickets_service._filter_candidates_by_specs(agents, {"vpn"})
+    assert [agent.name for agent in matched] == ["Amina", "Bilal"]
@@ -3,8 +3,18 @@ from __future__ import annotations
 import datetime as dt
 from types import SimpleNamespace
 
-from app.models.enums import TicketCategory, TicketPriority, TicketStatus
-from app.services.tickets import compute_assignment_performance, compute_problem_insights, compute_stats
+from sqlalchemy.dialects import postgresql
+
+from app.models.enums import TicketCategory, TicketPriority, TicketStatus, UserRole
+from app.services.tickets import (
+    compute_assignment_performance,
+    compute_category_breakdown,
+    compute_priority_breakdown,
+    compute_problem_insights,
+    compute_stats,
+    compute_weekly_trends,
+)
+from app.services.tickets import _scope_ticket_query, _to_utc
 
 
 def _ticket(  # noqa: PLR0913
@@ -101,3 +111,130 @@ def test_problem_insights_prefers_persisted_problem_link() -> None:
     assert insights
     assert insights[0]["problem_id"] == "PB-0002"
     assert insights[0]["occurrences"] == 2
+
+
+def test_breakdowns_count_every_label_in_fixed_order() -> None:
+    now = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    tickets = [
+        _ticket(ticket_id=f"JSM-{idx}", status=TicketStatus.open, created_at=now, updated_at=now)
+        for idx in range(3)
+    ]
+    tickets[0].category = TicketCategory.security
+    tickets[1].priority = TicketPriority.critical
+
+    categories = compute_category_breakdown(tickets)
+    priorities = compute_priority_breakdown(tickets)
+
+    assert categories[0] == {"category": "Infrastructure", "count": 0}
+    assert {row["category"]: row["count"] for row in categories}["Reseau"] == 2
+    assert {row["category"]: row["count"] for row in categories}["Securite"] == 1
+    assert [row["count"] for row in priorities] == [1, 0, 2, 0]
+
+
+def test_weekly_trends_bucket_each_timestamp_once() -> None:
+    now = dt.datetime.now(dt.timezone.utc)
+    yesterday = now - dt.timedelta(days=1)
+    tickets = [
+        _ticket(ticket_id="JSM-1", status=TicketStatus.open, created_at=yesterday, updated_at=now),
+        _ticket(
+            ticket_id="JSM-2",
+            status=TicketStatus.resolved,
+            created_at=now - dt.timedelta(days=20),
+            updated_at=now,
+            resolved_at=now - dt.timedelta(days=1),
+        ),
+        _ticket(
+            ticket_id="JSM-3",
+            status=TicketStatus.pending,
+            created_at=yesterday,
+            updated_at=now - dt.timedelta(days=8),
+        ),
+        _ticket(ticket_id="JSM-4", status=TicketStatus.open, created_at=now - dt.timedelta(days=60), updated_at=now),
+    ]
+
+    weekly = compute_weekly_trends(tickets, weeks=6)
+
+    assert [row["week"] for row in weekly] == [f"Sem {idx}" for idx in range(1, 7)]
+    assert sum(row["opened"] for row in weekly) == 3
+    assert weekly[-1]["opened"] == 2
+    assert weekly[-1]["closed"] == 1
+    assert weekly[-2]["pending"] == 1
+
+
+def test_scope_ticket_query_matches_reporter_exactly_not_as_like_pattern() -> None:
+    class _Query:
+        def filter(self, clause):  # noqa: ANN001, ANN201
+            self.clause = clause
+            return self
+
+    customer = SimpleNamespace(id="u-2", role=UserRole.user, email=" Jane_Doe@Example.com ", name="Jane Doe")
+
+    clause = _scope_ticket_query(_Query(), customer).clause
+    sql = str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "LIKE" not in sql.upper()
+    assert "lower(trim(tickets.reporter)) IN ('jane doe', 'jane_doe@example.com')" in sql
+
+
+def test_to_utc_normalizes_naive_zero_offset_and_foreign_zones() -> None:
+    utc_value = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    zero_offset = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone(dt.timedelta(0)))
+    plus_two = dt.datetime(2026, 2, 15, 14, 0, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+    assert _to_utc(utc_value) is utc_value
+    for value in (dt.datetime(2026, 2, 15, 12, 0), zero_offset, plus_two):
+        converted = _to_utc(value)
+        assert converted == utc_value
+        assert converted.tzinfo is dt.timezone.utc
+
+
+def test_problem_insights_cluster_unlinked_tickets_by_shared_tokens() -> None:
+    base = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    texts = {
+        "TW-10": ("VPN tunnel timeout", "Remote users lose VPN tunnel"),
+        "TW-11": ("VPN tunnel timeout again", "VPN tunnel drops for remote users"),
+        "TW-12": ("Printer jam", "Floor printer jammed"),
+    }
+    tickets = []
+    for offset, (ticket_id, (title, description)) in enumerate(texts.items()):
+        ticket = _ticket(
+            ticket_id=ticket_id,
+            status=TicketStatus.open,
+            created_at=base - dt.timedelta(hours=3 - offset),
+            updated_at=base - dt.timedelta(hours=3 - offset),
+        )
+        ticket.title, ticket.description = title, description
+        tickets.append(ticket)
+
+    insights = compute_problem_insights(tickets, min_repetitions=2, limit=6)
+
+    assert len(insights) == 1
+    assert sorted(insights[0]["ticket_ids"]) == ["TW-10", "TW-11"]
+
+
+def test_problem_insights_build_recommendations_only_within_limit(monkeypatch) -> None:
+    from app.services import tickets as tickets_service
+
+    base = dt.datetime(2026, 2, 15, 12, 0, tzinfo=dt.timezone.utc)
+    tickets = [
+        _ticket(
+            ticket_id=f"TW-{index}",
+            status=TicketStatus.open,
+            created_at=base - dt.timedelta(hours=index),
+            updated_at=base - dt.timedelta(hours=index),
+            problem_id=f"PB-{index % 4}",
+        )
+        for index in range(8)
+    ]
+    calls: list[str] = []
+
+    def fake_recommendation(cluster):  # noqa: ANN001, ANN202
+        calls.append(cluster[0].problem_id)
+        return "rec", 70
+
+    monkeypatch.setattr(tickets_service, "_build_problem_ai_recommendation", fake_recommendation)
+
+    insights = compute_problem_insights(tickets, min_repetitions=2, limit=2)
+
+    assert len(insights) == 2
+    assert calls == [item["problem_id"] for item in insights]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+from app.models.enums import TicketCategory, TicketStatus
+from app.services import tickets as tickets_service
+
+
+class _Query:
+    def __init__(self, rows):  # noqa: ANN001
+        self._rows = rows
+
+    def filter(self, *args, **kwargs):  # noqa: ANN001
+        return self
+
+    def all(self):  # noqa: ANN201
+        return list(self._rows)
+
+
+class _FakeDb:
+    def __init__(self, rows):  # noqa: ANN001
+        self._rows = rows
+
+    def query(self, *_args):  # noqa: ANN002
+        return _Query(self._rows)
+
+
+def _ticket(ticket_id: str, *, title: str, days_ago: int, status: TicketStatus = TicketStatus.open) -> SimpleNamespace:
+    created = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days_ago)
+    return SimpleNamespace(
+        id=ticket_id,
+        title=title,
+        description="",
+        category=TicketCategory.network,
+        status=status,
+        resolution=None,
+        created_at=created,
+        updated_at=created,
+        jira_created_at=None,
+        jira_updated_at=None,
+    )
+
+
+def test_should_promote_stops_scanning_once_threshold_is_met(monkeypatch) -> None:
+    title = "Branch office vpn tunnel flapping"
+    current = _ticket("TW-0", title=title, days_ago=30)
+    others = [_ticket(f"TW-{idx}", title=title, days_ago=40 + idx) for idx in range(1, 10)]
+    scanned: list[str] = []
+    original = tickets_service._incident_signature
+
+    def tracking_signature(item):  # noqa: ANN001, ANN202
+        scanned.append(item.id)
+        return original(item)
+
+    monkeypatch.setattr(tickets_service, "_incident_signature", tracking_signature)
+
+    assert tickets_service._should_promote_to_problem(_FakeDb(others), current, "") is True
+    # The current ticket plus the two matches needed for the repeat threshold.
+    assert scanned == ["TW-0", "TW-1", "TW-2"]
+
+
+def test_should_promote_returns_false_without_matches() -> None:
+    current = _ticket("TW-0", title="Printer toner empty", days_ago=1)
+    others = [_ticket("TW-1", title="Mailbox quota exceeded", days_ago=1)]
+
+    assert tickets_service._should_promote_to_problem(_FakeDb(others), current, "Replaced toner") is False
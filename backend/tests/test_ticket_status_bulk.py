@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.models.enums import TicketStatus
+from app.services import tickets as tickets_service
+
+
+class _FakeDb:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    def commit(self) -> None:
+        self.events.append("commit")
+
+
+def test_update_status_bulk_commits_once_before_side_effects(monkeypatch) -> None:
+    events: list[str] = []
+    rows = [SimpleNamespace(id="TW-1"), SimpleNamespace(id="TW-2")]
+
+    def fake_apply(db, ticket, status, **kwargs):  # noqa: ANN001
+        events.append(f"apply:{ticket.id}")
+        return {"ticket_id": ticket.id}
+
+    def fake_finish(db, ticket, context, *, actor):  # noqa: ANN001
+        events.append(f"finish:{context['ticket_id']}")
+
+    monkeypatch.setattr(tickets_service, "_apply_status_update", fake_apply)
+    monkeypatch.setattr(tickets_service, "_finish_status_update", fake_finish)
+
+    count = tickets_service.update_status_bulk(
+        _FakeDb(events),
+        rows,
+        TicketStatus.resolved,
+        actor="Agent",
+        resolution_comment="Fixed upstream",
+    )
+
+    assert count == 2
+    assert events == ["apply:TW-1", "apply:TW-2", "commit", "finish:TW-1", "finish:TW-2"]
+
+
+def test_update_status_bulk_skips_commit_without_tickets() -> None:
+    events: list[str] = []
+
+    assert tickets_service.update_status_bulk(_FakeDb(events), [], TicketStatus.resolved, actor="Agent") == 0
+    assert events == []
+
+
+class _SessionDb:
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
+    def add(self, _obj) -> None:  # noqa: ANN001
+        return None
+
+    def commit(self) -> None:
+        return None
+
+    def refresh(self, _obj) -> None:  # noqa: ANN001
+        return None
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def test_update_status_bulk_keeps_finishing_after_one_ticket_fails(monkeypatch, caplog) -> None:
+    notified: list[str] = []
+    rows = [
+        SimpleNamespace(id=ticket_id, status=TicketStatus.resolved, problem_id=None, jira_key="HP-1")
+        for ticket_id in ("TW-1", "TW-2", "TW-3")
+    ]
+
+    def fake_apply(db, ticket, status, **kwargs):  # noqa: ANN001
+        return {
+            "previous_status": TicketStatus.open,
+            "previous_problem_id": None,
+            "status_changed": True,
+            "comment": "",
+            "comment_id": None,
+        }
+
+    def notify(db, *, ticket, **kwargs):  # noqa: ANN001, ANN003
+        if ticket.id == "TW-2":
+            raise RuntimeError("mail relay down")
+        notified.append(ticket.id)
+
+    monkeypatch.setattr(tickets_service, "_apply_status_update", fake_apply)
+    monkeypatch.setattr(tickets_service, "notify_ticket_status_change", notify)
+    monkeypatch.setattr(tickets_service, "sync_jira_issue_for_ticket", lambda _ticket: False)
+    monkeypatch.setattr(tickets_service, "_align_ticket_status_with_jira", lambda _db, _ticket: None)
+    db = _SessionDb()
+
+    count = tickets_service.update_status_bulk(db, rows, TicketStatus.resolved, actor="Agent")
+
+    assert count == 3
+    assert notified == ["TW-1", "TW-3"]
+    assert db.rollbacks == 1
+    assert "TW-2" in caplog.text
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models.enums import SeniorityLevel
+from app.services import users as users_service
+
+
+def test_update_seniority_commits_without_refresh() -> None:
+    db = MagicMock()
+    user = SimpleNamespace(email="agent@example.com", seniority_level=SeniorityLevel.junior)
+    db.get.return_value = user
+
+    result = users_service.update_seniority(db, uuid4(), SeniorityLevel.senior)
+
+    assert result is user
+    assert user.seniority_level == SeniorityLevel.senior
+    db.commit.assert_called_once()
+    db.refresh.assert_not_called()
+
+
+def test_update_specializations_skips_unknown_ids() -> None:
+    db = MagicMock()
+    db.get.return_value = None
+
+    assert users_service.update_specializations(db, uuid4(), ["network"]) is None
+    db.commit.assert_not_called()
+
+
+def test_users_router_rejects_malformed_ids_before_the_service(monkeypatch) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.core.deps import require_admin
+    from app.db.session import get_db
+    from app.routers import users as users_router
+
+    calls: list[object] = []
+    monkeypatch.setattr(users_router, "delete_user", lambda db, user_id: calls.append(user_id) or True)
+    app = FastAPI()
+    app.include_router(users_router.router, prefix="/api/users")
+    app.dependency_overrides[require_admin] = lambda: SimpleNamespace(id="admin-1")
+    app.dependency_overrides[get_db] = lambda: MagicMock()
+    client = TestClient(app, raise_server_exceptions=False)
+
+    user_id = uuid4()
+    assert client.delete("/api/users/not-a-uuid").status_code == 422
+    assert client.delete(f"/api/users/{user_id}").status_code == 204
+    assert calls == [user_id]